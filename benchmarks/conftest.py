@@ -0,0 +1,54 @@
+"""Shared fixtures for the benchmark suite
+
+Needs ``pytest`` and ``pytest-benchmark``. Record a baseline, then compare each
+later run against the last saved one and fail on regressions::
+
+    python -m pytest benchmarks --benchmark-autosave
+    python -m pytest benchmarks --benchmark-autosave --benchmark-compare --benchmark-compare-fail=mean:20%
+
+Runs are saved as JSON under ``.benchmarks/``. Stress cases are marked ``stress``;
+deselect them with ``-m "not stress"`` for a quick pass.
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    # Without the plugin only the plain cold-start checks can run
+    collect_ignore = ["test_model.py", "test_pages.py"]
+
+# Page benchmarks save scenarios and results; keep them out of the real database and result store
+_SCRATCH = tempfile.mkdtemp(prefix="brewery-bench-")
+os.environ.setdefault("BREWERY_DB", os.path.join(_SCRATCH, "scenarios.db"))
+os.environ.setdefault("BREWERY_RESULTS", os.path.join(_SCRATCH, "results"))
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "stress: large horizons and scenario grids")
+
+
+@pytest.fixture
+def app():
+    """Logged-in AppTest of main.py with a ``show(page)`` helper that navigates and renders"""
+    from streamlit.testing.v1 import AppTest
+
+    test = AppTest.from_file(str(ROOT / "main.py"), default_timeout=120)
+    test.session_state["authenticated"] = True
+    test.session_state["username"] = "partner1"
+    test.run()
+
+    def show(page):
+        [box for box in test.selectbox if box.label == "Navigate"][0].set_value(page).run()
+        assert not test.exception, [e.message for e in test.exception]
+        return test
+
+    test.show = show
+    return test
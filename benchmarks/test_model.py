@@ -0,0 +1,362 @@
+"""Benchmarks for the projection model at realistic and stress sizes"""
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from brewery import charts
+from brewery.actuals import OTHER, ActualsStore, classify, import_actuals
+from brewery.api import SECTIONS
+from brewery.assumptions import (Assumptions, Brewhouse, Calendar, CostModel, Event, Partnership, ProductMix,
+                                 Scenario)
+from brewery.batch import run_batch
+from brewery.capacity import configuration_grid, monthly_demand, simulate_schedule
+from brewery.compare import compare_scenarios
+from brewery.costs import FEDERAL_EXCISE_BRACKETS, federal_excise, variable_costs, volume_index
+from brewery.debt import LOAN_PRESETS, amortization, debt_service
+from brewery.model import ModelGraph
+from brewery.montecarlo import RiskModel, Triangular, simulate
+from brewery.optimizer import MixLimits, horizon_factors, optimize_mix
+from brewery.projection import (SEASONAL_PROFILES, breakeven_revenue, cashflow_arrays,
+                                fixed_expense_breakdown, partner_returns, project_cashflow,
+                                revenue_forecast, seasonal_multipliers)
+from brewery.reforecast import RollingFit, observed_cost_pct, observed_revenue, reforecast
+from brewery.results import ResultStore
+from brewery.returns import annual_irr, distribution_schedule, equity_flows, irr, partner_distributions, waterfall_tiers
+from brewery.sweep import METRICS, SweepAxis, SweepSpec, create_sweep, open_sweep, run_sweep
+
+# Horizons: the pages' default and a 20-year stress case
+HORIZONS = [pytest.param(36, id="36mo"), pytest.param(240, id="240mo", marks=pytest.mark.stress)]
+
+
+# ==================== SINGLE SCENARIO ====================
+@pytest.mark.parametrize("months", [pytest.param(12, id="12mo")] + HORIZONS)
+def test_revenue_forecast(benchmark, months):
+    frame = benchmark(revenue_forecast, ProductMix(), 3.0, months)
+    assert len(frame) == months
+
+
+@pytest.mark.parametrize("months", HORIZONS)
+def test_cashflow_projection(benchmark, months):
+    projection = benchmark(project_cashflow, Assumptions(months=months))
+    assert len(projection.cumulative) == months
+
+
+def test_model_graph_edit(benchmark):
+    """A rent edit with capped sales: only the fixed-cost side of the graph recomputes"""
+    scenario = Scenario(brewhouse=Brewhouse(cap_sales=True))
+    graph = ModelGraph(scenario)
+    graph['projection']
+    edits = [replace(scenario, cashflow=replace(scenario.cashflow, monthly_rent=rent)) for rent in (4000, 6000)]
+
+    def edit():
+        for edited in edits:
+            graph.update(edited)['projection']
+    benchmark(edit)
+    assert graph['supply_share'] is graph['assumptions'].supply_share
+
+
+@pytest.mark.parametrize("months", HORIZONS)
+def test_seasonal_multipliers(benchmark, months):
+    """Re-seasoning after a profile or event edit, with a busy event calendar"""
+    events = tuple(Event(f"Event {i}", f"2027-{i % 12 + 1:02d}", 10.0 + i, annual=i % 2 == 0) for i in range(24))
+    calendar = Calendar("2027-01", SEASONAL_PROFILES["Charlotte Taproom"], events)
+    multipliers = benchmark(seasonal_multipliers, calendar, months)
+    assert multipliers.shape == (months,)
+
+
+def test_expense_waterfall(benchmark):
+    assumptions = Assumptions()
+
+    def waterfall():
+        breakdown = fixed_expense_breakdown(assumptions)
+        fixed = breakdown['Monthly Cost'].sum()
+        revenue = breakeven_revenue(fixed, assumptions.variable_cost_pct) * 1.2
+        return charts.pnl_waterfall(revenue, revenue * assumptions.variable_cost_pct / 100, fixed)
+
+    benchmark(waterfall)
+
+
+@pytest.mark.parametrize("months", HORIZONS)
+def test_partner_returns(benchmark, months):
+    assumptions = Assumptions(months=months)
+    projection = project_cashflow(assumptions)
+    frame = benchmark(partner_returns, projection, Partnership(waterfall=True), assumptions.initial_capital)
+    assert len(frame) == 3
+
+
+@pytest.mark.parametrize("scenarios", [pytest.param(10_000, id="10k"),
+                                       pytest.param(100_000, id="100k", marks=pytest.mark.stress)])
+def test_distribution_waterfall(benchmark, scenarios):
+    """High-water distributions split through the waterfall tiers for every scenario in one pass"""
+    rng = np.random.default_rng(0)
+    cash_flow = rng.normal(5000, 20000, (scenarios, 36))
+    partnership = Partnership(waterfall=True)
+
+    def distribute():
+        return partner_distributions(distribution_schedule(cash_flow, 70), 338000.0, partnership)
+    by_partner, tiers = benchmark(distribute)
+    distributions = distribution_schedule(cash_flow, 70)
+    assert (distributions >= 0).all()
+    np.testing.assert_allclose(by_partner.sum(axis=-2), distributions, atol=1e-6)
+    np.testing.assert_allclose(tiers.sum(axis=(0, -2)), distributions, atol=1e-6)
+
+    # Only cash above the previous high is paid out, so losses are made up first
+    np.testing.assert_allclose(distribution_schedule([100.0, -50.0, 30.0, 40.0, -10.0], 50), [50, 0, 0, 10, 0])
+
+    # 100 in at a 1%-a-month hurdle, then 200 paid in month 12: capital, 12 months of preferred return,
+    # a full catch-up until the manager holds 20% of the profit, and the rest carried
+    hurdle = 100 * 1.01 ** 12
+    paid = np.zeros(12)
+    paid[-1] = 200.0
+    capital, preferred, catch_up, carried = waterfall_tiers(paid, 100.0, (1.01 ** 12 - 1) * 100, 100.0, 20.0)
+    caught_up = 0.2 * (hurdle - 100) / 0.8
+    np.testing.assert_allclose([capital[-1], preferred[-1], catch_up[-1], carried[-1]],
+                               [100.0, hurdle - 100, caught_up, 200 - hurdle - caught_up])
+    np.testing.assert_allclose(catch_up[-1] / (preferred[-1] + catch_up[-1]), 0.2)
+
+
+def test_long_horizon_chart(benchmark):
+    """Building the cashflow figure for a 20-year monthly projection"""
+    projection = project_cashflow(Assumptions(months=240))
+    fig = benchmark(charts.cumulative_cashflow_chart, projection.to_frame(), projection.breakeven_month)
+    assert len(fig.data[0].x) <= charts.MAX_LINE_POINTS
+
+
+# ==================== BREW SCHEDULE ====================
+@pytest.mark.parametrize("months", HORIZONS)
+def test_brew_schedule(benchmark, months):
+    assumptions = Assumptions(months=months)
+    demand = monthly_demand(ProductMix(), assumptions)
+    result = benchmark(simulate_schedule, Brewhouse(), demand, assumptions.calendar.start_month)
+    assert len(result.sold) == months
+    # The cellar is asked for the barrels behind the cashflow's revenue, the volumes costs are charged on
+    np.testing.assert_allclose(demand, ProductMix().total_bbls * volume_index(ProductMix(), assumptions))
+
+
+def test_tank_configurations(benchmark):
+    """A year of daily schedules for 90 fermenter x brite-tank layouts"""
+    assumptions = Assumptions(months=12)
+    demand = monthly_demand(ProductMix(), assumptions)
+    lost_pct, _ = benchmark.pedantic(configuration_grid, args=(Brewhouse(), demand, "2027-01", range(2, 17),
+                                                               range(1, 7)), rounds=3, iterations=1)
+    assert lost_pct.shape == (6, 15)
+
+
+def test_mix_optimizer(benchmark):
+    """One LP solve, the work done each time an optimizer input moves"""
+    value_factor, peak_factor = horizon_factors(Assumptions(), 10.0)
+    solution = benchmark(optimize_mix, ProductMix(), MixLimits(), value_factor, peak_factor)
+    assert solution.optimal
+
+
+# ==================== BATCHED ====================
+@pytest.mark.stress
+@pytest.mark.parametrize("months", [36, 120])
+@pytest.mark.parametrize("scenarios", [10_000, 100_000])
+def test_cashflow_batch(benchmark, scenarios, months):
+    rng = np.random.default_rng(0)
+    start = rng.uniform(20000, 50000, scenarios)
+    growth = rng.uniform(0, 8, scenarios)
+    _, _, _, cumulative = benchmark(cashflow_arrays, start, growth, 29000.0, 400000.0, 25.0, months)
+    assert cumulative.shape == (scenarios, months)
+
+
+@pytest.mark.parametrize("months", HORIZONS)
+def test_debt_service(benchmark, months):
+    """Every preset tranche for 1,000 financing plans amortized in one pass"""
+    plans = [tuple(LOAN_PRESETS.values())[:i % 4 + 1] for i in range(1000)]
+    interest, repaid = benchmark(debt_service, plans, months)
+    assert interest.shape == (1000, months)
+
+    # A lone SBA 7(a) loan pays the textbook level payment every month
+    loan = LOAN_PRESETS["SBA 7(a)"]
+    rate = loan.annual_rate_pct / 1200
+    payment = loan.principal * rate / (1 - (1 + rate) ** -loan.term_months)
+    np.testing.assert_allclose((interest[0] + repaid[0])[:loan.term_months], payment)
+    np.testing.assert_allclose((interest[0] + repaid[0])[loan.term_months:], 0.0)
+
+    # Interest-only months, then level payments that leave the balloon, repaid with the last one
+    note = LOAN_PRESETS["Friends & Family Note"]
+    rate, balloon = note.annual_rate_pct / 1200, note.principal * note.balloon_pct / 100
+    paying = note.term_months - note.interest_only_months
+    note_interest, note_repaid, balance = amortization(note.principal, note.annual_rate_pct, note.term_months,
+                                                       note.interest_only_months, note.balloon_pct, 72)
+    np.testing.assert_allclose(note_interest[:12], note.principal * rate)
+    np.testing.assert_allclose(note_repaid[:12], 0.0)
+    level = (note.principal - balloon / (1 + rate) ** paying) * rate / (1 - (1 + rate) ** -paying)
+    np.testing.assert_allclose((note_interest + note_repaid)[12:59], level)
+    np.testing.assert_allclose(note_interest[59] + note_repaid[59], level + balloon)
+    np.testing.assert_allclose(note_repaid.sum(), note.principal)
+    np.testing.assert_allclose(balance[59:], 0.0)
+
+
+@pytest.mark.parametrize("scenarios", [pytest.param(10_000, id="10k"),
+                                       pytest.param(100_000, id="100k", marks=pytest.mark.stress)])
+def test_equity_irr(benchmark, scenarios):
+    """Partner equity IRR solved for every scenario in one vectorized pass"""
+    rng = np.random.default_rng(0)
+    revenue, _, profit, _ = cashflow_arrays(rng.uniform(20000, 50000, scenarios), rng.uniform(0, 8, scenarios),
+                                            29000.0, 338000.0, 25.0, 36)
+    flows = equity_flows(profit, 70, 338000.0, revenue[:, -12:].sum(axis=-1) * 2)
+    annual = benchmark(annual_irr, flows)
+    assert annual.shape == (scenarios,)
+
+    # A 1%-a-month annuity, 10% over a year, a loss, and a row that never pays back, solved together
+    payment = 1000 * 0.01 / (1 - 1.01 ** -36)
+    known = np.array([[-1000.0] + [payment] * 36,
+                      [-100.0] + [0.0] * 11 + [110.0] + [0.0] * 24,
+                      [-100.0] + [0.0] * 35 + [50.0],
+                      [-100.0] + [0.0] * 36])
+    rates = irr(known)
+    np.testing.assert_allclose(rates[:3], [0.01, 1.1 ** (1 / 12) - 1, 0.5 ** (1 / 36) - 1], rtol=1e-9)
+    assert np.isnan(rates[3])
+    np.testing.assert_allclose(annual_irr(known[1]), 10.0)
+
+
+@pytest.mark.parametrize("scenarios", [pytest.param(10_000, id="10k"),
+                                       pytest.param(100_000, id="100k", marks=pytest.mark.stress)])
+def test_variable_costs(benchmark, scenarios):
+    """Tiered excise, tax and fees for every scenario's volume path in one pass"""
+    rng = np.random.default_rng(0)
+    index = np.cumprod(1 + rng.uniform(0, 0.08, (scenarios, 36)), axis=-1) * rng.uniform(1, 800, (scenarios, 1))
+    costs = benchmark(variable_costs, ProductMix(), CostModel(), index, "2027-07")
+    assert costs.shape == (8, scenarios, 36)
+
+    # Each bracket's rate applies exactly up to its limit, and the brackets reset every January
+    (first, low), (second, mid), (_, high) = FEDERAL_EXCISE_BRACKETS
+    np.testing.assert_allclose(federal_excise(np.array([first, 1.0, second - first - 2, 1.0, 1.0]), "2027-01"),
+                               [first * low, mid, (second - first - 2) * mid, mid, high])
+    np.testing.assert_allclose(federal_excise(np.array([first, first]), "2027-12"), [first * low, first * low])
+    np.testing.assert_allclose(federal_excise(np.array([first / 2, first]), "2027-01"),
+                               [first / 2 * low, first / 2 * low + first / 2 * mid])
+
+
+@pytest.mark.stress
+def test_sweep_grid(benchmark):
+    spec = SweepSpec(Assumptions(), ProductMix(), 70, (
+        SweepAxis.linspace('pint_price', 5, 10, 100),
+        SweepAxis.linspace('monthly_rent', 3000, 9000, 100),
+        SweepAxis.linspace('monthly_revenue_growth', 0, 8, 100),
+    ))
+    result = benchmark.pedantic(run_sweep, args=(spec,), kwargs={'jobs': 1}, rounds=3, iterations=1)
+    assert result.completed == spec.size
+
+
+@pytest.mark.parametrize("steps", [pytest.param(40, id="64k"), pytest.param(100, id="1M", marks=pytest.mark.stress)])
+def test_stored_sweep_heatmap(benchmark, tmp_path, steps):
+    """Reopen a stored sweep memory-mapped and pivot one metric for the heatmap, as a rerun does"""
+    spec = SweepSpec(Assumptions(), ProductMix(), 70, (
+        SweepAxis.linspace('pint_price', 5, 10, steps),
+        SweepAxis.linspace('monthly_rent', 3000, 9000, steps),
+        SweepAxis.linspace('monthly_revenue_growth', 0, 8, steps),
+    ))
+    store = ResultStore(tmp_path)
+    run, result = create_sweep(store, spec)
+    rng = np.random.default_rng(0)
+    result.add(0, spec.size, {name: rng.normal(size=spec.size) for name in METRICS})
+    run.commit()
+
+    def heatmap():
+        return open_sweep(store, spec).pivot('total_profit', 'pint_price', 'monthly_rent')
+    assert benchmark(heatmap).shape == (steps, steps)
+
+
+@pytest.mark.parametrize("paths", [pytest.param(10_000, id="10k"),
+                                   pytest.param(100_000, id="100k", marks=pytest.mark.stress)])
+def test_monte_carlo(benchmark, paths):
+    risk = RiskModel(Triangular(2, 4, 6), Triangular(22, 25, 30), Triangular(4500, 5000, 5500),
+                     Triangular(13500, 15000, 16500))
+    loans = tuple(LOAN_PRESETS.values())[:2]
+    result = benchmark(simulate, Assumptions(loans=loans), risk, paths, 0)
+    assert len(result.breakeven_months) == paths
+
+
+@pytest.mark.parametrize("count", [pytest.param(5, id="5"), pytest.param(500, id="500", marks=pytest.mark.stress)])
+def test_scenario_comparison(benchmark, count):
+    base = Scenario()
+    named = {f"Plan {i}": replace(base, cashflow=replace(base.cashflow, monthly_rent=3000 + 10 * i))
+             for i in range(count)}
+    comparison = benchmark(compare_scenarios, named)
+    assert comparison.cumulative.shape == (count, 36)
+
+
+# ==================== ACTUALS ====================
+@pytest.mark.parametrize("rows", [pytest.param(200_000, id="200k"),
+                                  pytest.param(2_000_000, id="2M", marks=pytest.mark.stress)])
+def test_actuals_import(benchmark, tmp_path, rows):
+    """Streaming a POS export into monthly totals, fresh store each round"""
+    rng = np.random.default_rng(0)
+    items = np.array(["Pint - IPA", "Flight", "Growler Fill", "1/2 Keg", "Case 24pk", "T-Shirt", "Tour", "Pretzel"])
+    export = tmp_path / "pos.csv"
+    pd.DataFrame({
+        'Date': pd.Timestamp("2027-01-01") + pd.to_timedelta(np.sort(rng.uniform(0, 3.2e7, rows)), unit='s'),
+        'Item': items[rng.integers(0, len(items), rows)],
+        'Qty': 1,
+        'Net Sales': rng.uniform(5, 200, rows).round(2),
+    }).to_csv(export, index=False)
+    stores = iter(range(100))
+
+    def setup():
+        return (ActualsStore(str(tmp_path / f"actuals{next(stores)}.db")), str(export)), {}
+    summary = benchmark.pedantic(import_actuals, setup=setup, rounds=3, iterations=1)
+    assert summary.rows_imported == rows
+    # Whole words only: a sale is not an ale
+    assert list(classify(["Gift Card Sale", "Merch sale", "Pale Ale", "Hazy Pale", "Wholesale"])) == [
+        OTHER, 'Merch', 'Pints', 'Pints', OTHER]
+
+
+@pytest.mark.parametrize("months", HORIZONS)
+def test_reforecast_backtest(benchmark, months):
+    """Rolling refit of every month of actuals, then a backtest at every cut-off in one batched solve"""
+    assumptions = Assumptions(months=months, calendar=Calendar(start_month="2027-01"))
+    plan = project_cashflow(assumptions).revenue
+    actual = plan * np.random.default_rng(0).lognormal(0, 0.05, months)
+
+    def refit():
+        fit = RollingFit(assumptions)
+        for month in range(1, months):
+            fit.update(dict(enumerate(actual[:month])), assumptions)
+        return fit.backtest(plan)
+    backtest = benchmark(refit)
+    assert not backtest.empty
+
+    # Kegs sold in January but not February count as none sold, not an unknown, in February's costs
+    actuals = pd.DataFrame({'Month': ['2027-01', '2027-01', '2027-02'], 'Channel': ['Pints', 'Kegs', 'Pints'],
+                            'Quantity': [2000.0, 10.0, 2100.0], 'Revenue': [14000.0, 3000.0, 14700.0]})
+    cost_pct = observed_cost_pct(actuals, ProductMix(), CostModel(), assumptions)
+    fit = RollingFit(assumptions).update(observed_revenue(actuals, assumptions), assumptions)
+    fitted, revenue = reforecast(fit, assumptions, cost_pct)
+    assert np.isfinite(cost_pct)
+    assert np.isfinite(project_cashflow(fitted, revenue).cumulative).all()
+
+    # A closed month (0 seasonal index) stays out of the fit; its actuals are kept as they are
+    closed = replace(assumptions, calendar=Calendar("2027-01", (1.0, 0.0) + (1.0,) * 10))
+    fit = RollingFit(closed).update({0: 30000.0, 1: 500.0, 2: 32000.0, 3: 33000.0}, closed)
+    fitted, revenue = reforecast(fit, closed)
+    assert np.isfinite(fit.coefficients()).all() and np.isfinite(revenue).all()
+    assert revenue[1] == 500.0 and revenue[13] == 0.0 and revenue[4] > 0
+
+
+def test_api_sections(benchmark):
+    """Every single-scenario API section for one uncached request body"""
+    def respond():
+        scenario = Scenario.from_dict({'cashflow': {'monthly_revenue_growth': 4.0}})
+        graph = ModelGraph(scenario)
+        return {name: compute(scenario, graph) for name, compute in SECTIONS.items()}
+    results = benchmark(respond)
+    assert results['breakeven']['breakeven_month'] == results['cashflow']['breakeven_month']
+
+
+@pytest.mark.parametrize("count", [pytest.param(50, id="50"), pytest.param(2_000, id="2000", marks=pytest.mark.stress)])
+def test_batch_run(benchmark, tmp_path, count):
+    """Headless batch of scenario edits in one process, then a rerun that finds every result already written"""
+    scenarios = [(f"Growth {i}", "bench", Scenario(cashflow=Assumptions(monthly_revenue_growth=i * 8 / count)))
+                 for i in range(count)]
+    summary = benchmark.pedantic(run_batch, args=(scenarios, tmp_path), kwargs={'jobs': 1, 'force': True,
+                                 'log': lambda message: None}, rounds=3, iterations=1)
+    assert summary['Total Revenue'].notna().all()
+    skipped = []
+    run_batch(scenarios, tmp_path, jobs=1, log=skipped.append)
+    assert f"{count} already have results" in skipped[0]
@@ -0,0 +1,25 @@
+"""Benchmarks for full main.py reruns through Streamlit's AppTest harness
+
+Reruns are timed after a warm-up, since that is what a partner pays every time
+they touch a widget; page switches time navigation between pages.
+"""
+import pytest
+
+from brewery.pages import PAGES
+
+
+@pytest.mark.parametrize("page", list(PAGES))
+def test_page_rerun(benchmark, app, page):
+    app.show(page)
+    benchmark.pedantic(app.run, rounds=5, iterations=1, warmup_rounds=1)
+    assert not app.exception
+
+
+@pytest.mark.parametrize("page", [page for page in PAGES if page != "Market Overview"])
+def test_page_switch(benchmark, app, page):
+    """Navigating to a page from the Market Overview"""
+    def setup():
+        app.show("Market Overview")
+        return (page,), {}
+
+    benchmark.pedantic(app.show, setup=setup, rounds=5, iterations=1)
@@ -0,0 +1,61 @@
+"""Cold-start benchmark for the login screen
+
+Each measurement runs in a fresh interpreter so module imports are really cold.
+The login screen must render without pulling in the model or the heavy
+libraries that only the analyzer pages need, and within a time budget
+(``BREWERY_STARTUP_BUDGET`` seconds, default 1.0).
+
+Run ``python benchmarks/test_startup.py`` to print timings, or collect it with
+pytest to fail on regressions.
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules only the analyzer pages may import
+DEFERRED_MODULES = ("pandas", "numpy", "reportlab", "xlsxwriter", "scipy", "brewery.projection", "brewery.cache")
+
+STARTUP_BUDGET = float(os.environ.get("BREWERY_STARTUP_BUDGET", "1.0"))
+
+_PROBE = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file({main!r}, default_timeout=60)
+start = time.perf_counter()
+app.run()
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "modules": [m for m in {deferred!r} if m in sys.modules],
+                   "errors": [e.message for e in app.exception]}}))
+"""
+
+
+def cold_start():
+    """Render the login screen in a fresh interpreter; returns its timing and loaded modules"""
+    probe = _PROBE.format(main=str(ROOT / "main.py"), deferred=DEFERRED_MODULES)
+    output = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, capture_output=True,
+                            text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_login_defers_heavy_imports():
+    result = cold_start()
+    assert not result["errors"]
+    assert result["modules"] == []
+
+
+def test_login_render_time():
+    median = statistics.median(cold_start()["seconds"] for _ in range(3))
+    assert median < STARTUP_BUDGET, f"login screen took {median:.2f}s (budget {STARTUP_BUDGET:.2f}s)"
+
+
+if __name__ == "__main__":
+    runs = [cold_start() for _ in range(5)]
+    seconds = [run["seconds"] for run in runs]
+    print(f"login render: median {statistics.median(seconds):.3f}s, "
+          f"min {min(seconds):.3f}s, max {max(seconds):.3f}s")
+    print(f"deferred modules loaded: {runs[0]['modules'] or 'none'}")
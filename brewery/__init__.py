@@ -0,0 +1 @@
+"""Financial model for the Charlotte-Concord micro brewery analyzer"""
@@ -0,0 +1,351 @@
+"""Streaming import of POS sales exports and plan-vs-actual variance
+
+CSV and Parquet exports are read in fixed-size chunks. Each chunk is reduced
+to (month, channel) totals before the next is read, so memory stays bounded
+by the number of months however many transactions a file holds. Only the
+monthly totals are stored, in the same SQLite database as saved scenarios.
+
+Re-imports are incremental. Totals are kept per source file, which is
+remembered by name with a fingerprint of its size, head and tail and the
+latest transaction time taken from it. An unchanged file is skipped without
+parsing. A file that has changed is re-read from the start of the month of
+that time, and its totals from that month on are replaced, so transactions
+added to or corrected in the last imported month are counted exactly once.
+"""
+import hashlib
+import re
+import sqlite3
+import threading
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from brewery.costs import volume_index
+from brewery.projection import calendar_months
+from brewery.store import DEFAULT_PATH
+
+# Rows parsed per chunk
+CHUNK_ROWS = 200_000
+
+# Sales channel: (ProductMix volume, ProductMix price); food volume is already in dollars
+CHANNELS = {
+    'Pints': ('monthly_pints', 'pint_price'),
+    'Flights': ('monthly_flights', 'flight_price'),
+    'Growlers': ('monthly_growlers', 'growler_price'),
+    'Tours': ('monthly_tours', 'tour_price'),
+    'Merch': ('monthly_merch', 'merch_avg'),
+    'Kegs': ('monthly_kegs', 'keg_price'),
+    'Cases': ('monthly_cases', 'case_price'),
+    'Food': ('monthly_food', None),
+}
+OTHER = 'Other'
+
+# First matching pattern wins, so beer in general is tried last
+_CHANNEL_PATTERNS = (
+    ('Flights', r'flight'),
+    ('Growlers', r'growler|crowler'),
+    ('Kegs', r'\bkeg|sixtel'),
+    ('Cases', r'\bcases?\b|\d+\s*-?\s*(pk|pack)\b|\bcans?\b'),
+    ('Tours', r'\btours?\b|tasting experience'),
+    ('Merch', r'merch|shirt|\bhats?\b|hoodie|glassware|sticker'),
+    ('Food', r'food|kitchen|pretzel|pizza|burger|snack'),
+    ('Pints', r'pint|draft|draught|pour|\bbeer|\bipa\b|lager|stout|\bpale\b|\bale\b|sour'),
+)
+
+# Accepted export headers for each field, compared case-insensitively
+_COLUMN_ALIASES = {
+    'date': ('date', 'timestamp', 'datetime', 'created at', 'created_at', 'transaction date', 'time'),
+    'item': ('category', 'item', 'item name', 'product', 'menu item', 'description'),
+    'quantity': ('quantity', 'qty', 'units', 'count'),
+    'amount': ('net sales', 'amount', 'net amount', 'total', 'gross sales', 'revenue'),
+}
+_REQUIRED = ('date', 'item')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS actual_source_months (
+    source TEXT NOT NULL,
+    month TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    quantity REAL NOT NULL,
+    revenue REAL NOT NULL,
+    rows INTEGER NOT NULL,
+    PRIMARY KEY (source, month, channel)
+);
+CREATE TABLE IF NOT EXISTS actual_imports (
+    source TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    through TEXT,
+    rows INTEGER NOT NULL,
+    imported_at TEXT NOT NULL
+);
+"""
+
+
+# ==================== STORAGE ====================
+class ActualsStore:
+    """Monthly sales totals per source file and channel, and how far into each file they go"""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self):
+        """Connection for the calling thread"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def source(self, name):
+        """``(fingerprint, through)`` recorded for a source file, or None if never imported
+
+        ``through`` is None while no transaction with a valid date has been imported from it.
+        """
+        with closing(self._connect().execute(
+            "SELECT fingerprint, through FROM actual_imports WHERE source = ?", (name,)
+        )) as cursor:
+            return cursor.fetchone()
+
+    def replace(self, name, fingerprint, through, since, totals):
+        """Replace a source's totals from month ``since`` on (all of them if None) and record it, in one transaction
+
+        ``totals`` holds (month, channel, quantity, revenue, rows) for the months replaced.
+        """
+        with self._connect() as conn:
+            conn.execute("DELETE FROM actual_source_months WHERE source = ? AND month >= ?", (name, since or ''))
+            conn.executemany(
+                "INSERT INTO actual_source_months (source, month, channel, quantity, revenue, rows) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(name, *row) for row in totals]
+            )
+            conn.execute(
+                "INSERT INTO actual_imports (source, fingerprint, through, rows, imported_at) "
+                "VALUES (?, ?, ?, (SELECT COALESCE(SUM(rows), 0) FROM actual_source_months WHERE source = ?), ?) "
+                "ON CONFLICT (source) DO UPDATE SET fingerprint = excluded.fingerprint, "
+                "through = excluded.through, rows = excluded.rows, imported_at = excluded.imported_at",
+                (name, fingerprint, through, name, datetime.now().isoformat(timespec='seconds'))
+            )
+
+    def monthly(self):
+        """Every stored month and channel total over all sources, oldest month first"""
+        with closing(self._connect().execute(
+            "SELECT month, channel, SUM(quantity), SUM(revenue) FROM actual_source_months "
+            "GROUP BY month, channel ORDER BY month, channel"
+        )) as cursor:
+            return pd.DataFrame(cursor.fetchall(), columns=['Month', 'Channel', 'Quantity', 'Revenue'])
+
+    def imports(self):
+        """Imported source files, most recent first"""
+        with closing(self._connect().execute(
+            "SELECT source, through, rows, imported_at FROM actual_imports ORDER BY imported_at DESC"
+        )) as cursor:
+            return pd.DataFrame(cursor.fetchall(), columns=['File', 'Through', 'Rows', 'Imported'])
+
+    def clear(self):
+        """Forget every imported total and source"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM actual_source_months")
+            conn.execute("DELETE FROM actual_imports")
+
+
+# ==================== IMPORT ====================
+@dataclass(frozen=True)
+class ImportSummary:
+    """What one import added"""
+    source: str
+    rows_read: int
+    rows_imported: int   # transactions with a valid date in the months read, replacing earlier totals for them
+    through: str         # latest transaction time now imported from this source, None without any
+    skipped: bool = False
+
+
+def _source_name(source):
+    """File name of a path or uploaded file"""
+    return str(getattr(source, 'name', source)).replace('\\', '/').rsplit('/', 1)[-1]
+
+
+def _fingerprint(source, block=1 << 20):
+    """Hash of a file's size and its first and last ``block`` bytes"""
+    handle = open(source, 'rb') if isinstance(source, str) else source
+    try:
+        size = handle.seek(0, 2)
+        digest = hashlib.sha256(str(size).encode())
+        handle.seek(0)
+        digest.update(handle.read(block))
+        handle.seek(max(size - block, 0))
+        digest.update(handle.read(block))
+        handle.seek(0)
+        return digest.hexdigest()
+    finally:
+        if handle is not source:
+            handle.close()
+
+
+def _resolve_columns(header):
+    """``{field: export column}`` for the fields an export provides"""
+    by_name = {str(column).strip().lower(): column for column in header}
+    columns = {}
+    for name, aliases in _COLUMN_ALIASES.items():
+        match = next((by_name[alias] for alias in aliases if alias in by_name), None)
+        if match is not None:
+            columns[name] = match
+    missing = [name for name in _REQUIRED if name not in columns]
+    if missing:
+        raise ValueError(f"No {' or '.join(missing)} column found; expected one of "
+                         + "; ".join(", ".join(_COLUMN_ALIASES[name]) for name in missing))
+    return columns
+
+
+def _ends_before(statistics, since):
+    """Whether a Parquet row group's statistics show every date in it is before ``since``"""
+    if statistics is None or not statistics.has_min_max:
+        return False
+    try:
+        return pd.Timestamp(statistics.max) < since
+    except (TypeError, ValueError):
+        return False
+
+
+def _read_chunks(source, chunk_rows, since=None):
+    """Yield the export in frames of at most ``chunk_rows`` rows with columns renamed to field names
+
+    Parquet row groups whose statistics end before ``since`` are skipped unread.
+    """
+    if _source_name(source).lower().endswith('.parquet'):
+        # pyarrow comes with Streamlit; imported here so CSV-only imports never load it
+        import pyarrow.parquet as pq
+        file = pq.ParquetFile(source)
+        columns = _resolve_columns(file.schema_arrow.names)
+        renames = {column: name for name, column in columns.items()}
+        groups = list(range(file.num_row_groups))
+        if since is not None:
+            date = file.schema_arrow.get_field_index(columns['date'])
+            groups = [group for group in groups
+                      if not _ends_before(file.metadata.row_group(group).column(date).statistics, since)]
+        if groups:
+            for batch in file.iter_batches(batch_size=chunk_rows, row_groups=groups,
+                                           columns=list(columns.values())):
+                yield batch.to_pandas().rename(columns=renames)
+        return
+    columns = _resolve_columns(pd.read_csv(source, nrows=0).columns)
+    if not isinstance(source, str):
+        source.seek(0)
+    renames = {column: name for name, column in columns.items()}
+    with pd.read_csv(source, usecols=list(columns.values()), chunksize=chunk_rows) as reader:
+        for chunk in reader:
+            yield chunk.rename(columns=renames)
+
+
+def classify(items):
+    """Sales channel of each POS item or category name, ``OTHER`` if none matches"""
+    codes, uniques = pd.factorize(pd.Series(items, dtype=object).fillna('').astype(str).str.lower())
+    patterns = [(channel, re.compile(pattern)) for channel, pattern in _CHANNEL_PATTERNS]
+    channels = np.array([next((channel for channel, pattern in patterns if pattern.search(item)), OTHER)
+                         for item in uniques] + [OTHER], dtype=object)
+    return channels[codes]
+
+
+def import_actuals(store, source, chunk_rows=CHUNK_ROWS, progress=None):
+    """Stream one CSV or Parquet export into ``store``, re-reading it from the last imported month on
+
+    Same-day additions and corrections re-exported in that month replace its
+    earlier totals instead of being dropped or counted twice. ``progress`` is
+    called with the rows read so far after every chunk.
+    """
+    name = _source_name(source)
+    fingerprint = _fingerprint(source)
+    previous = store.source(name)
+    if previous is not None and previous[0] == fingerprint:
+        return ImportSummary(name, 0, 0, previous[1], skipped=True)
+    # Without a recorded time (never imported, or no dates found last time) the whole file is read
+    since = pd.Timestamp(previous[1]).to_period('M').to_timestamp() if previous is not None and previous[1] else None
+
+    totals = None
+    rows_read = rows_imported = 0
+    latest = None
+    for chunk in _read_chunks(source, chunk_rows, since):
+        rows_read += len(chunk)
+        when = pd.to_datetime(chunk['date'], errors='coerce')
+        keep = (when.notna() if since is None else when >= since).to_numpy()
+        if keep.any():
+            when = when[keep]
+            latest = max(latest, when.max()) if latest is not None else when.max()
+            quantity = (pd.to_numeric(chunk['quantity'][keep], errors='coerce').fillna(0.0)
+                        if 'quantity' in chunk else 1.0)
+            amount = (pd.to_numeric(chunk['amount'][keep], errors='coerce').fillna(0.0)
+                      if 'amount' in chunk else 0.0)
+            grouped = pd.DataFrame({
+                'month': when.dt.year.to_numpy() * 12 + when.dt.month.to_numpy() - 1,
+                'channel': classify(chunk['item'][keep].to_numpy()),
+                'quantity': np.broadcast_to(np.asarray(quantity, dtype=float), when.shape),
+                'revenue': np.broadcast_to(np.asarray(amount, dtype=float), when.shape),
+                'rows': 1,
+            }).groupby(['month', 'channel']).sum()
+            totals = grouped if totals is None else totals.add(grouped, fill_value=0)
+            rows_imported += int(keep.sum())
+        if progress is not None:
+            progress(rows_read)
+
+    if latest is None and since is not None:
+        latest = pd.Timestamp(previous[1])   # nothing dated in the re-read months any more
+    through = latest.isoformat() if latest is not None else None
+    rows = [] if totals is None else [
+        (f"{month // 12}-{month % 12 + 1:02d}", channel, float(quantity), float(revenue), int(count))
+        for (month, channel), quantity, revenue, count
+        in zip(totals.index, totals['quantity'], totals['revenue'], totals['rows'])
+    ]
+    store.replace(name, fingerprint, through, f"{since.year}-{since.month:02d}" if since is not None else None, rows)
+    return ImportSummary(name, rows_read, rows_imported, through)
+
+
+# ==================== VARIANCE ====================
+def plan_vs_actual(actuals, mix, assumptions):
+    """Planned and actual units and revenue per channel for each projected month with actuals
+
+    Plans follow the Sales Volume mix along the cashflow's revenue path, so
+    each month's planned revenue over all channels is the projection's revenue.
+    Food is planned and compared in dollars.
+    """
+    columns = ['Month', 'Channel', 'Planned Units', 'Actual Units', 'Planned Revenue', 'Actual Revenue']
+    if actuals.empty or assumptions.months <= 0 or mix.total_revenue <= 0:
+        return pd.DataFrame(columns=columns + ['Unit Variance %', 'Revenue Variance'])
+    index = volume_index(mix, assumptions)
+    months = [f"{m // 12}-{m % 12 + 1:02d}" for m in calendar_months(assumptions.calendar, assumptions.months)]
+    units = {channel: getattr(mix, volume) * index for channel, (volume, _) in CHANNELS.items()}
+    units['Food'] = mix.food_revenue * index
+    plan = pd.DataFrame({
+        'Month': np.tile(months, len(CHANNELS)),
+        'Channel': np.repeat(list(CHANNELS), len(months)),
+        'Planned Units': np.concatenate([units[channel] for channel in CHANNELS]),
+        'Planned Revenue': np.concatenate([units[channel] * (getattr(mix, price) if price else 1.0)
+                                           for channel, (_, price) in CHANNELS.items()]),
+    })
+
+    actual = actuals.rename(columns={'Quantity': 'Actual Units', 'Revenue': 'Actual Revenue'})
+    actual = actual[actual['Month'].isin(months)].copy()
+    actual.loc[actual['Channel'] == 'Food', 'Actual Units'] = actual['Actual Revenue']
+    merged = plan[plan['Month'].isin(actual['Month'])].merge(actual, on=['Month', 'Channel'], how='outer')
+    merged = merged.fillna(0.0)[columns].sort_values(['Month', 'Channel'], ignore_index=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        merged['Unit Variance %'] = np.where(merged['Planned Units'] > 0,
+                                             (merged['Actual Units'] / merged['Planned Units'] - 1) * 100, np.nan)
+    merged['Revenue Variance'] = merged['Actual Revenue'] - merged['Planned Revenue']
+    return merged
+
+
+def monthly_variance(variance):
+    """Planned and actual revenue over all channels per month, from ``plan_vs_actual``"""
+    totals = variance.groupby('Month', sort=True)[['Planned Revenue', 'Actual Revenue']].sum().reset_index()
+    totals['Revenue Variance'] = totals['Actual Revenue'] - totals['Planned Revenue']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        totals['Variance %'] = np.where(totals['Planned Revenue'] > 0,
+                                        totals['Revenue Variance'] / totals['Planned Revenue'] * 100, np.nan)
+    return totals
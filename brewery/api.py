@@ -0,0 +1,330 @@
+"""Local HTTP/JSON API for the financial model
+
+    python -m brewery.api --port 8502 --workers 4
+
+POST a scenario in its saved form (``Scenario.to_dict``; any part left out
+takes its default, as in the batch runner's scenario files) to
+
+    /forecast    revenue forecast by channel
+    /cashflow    monthly cashflow with breakeven, profit and DSCR
+    /breakeven   breakeven revenue and month
+    /expenses    fixed expenses, variable cost breakdown and startup capital
+    /returns     per-partner returns and the partners' IRR, MOIC and NPV
+    /evaluate    the batch runner's headline results
+
+or ``{"scenarios": {name: scenario, ...}}`` (or a list) to ``/batch``, which
+projects them all in one vectorized pass and answers one summary row each.
+``GET /health`` reports cache calls and misses per endpoint.
+
+Responses are cached, encoded, by input hash: a body seen before is answered
+from its digest without parsing, and any body describing the same inputs
+shares the entry. uvicorn keeps HTTP/1.1 connections alive between requests.
+There is no login, so the server binds to loopback unless told otherwise.
+"""
+import argparse
+import hashlib
+import json
+import os
+import socket
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from brewery import instrument
+from brewery.assumptions import Scenario
+from brewery.batch import input_hash, summarize
+from brewery.compare import compare_scenarios
+from brewery.costs import cost_breakdown
+from brewery.model import ModelGraph
+from brewery.projection import (breakeven_revenue, business_value, equity_irr, fixed_expense_breakdown, month_labels,
+                                partner_returns, revenue_forecast)
+from brewery.returns import equity_flows, moic, npv
+
+# Encoded responses kept per worker process
+CACHE_SIZE = int(os.environ.get("BREWERY_API_CACHE", 4096))
+
+# Most scenarios one /batch request may project
+MAX_BATCH = 10_000
+
+# Errors a malformed scenario raises while it is rebuilt or projected
+_BAD_INPUT = (ValueError, TypeError, AttributeError, KeyError, IndexError)
+
+
+class ResponseCache:
+    """Least recently used encoded responses, shared by every connection in the process"""
+
+    def __init__(self, maxsize=CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Cached value for ``key``, or None"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        """Store ``value``, dropping the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# ==================== ENCODING ====================
+def _jsonable(value):
+    """``value`` with NumPy types unwrapped and NaN/inf replaced by None"""
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return _jsonable(value.tolist())
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+
+def _records(frame):
+    """Table rows as a list of ``{column: value}``"""
+    return frame.to_dict('records')
+
+
+def _encode(result):
+    """Response body bytes for a result dict"""
+    return json.dumps(_jsonable(result), separators=(',', ':')).encode()
+
+
+# ==================== SECTIONS ====================
+def forecast(scenario, graph):
+    """Revenue forecast by channel, as on the Revenue Projections page"""
+    a = graph['assumptions']
+    frame = revenue_forecast(scenario.mix, scenario.forecast_growth, scenario.forecast_months, a.growth_decay,
+                             a.calendar)
+    return {'total_revenue': frame['Total Revenue'].sum(), 'months': _records(frame)}
+
+
+def cashflow(scenario, graph):
+    """Monthly cashflow projection and its headline numbers"""
+    a, projection = graph['assumptions'], graph['projection']
+    return {
+        'breakeven_month': projection.breakeven_month,
+        'total_revenue': projection.revenue.sum(),
+        'total_profit': projection.profit.sum(),
+        'lowest_cumulative_cash': projection.cumulative.min(),
+        'final_cumulative_cash': projection.cumulative[-1],
+        'min_dscr': projection.min_dscr,
+        'months': _records(projection.to_frame(month_labels(a.calendar, a.months))),
+    }
+
+
+def breakeven(scenario, graph):
+    """Revenue needed to cover costs each month, and the month cumulative cash turns positive"""
+    a = graph['assumptions']
+    monthly = breakeven_revenue(a.total_monthly_fixed, a.variable_cost_pct)
+    return {
+        'monthly_revenue': monthly,
+        'annual_revenue': monthly * 12,
+        'starting_monthly_revenue': a.starting_monthly_revenue,
+        'variable_cost_pct': a.variable_cost_pct,
+        'breakeven_month': graph['projection'].breakeven_month,
+    }
+
+
+def expenses(scenario, graph):
+    """Fixed expenses, the variable cost model's components and the startup capital"""
+    a = graph['assumptions']
+    return {
+        'monthly_fixed': graph['fixed_expenses'],
+        'variable_cost_pct': graph['variable_cost_pct'],
+        'startup_capital': graph['startup_capital'],
+        'loans': a.debt,
+        'partner_equity': a.equity,
+        'fixed_expenses': _records(fixed_expense_breakdown(a)),
+        'variable_costs': _records(cost_breakdown(scenario.mix, scenario.costs, 1.0, a.calendar.start_month)),
+    }
+
+
+def returns(scenario, graph):
+    """Each partner's returns and the partners' returns together"""
+    a, projection, partnership = graph['assumptions'], graph['projection'], scenario.partnership
+    frame = partner_returns(projection, partnership, a.equity)
+    flows = equity_flows(projection.cash_flow, partnership.profit_distribution_pct, a.equity,
+                         business_value(projection))
+    return {
+        'equity_irr_pct': equity_irr(projection, partnership, a.equity),
+        'equity_moic': moic(flows),
+        'equity_npv': npv(flows, partnership.discount_rate_pct),
+        'partners': _records(frame),
+    }
+
+
+def summary(scenario, graph):
+    """Headline results, the same columns the batch runner writes"""
+    return summarize(graph['assumptions'], graph['projection'], scenario.partnership)
+
+
+SECTIONS = {
+    'forecast': forecast,
+    'cashflow': cashflow,
+    'breakeven': breakeven,
+    'expenses': expenses,
+    'returns': returns,
+    'evaluate': summary,
+}
+
+
+def _batch_scenarios(data):
+    """``{name: Scenario}`` from a /batch payload, named by position where a listed scenario has no name"""
+    items = data.get('scenarios') if isinstance(data, dict) else None
+    if isinstance(items, list) and all(isinstance(item, dict) for item in items):
+        items = {item.get('name', f"Scenario {i + 1}"): item for i, item in enumerate(items)}
+    if not isinstance(items, dict) or not all(isinstance(item, dict) for item in items.values()):
+        raise ValueError('expected {"scenarios": {name: scenario, ...}} or a list of scenarios')
+    return {str(name): Scenario.from_dict(item) for name, item in items.items()}
+
+
+def _batch(scenarios, monthly):
+    """Comparison summary for ``{name: Scenario}``, with monthly rows when asked"""
+    comparison = compare_scenarios(scenarios)
+    result = {'scenarios': _records(comparison.summary())}
+    if monthly:
+        result['monthly'] = {
+            name: {'revenue': comparison.revenue[i], 'profit': comparison.profit[i],
+                   'cumulative': comparison.cumulative[i]}
+            for i, name in enumerate(comparison.names)
+        }
+    return result
+
+
+# ==================== APP ====================
+def _error(message, status=400):
+    return JSONResponse({'error': message}, status_code=status)
+
+
+def _response(body, key):
+    return Response(body, media_type='application/json', headers={'X-Input-Hash': key})
+
+
+def create_app(cache_size=CACHE_SIZE):
+    """Starlette app serving the model, with its own response cache"""
+    cache = ResponseCache(cache_size)
+
+    async def read(request):
+        """The request body and its cache key, a digest of the exact bytes"""
+        body = await request.body()
+        return ('raw', request.url.path, hashlib.blake2b(body, digest_size=16).digest()), body
+
+    def section_endpoint(name, compute):
+        async def endpoint(request):
+            instrument.count(f"api.{name}", 'calls')
+            raw, body = await read(request)
+            cached = cache.get(raw)
+            if cached is None:
+                try:
+                    data = json.loads(body or b'{}')
+                    if not isinstance(data, dict):
+                        return _error("expected a JSON object describing one scenario")
+                    scenario = Scenario.from_dict(data)
+                    key = input_hash(scenario)
+                    cached = cache.get((name, key))
+                    if cached is None:
+                        instrument.count(f"api.{name}", 'misses')
+                        # Off the event loop, so a slow projection never stalls other connections
+                        result = await run_in_threadpool(compute, scenario, ModelGraph(scenario))
+                        cached = (_encode({'input_hash': key, **result}), key)
+                        cache.put((name, key), cached)
+                except json.JSONDecodeError as exc:
+                    return _error(f"invalid JSON: {exc}")
+                except _BAD_INPUT as exc:
+                    return _error(f"invalid scenario: {exc}")
+                cache.put(raw, cached)
+            return _response(*cached)
+        return endpoint
+
+    async def batch(request):
+        instrument.count("api.batch", 'calls')
+        raw, body = await read(request)
+        cached = cache.get(raw)
+        if cached is None:
+            try:
+                data = json.loads(body or b'{}')
+                scenarios = _batch_scenarios(data)
+                if len(scenarios) > MAX_BATCH:
+                    return _error(f"at most {MAX_BATCH:,} scenarios per batch", 413)
+                monthly = bool(data.get('monthly', False))
+                keys = [[name, input_hash(scenario)] for name, scenario in scenarios.items()]
+                key = hashlib.sha256(json.dumps([keys, monthly]).encode()).hexdigest()[:16]
+                cached = cache.get(('batch', key))
+                if cached is None:
+                    instrument.count("api.batch", 'misses')
+                    # Large batches take a while; the thread keeps other connections answered
+                    result = await run_in_threadpool(_batch, scenarios, monthly)
+                    cached = (await run_in_threadpool(_encode, {'input_hash': key, **result}), key)
+                    cache.put(('batch', key), cached)
+            except json.JSONDecodeError as exc:
+                return _error(f"invalid JSON: {exc}")
+            except _BAD_INPUT as exc:
+                return _error(f"invalid scenario: {exc}")
+            cache.put(raw, cached)
+        return _response(*cached)
+
+    async def health(request):
+        totals = {name: counts for name, counts in instrument.cache_totals().items() if name.startswith('api.')}
+        return JSONResponse({'status': 'ok', 'cached_responses': len(cache), 'cache': totals})
+
+    routes = [Route(f"/{name}", section_endpoint(name, compute), methods=['POST'])
+              for name, compute in SECTIONS.items()]
+    routes += [Route("/batch", batch, methods=['POST']), Route("/health", health, methods=['GET'])]
+    return Starlette(routes=routes)
+
+
+app = create_app()
+
+
+# ==================== COMMAND LINE ====================
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(prog="python -m brewery.api", description="Serve the brewery model as JSON")
+    parser.add_argument('--host', default='127.0.0.1', help="interface to bind (default: loopback only)")
+    parser.add_argument('--port', type=int, default=8502, help="port (default: 8502)")
+    parser.add_argument('--workers', type=int, default=1, help="server processes, each with its own cache")
+    parser.add_argument('--cache-size', type=int, default=CACHE_SIZE, help="responses cached per process")
+    parser.add_argument('--keep-alive', type=int, default=75, help="seconds an idle connection stays open")
+    args = parser.parse_args(argv)
+
+    import uvicorn
+    from uvicorn.supervisors import Multiprocess
+
+    # Worker processes import this module afresh and read the cache size from here
+    os.environ["BREWERY_API_CACHE"] = str(args.cache_size)
+    config = uvicorn.Config("brewery.api:app", host=args.host, port=args.port, workers=args.workers,
+                            timeout_keep_alive=args.keep_alive, access_log=False, log_level="warning")
+    if config.workers == 1:
+        uvicorn.Server(config).run()
+        return 0
+    # The shared listening socket uvicorn binds for its workers leaves Nagle's algorithm on, which holds each
+    # response body back until the client acknowledges the headers; accepted connections inherit TCP_NODELAY
+    sock = config.bind_socket()
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    Multiprocess(config, sockets=[sock]).run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
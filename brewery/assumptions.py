@@ -0,0 +1,295 @@
+"""Typed input objects for the brewery financial model"""
+from dataclasses import MISSING, asdict, dataclass, field, fields, is_dataclass, replace
+from datetime import date
+
+# Multiplier on the base monthly growth rate in year 1, year 2 and year 3 onwards
+GROWTH_DECAY = (1.0, 0.6, 0.4)
+
+
+# ==================== STARTUP CAPITAL ====================
+@dataclass(frozen=True)
+class StartupCosts:
+    """One-time startup costs entered on the Financial Inputs page"""
+    equipment_cost: float = 150000
+    facility_buildout: float = 50000
+    licensing_fees: float = 10000
+    pos_system: float = 8000
+    initial_inventory: float = 15000
+    kegs_cans: float = 30000
+    taproom_setup: float = 35000
+    contingency: float = 40000
+
+    @property
+    def total(self):
+        """Total initial capital required"""
+        return (self.equipment_cost + self.facility_buildout + self.licensing_fees +
+                self.pos_system + self.initial_inventory + self.kegs_cans +
+                self.taproom_setup + self.contingency)
+
+
+# ==================== PRODUCT MIX ====================
+@dataclass(frozen=True)
+class ProductMix:
+    """Prices, unit costs and monthly volumes from the Revenue Projections page"""
+    # Taproom pricing
+    pint_price: float = 7.0
+    flight_price: float = 12.0
+    growler_price: float = 16.0
+    pint_cogs: float = 1.0
+    # Wholesale pricing
+    keg_price: float = 200.0
+    case_price: float = 32.0
+    keg_cogs: float = 40.0
+    # Other revenue streams
+    tour_price: float = 15.0
+    merch_avg: float = 25.0
+    food_enabled: bool = False
+    # Monthly volumes
+    monthly_pints: float = 3000
+    monthly_flights: float = 200
+    monthly_growlers: float = 150
+    monthly_tours: float = 100
+    monthly_merch: float = 50
+    monthly_kegs: float = 30
+    monthly_cases: float = 100
+    monthly_food: float = 8000
+
+    @property
+    def taproom_revenue(self):
+        """Monthly taproom revenue (pints, flights, growlers, tours, merch)"""
+        return (self.monthly_pints * self.pint_price +
+                self.monthly_flights * self.flight_price +
+                self.monthly_growlers * self.growler_price +
+                self.monthly_tours * self.tour_price +
+                self.monthly_merch * self.merch_avg)
+
+    @property
+    def wholesale_revenue(self):
+        """Monthly wholesale revenue (kegs and cases)"""
+        return self.monthly_kegs * self.keg_price + self.monthly_cases * self.case_price
+
+    @property
+    def food_revenue(self):
+        """Monthly food revenue, zero unless running a gastropub model"""
+        return self.monthly_food if self.food_enabled else 0
+
+    @property
+    def total_revenue(self):
+        """Total monthly revenue across all channels"""
+        return self.taproom_revenue + self.wholesale_revenue + self.food_revenue
+
+    @property
+    def beer_cogs(self):
+        """Monthly beer COGS, costing packaged and taproom pours at the per-pint rate"""
+        # Flights are 4x 5oz (1.25 pints), growlers 64oz (4 pints), cases 24x 12oz (18 pints)
+        pint_equivalents = (self.monthly_pints + self.monthly_flights * 1.25 +
+                            self.monthly_growlers * 4 + self.monthly_cases * 18)
+        return pint_equivalents * self.pint_cogs + self.monthly_kegs * self.keg_cogs
+
+    @property
+    def beer_revenue(self):
+        """Monthly revenue from beer: pints, flights, growlers, kegs and cases"""
+        return (self.monthly_pints * self.pint_price + self.monthly_flights * self.flight_price +
+                self.monthly_growlers * self.growler_price + self.wholesale_revenue)
+
+    @property
+    def total_bbls(self):
+        """Barrels of beer needed per month for this volume"""
+        # Pours and packages in ounces (31-gallon barrel = 3,968 oz); kegs are half barrels
+        ounces = (self.monthly_pints * 16 + self.monthly_flights * 4 * 5 +
+                  self.monthly_growlers * 64 + self.monthly_cases * 24 * 12)
+        return ounces / 3968 + self.monthly_kegs * 0.5
+
+
+# ==================== VARIABLE COSTS ====================
+@dataclass(frozen=True)
+class CostModel:
+    """Per-unit costs, excise, sales tax and card fees that scale with sales volume"""
+    packaging_per_can: float = 0.60           # can, label and carrier per 12 oz can in cases
+    state_excise_per_gallon: float = 0.6171   # NC malt beverage excise
+    sales_tax_pct: float = 7.25               # Mecklenburg County combined rate on taproom sales
+    prices_include_tax: bool = False          # taproom prices are tax-inclusive, so the tax comes out of revenue
+    card_fee_pct: float = 2.9
+    taproom_card_pct: float = 85.0            # share of taproom and food sales paid by card
+    wholesale_card_pct: float = 10.0          # share of wholesale accounts paying by card
+    distribution_pct: float = 0.0             # distributor margin on wholesale, 0 if self-distributing
+    merch_cogs_pct: float = 40.0
+    food_cogs_pct: float = 32.0
+
+
+# ==================== CALENDAR ====================
+MONTH_NAMES = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def _next_month():
+    """'YYYY-MM' of the month after today, the default opening month"""
+    today = date.today()
+    return f"{today.year + today.month // 12}-{today.month % 12 + 1:02d}"
+
+
+@dataclass(frozen=True)
+class Event:
+    """A festival, release or other event that moves one month's revenue"""
+    name: str
+    month: str                # 'YYYY-MM' of the (first) occurrence
+    uplift_pct: float = 0.0   # % change to that month's revenue, negative for closures
+    annual: bool = False      # repeats in the same calendar month every later year
+
+
+@dataclass(frozen=True)
+class Calendar:
+    """Opening month, seasonal revenue indices and event calendar"""
+    start_month: str = field(default_factory=_next_month)  # 'YYYY-MM' of projection month 1
+    seasonal_index: tuple = (1.0,) * 12                    # revenue multiplier for Jan..Dec
+    events: tuple = ()
+
+    def __post_init__(self):
+        # Saved scenarios come back from JSON with events as plain dicts
+        object.__setattr__(self, 'events', tuple(
+            event if isinstance(event, Event) else Event(**event) for event in self.events
+        ))
+
+
+# ==================== BREWHOUSE ====================
+@dataclass(frozen=True)
+class Brewhouse:
+    """Brewing system, cellar and cycle times for the brew-schedule simulator"""
+    auto_size: bool = True        # take system size and tank counts from the equipment budget
+    batch_bbl: float = 7.0        # brewhouse length; each batch fills one fermenter
+    fermenters: int = 6
+    brite_tanks: int = 2
+    ferment_days: int = 14        # about 2 weeks for ales, 4 for lagers
+    condition_days: int = 5       # brite tank time including packaging
+    brew_days_per_week: int = 4
+    yield_pct: float = 92.0       # packaged share of brewed volume
+    cap_sales: bool = False       # limit projected sales to what the cellar can produce
+
+
+# ==================== FINANCING ====================
+@dataclass(frozen=True)
+class Loan:
+    """One debt tranche drawn at opening to fund part of the startup capital"""
+    name: str
+    principal: float
+    annual_rate_pct: float = 10.0
+    term_months: int = 120
+    interest_only_months: int = 0   # months of interest-only payments before amortizing
+    balloon_pct: float = 0.0        # % of principal left after the level payments, due with the last one
+
+
+# ==================== CASHFLOW ASSUMPTIONS ====================
+@dataclass(frozen=True)
+class Assumptions:
+    """Inputs to the monthly cashflow projection"""
+    initial_capital: float = 400000
+    monthly_rent: float = 5000
+    monthly_payroll: float = 15000
+    monthly_insurance: float = 1500
+    monthly_utilities: float = 2500
+    monthly_marketing: float = 3000
+    monthly_other: float = 2000
+    starting_monthly_revenue: float = 35000
+    monthly_revenue_growth: float = 4.0  # % per month in year 1
+    variable_cost_pct: float = 25.0      # % of revenue
+    months: int = 36
+    growth_decay: tuple = GROWTH_DECAY   # growth multiplier per year, last one carries on
+    calendar: Calendar = field(default_factory=Calendar)
+    supply_share: tuple = ()             # share of each month's revenue brewing capacity allows, () if uncapped
+    loans: tuple = ()                    # Loan tranches funding part of the initial capital
+
+    def __post_init__(self):
+        # Saved scenarios come back from JSON with loans as plain dicts
+        object.__setattr__(self, 'loans', tuple(
+            loan if isinstance(loan, Loan) else Loan(**loan) for loan in self.loans
+        ))
+
+    @property
+    def total_monthly_fixed(self):
+        """Total fixed operating expenses per month"""
+        return (self.monthly_rent + self.monthly_payroll + self.monthly_insurance +
+                self.monthly_utilities + self.monthly_marketing + self.monthly_other)
+
+    @property
+    def debt(self):
+        """Total loan principal drawn at opening"""
+        return sum(loan.principal for loan in self.loans)
+
+    @property
+    def equity(self):
+        """Initial capital the partners fund themselves, after loan proceeds"""
+        return max(self.initial_capital - self.debt, 0.0)
+
+
+# ==================== PARTNERSHIP ====================
+@dataclass(frozen=True)
+class Partnership:
+    """Ownership split, capital contributions and distribution policy for the three partners"""
+    partner_pcts: tuple = (33.33, 33.33, 33.34)
+    profit_distribution_pct: float = 70
+    capital_pcts: tuple = ()             # share of the equity each partner contributes, () to follow ownership
+    discount_rate_pct: float = 12.0      # annual rate partner cash flows are discounted at for NPV
+    waterfall: bool = False              # distribute through the tiers below instead of pro rata
+    preferred_return_pct: float = 8.0    # annual hurdle on contributed capital
+    catch_up_pct: float = 100.0          # share of distributions past the hurdle paid to the managing partner
+    carry_pct: float = 20.0              # managing partner's carried interest in profit past the catch-up
+    managing_partner: int = 0            # index of the partner who earns the catch-up and carry
+
+    @property
+    def names(self):
+        """Display names for each partner"""
+        return [f"Partner {i + 1}" for i in range(len(self.partner_pcts))]
+
+    @property
+    def capital_shares(self):
+        """Share of the equity each partner contributes, in %"""
+        return self.capital_pcts or self.partner_pcts
+
+
+# ==================== SCENARIO ====================
+@dataclass(frozen=True)
+class Scenario:
+    """Every input behind the analyzer pages, saved and loaded as one unit"""
+    startup: StartupCosts = field(default_factory=StartupCosts)
+    mix: ProductMix = field(default_factory=ProductMix)
+    forecast_growth: float = 3.0  # % per month for the revenue forecast
+    forecast_months: int = 12
+    cashflow: Assumptions = field(default_factory=Assumptions)
+    partnership: Partnership = field(default_factory=Partnership)
+    brewhouse: Brewhouse = field(default_factory=Brewhouse)
+    costs: CostModel = field(default_factory=CostModel)
+
+    @property
+    def assumptions(self):
+        """Cashflow assumptions funded by the startup capital total, capped at brewing capacity if enabled
+
+        Variable costs are the cost model's share of revenue over the projected months.
+        """
+        # Imported here because the model graph imports this module
+        from brewery.model import ModelGraph
+        return ModelGraph(self)['assumptions']
+
+    def to_dict(self):
+        """Plain-dict form for JSON storage"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a scenario, ignoring unknown keys and defaulting missing ones"""
+        return _from_dict(cls, data)
+
+
+def _from_dict(cls, data):
+    """Rebuild a dataclass from its dict form, recursing into nested parts"""
+    values = {}
+    for f in fields(cls):
+        if f.name not in data:
+            continue
+        value = data[f.name]
+        default = f.default_factory() if f.default_factory is not MISSING else f.default
+        if isinstance(value, dict) and is_dataclass(default):
+            value = _from_dict(type(default), value)
+        elif isinstance(value, list):
+            # JSON turns tuples such as partner_pcts into lists
+            value = tuple(value)
+        values[f.name] = value
+    return cls(**values)
@@ -0,0 +1,276 @@
+"""Headless batch runner: project scenario files without the Streamlit app
+
+    python -m brewery.batch lenders/ extra.yaml --out results --jobs 8 --monthly
+
+Each scenario runs through the same model the pages use: ``Scenario.assumptions``,
+the cashflow projection and the partner return metrics. Scenarios are spread
+over a process pool in small chunks. Each finished chunk is written straight to
+``<out>/parts``, so an interrupted run keeps everything done so far.
+
+Every scenario is keyed by a hash of its full inputs. A scenario whose hash
+already has results in ``<out>/parts`` is skipped, so rerunning the same
+command resumes an interrupted run, and a rerun after editing a few files only
+projects those. The combined ``summary`` (and ``monthly``) file covers exactly
+the scenarios named on the command line.
+"""
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import fields
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from brewery.assumptions import Scenario
+from brewery.projection import business_value, month_labels, project_cashflow
+from brewery.returns import annual_irr, equity_flows, moic, npv
+
+# Bumped whenever the model changes what a scenario's results are, so old results are recomputed
+RESULTS_VERSION = 1
+
+# Scenarios evaluated per worker task, and so per checkpoint file
+CHUNK_SIZE = 8
+
+SCENARIO_SUFFIXES = ('.json', '.yaml', '.yml')
+FORMATS = ('parquet', 'csv')
+
+# Keys that mark a file's top-level mapping as one scenario rather than several by name
+_SCENARIO_KEYS = {f.name for f in fields(Scenario)} | {'name'}
+
+
+# ==================== INPUTS ====================
+def _read_file(path):
+    """Parsed contents of a JSON or YAML file"""
+    text = path.read_text()
+    if path.suffix == '.json':
+        return json.loads(text)
+    try:
+        import yaml
+    except ImportError:
+        raise ValueError(f"{path}: YAML scenario files need PyYAML (pip install pyyaml)") from None
+    try:
+        return yaml.safe_load(text)
+    except yaml.YAMLError as exc:
+        raise ValueError(f"{path}: {exc}") from exc
+
+
+def _named_scenarios(data, path):
+    """``[(name, scenario dict)]`` from one file's contents
+
+    A file holds one scenario, a mapping of names to scenarios, or a list of
+    scenarios each with an optional ``name``.
+    """
+    if isinstance(data, list):
+        return [(item.get('name', f"{path.stem}[{i}]") if isinstance(item, dict) else f"{path.stem}[{i}]", item)
+                for i, item in enumerate(data)]
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: expected a scenario, a mapping of scenarios or a list of them")
+    if _SCENARIO_KEYS & set(data) or not data:
+        return [(data.get('name', path.stem), data)]
+    return list(data.items())
+
+
+def load_scenarios(paths):
+    """``[(name, source file, Scenario)]`` from scenario files and directories of them"""
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(p for p in path.iterdir() if p.suffix in SCENARIO_SUFFIXES))
+        elif path.exists():
+            files.append(path)
+        else:
+            raise ValueError(f"{path}: no such file or directory")
+    scenarios = []
+    for path in files:
+        for name, data in _named_scenarios(_read_file(path), path):
+            if not isinstance(data, dict):
+                raise ValueError(f"{path}: scenario {name!r} is not a mapping")
+            try:
+                scenario = Scenario.from_dict(data)
+            except (TypeError, KeyError, ValueError) as exc:
+                raise ValueError(f"{path}: scenario {name!r}: {exc}") from exc
+            scenarios.append((str(name), str(path), scenario))
+    return scenarios
+
+
+def input_hash(scenario):
+    """Stable hash of every input behind a scenario's results"""
+    payload = json.dumps([RESULTS_VERSION, scenario.to_dict()], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+# ==================== EVALUATION ====================
+def summarize(a, projection, partnership):
+    """Headline results for assumptions ``a`` and their cashflow projection"""
+    value = business_value(projection)
+    flows = equity_flows(projection.cash_flow, partnership.profit_distribution_pct, a.equity, value)
+    breakeven = projection.breakeven_month
+    return {
+        'Initial Capital': a.initial_capital,
+        'Loans': a.debt,
+        'Partner Equity': a.equity,
+        'Monthly Fixed Costs': a.total_monthly_fixed,
+        'Variable Cost %': a.variable_cost_pct,
+        'Months': a.months,
+        'Breakeven Month': breakeven if breakeven else np.nan,
+        'Total Revenue': projection.revenue.sum(),
+        'Total Profit': projection.profit.sum(),
+        'Lowest Cumulative Cash': projection.cumulative.min(),
+        'Final Cumulative Cash': projection.cumulative[-1],
+        'Min DSCR': projection.min_dscr if projection.min_dscr is not None else np.nan,
+        'Equity IRR %': float(annual_irr(flows)),
+        'Equity MOIC': float(moic(flows)),
+        'Equity NPV': float(npv(flows, partnership.discount_rate_pct)),
+        'Business Value': value,
+    }
+
+
+def evaluate(scenario):
+    """Headline results and the monthly cashflow table for one scenario"""
+    a = scenario.assumptions
+    projection = project_cashflow(a)
+    return summarize(a, projection, scenario.partnership), projection.to_frame(month_labels(a.calendar, a.months))
+
+
+def evaluate_chunk(items, monthly=False):
+    """Results for ``[(input hash, scenario dict)]``, run in a worker process"""
+    summaries, tables = [], []
+    for key, data in items:
+        summary, table = evaluate(Scenario.from_dict(data))
+        summaries.append({'Input Hash': key, **summary})
+        if monthly:
+            table.insert(0, 'Input Hash', key)
+            tables.append(table)
+    return pd.DataFrame(summaries), pd.concat(tables, ignore_index=True) if tables else None
+
+
+# ==================== RESULTS ====================
+def _write(frame, path):
+    """Write a frame as Parquet or CSV by the file suffix"""
+    if path.suffix == '.parquet':
+        frame.to_parquet(path, index=False)
+    else:
+        frame.to_csv(path, index=False)
+
+
+def _read_parts(parts, kind, fmt):
+    """Every checkpointed ``kind`` ('summary' or 'monthly') result, oldest part first"""
+    files = sorted(parts.glob(f"{kind}-*.{fmt}"))
+    if not files:
+        return None
+    if fmt == 'parquet':
+        return pd.concat([pd.read_parquet(path) for path in files], ignore_index=True)
+    # A hex hash of only digits, or digits and one 'e', would otherwise be read back as a number
+    return pd.concat([pd.read_csv(path, dtype={'Input Hash': str}) for path in files], ignore_index=True)
+
+
+def run_batch(scenarios, out, fmt='parquet', jobs=None, monthly=False, force=False, log=print):
+    """Project every ``(name, source, Scenario)`` not already in ``out`` and write the combined results
+
+    Returns the summary frame, one row per scenario in ``scenarios``.
+    """
+    out = Path(out)
+    parts = out / 'parts'
+    parts.mkdir(parents=True, exist_ok=True)
+    keys = [input_hash(scenario) for _, _, scenario in scenarios]
+
+    done = set()
+    if not force:
+        existing = _read_parts(parts, 'summary', fmt)
+        if existing is not None:
+            done = set(existing['Input Hash'])
+        if monthly:
+            # Results from runs without --monthly have no monthly table to reuse
+            tables = _read_parts(parts, 'monthly', fmt)
+            done &= set(tables['Input Hash']) if tables is not None else set()
+    pending = {}
+    for key, (_, _, scenario) in zip(keys, scenarios):
+        if key not in done and key not in pending:
+            pending[key] = scenario.to_dict()
+    log(f"{len(scenarios)} scenarios, {len(scenarios) - len(pending)} already have results, "
+        f"{len(pending)} to run")
+
+    chunks = [list(pending.items())[i:i + CHUNK_SIZE] for i in range(0, len(pending), CHUNK_SIZE)]
+    run = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+    jobs = jobs or os.cpu_count() or 1
+
+    def save(number, summary, table):
+        _write(summary, parts / f"summary-{run}-{number:05d}.{fmt}")
+        if table is not None:
+            _write(table, parts / f"monthly-{run}-{number:05d}.{fmt}")
+
+    completed = 0
+    if jobs == 1 or len(chunks) <= 1:
+        for number, chunk in enumerate(chunks):
+            save(number, *evaluate_chunk(chunk, monthly))
+            completed += len(chunk)
+            log(f"{completed}/{len(pending)} done")
+    elif chunks:
+        # Spawned workers only import brewery.batch and the model, never Streamlit
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(jobs, len(chunks)), mp_context=context) as pool:
+            futures = {pool.submit(evaluate_chunk, chunk, monthly): (number, len(chunk))
+                       for number, chunk in enumerate(chunks)}
+            for future in as_completed(futures):
+                number, size = futures[future]
+                save(number, *future.result())
+                completed += size
+                log(f"{completed}/{len(pending)} done")
+
+    # Latest result per hash, labelled with this run's names
+    results = _read_parts(parts, 'summary', fmt).drop_duplicates('Input Hash', keep='last')
+    names = pd.DataFrame({'Scenario': [name for name, _, _ in scenarios],
+                          'Source': [source for _, source, _ in scenarios], 'Input Hash': keys})
+    summary = names.merge(results, on='Input Hash', how='left')
+    _write(summary, out / f"summary.{fmt}")
+    if monthly:
+        tables = _read_parts(parts, 'monthly', fmt)
+        latest = tables.drop_duplicates(['Input Hash', 'Month'], keep='last')
+        _write(names.merge(latest, on='Input Hash'), out / f"monthly.{fmt}")
+    log(f"Wrote {out / f'summary.{fmt}'}" + (f" and {out / f'monthly.{fmt}'}" if monthly else ""))
+    return summary
+
+
+# ==================== COMMAND LINE ====================
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(prog="python -m brewery.batch",
+                                     description="Project brewery scenario files and write the results")
+    parser.add_argument('paths', nargs='*', help="scenario JSON/YAML files, or directories of them")
+    parser.add_argument('--saved', metavar='USER', help="also run every scenario USER saved in the app")
+    parser.add_argument('--db', help="scenario database for --saved (default: BREWERY_DB or scenarios.db)")
+    parser.add_argument('--out', default='batch_results', help="results directory (default: batch_results)")
+    parser.add_argument('--format', choices=FORMATS, default='parquet', help="results file format")
+    parser.add_argument('--jobs', type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument('--monthly', action='store_true', help="also write every scenario's monthly cashflow")
+    parser.add_argument('--force', action='store_true', help="recompute scenarios that already have results")
+    args = parser.parse_args(argv)
+
+    def log(message):
+        print(message, file=sys.stderr)
+
+    try:
+        scenarios = load_scenarios(args.paths)
+        if args.saved:
+            from brewery.store import DEFAULT_PATH, ScenarioStore
+            store = ScenarioStore(args.db or DEFAULT_PATH)
+            saved = store.load_many(args.saved, [name for name, _ in store.list(args.saved)])
+            scenarios += [(name, f"saved:{args.saved}", scenario) for name, scenario in saved.items()]
+    except (ValueError, TypeError, KeyError, OSError) as exc:
+        log(f"error: {exc}")
+        return 1
+    if not scenarios:
+        log("error: no scenarios given")
+        return 1
+    run_batch(scenarios, args.out, args.format, args.jobs, args.monthly, args.force, log)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
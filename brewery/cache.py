@@ -0,0 +1,210 @@
+"""Streamlit-cached wrappers around the projection engine and chart builders
+
+Streamlit reruns the whole script on every widget interaction. Each stage of
+the model is cached separately and keyed only on the inputs it depends on, so
+moving one slider recomputes just the stages downstream of it. ``st.cache_data``
+is shared across sessions, so partners working on the same numbers share hits;
+``max_entries`` bounds memory and evicts the least recently used results.
+"""
+import functools
+
+import streamlit as st
+
+from brewery import charts, instrument
+from brewery.actuals import ActualsStore, plan_vs_actual
+from brewery.capacity import configuration_grid, monthly_demand, simulate_schedule, sustainable_capacity
+from brewery.compare import compare_scenarios
+from brewery.costs import cost_breakdown
+from brewery.montecarlo import stored_simulation
+from brewery.projection import (GROWTH_DECAY, distribution_waterfall, fixed_expense_breakdown, horizon_label,
+                                month_labels, partner_returns, project_cashflow, revenue_forecast, revenue_path,
+                                seasonal_multipliers, supply_shares)
+from brewery.results import ResultStore
+
+# Maximum cached results per stage before the oldest entries are evicted
+MAX_ENTRIES = 256
+
+
+def counted_cache(max_entries=MAX_ENTRIES):
+    """``st.cache_data`` that reports every call and every miss to the instrumentation layer"""
+    def decorate(func):
+        @functools.wraps(func)
+        def compute(*args, **kwargs):
+            instrument.count(func.__name__, 'misses')
+            return func(*args, **kwargs)
+
+        cached = st.cache_data(max_entries=max_entries, show_spinner=False)(compute)
+
+        @functools.wraps(func)
+        def call(*args, **kwargs):
+            instrument.count(func.__name__, 'calls')
+            return cached(*args, **kwargs)
+
+        call.clear = cached.clear
+        return call
+    return decorate
+
+
+# ==================== MODEL STAGES ====================
+@counted_cache()
+def cached_revenue_forecast(mix, monthly_growth_pct, months=12, growth_decay=GROWTH_DECAY, calendar=None):
+    """Cached monthly revenue forecast by channel"""
+    return revenue_forecast(mix, monthly_growth_pct, months, growth_decay, calendar)
+
+
+@counted_cache()
+def cached_growth_path(monthly_growth_pct, months, growth_decay):
+    """Cached compounding growth index (1.0 in month 1), before seasonality"""
+    return revenue_path(1.0, monthly_growth_pct, months, growth_decay)
+
+
+@counted_cache()
+def cached_seasonality(calendar, months):
+    """Cached per-month revenue multipliers from the seasonal index and events"""
+    return seasonal_multipliers(calendar, months)
+
+
+@counted_cache()
+def cached_cashflow(assumptions):
+    """Cached cashflow projection for a set of assumptions
+
+    Built from the cached growth and seasonality stages, so editing the
+    seasonal profile or event calendar reuses the growth path and only the
+    multiply and cashflow sums rerun.
+    """
+    a = assumptions
+    revenue = (a.starting_monthly_revenue * cached_growth_path(a.monthly_revenue_growth, a.months, a.growth_decay)
+               * cached_seasonality(a.calendar, a.months))
+    if a.supply_share:
+        # Padded or cut to the horizon exactly as the uncached projection does
+        revenue = revenue * supply_shares(a)
+    return project_cashflow(a, revenue)
+
+
+@counted_cache()
+def cached_expense_breakdown(assumptions):
+    """Cached fixed expense breakdown table"""
+    return fixed_expense_breakdown(assumptions)
+
+
+@counted_cache()
+def cached_cost_breakdown(mix, costs, start_month):
+    """Cached variable cost lines for one month at the Sales Volume mix"""
+    return cost_breakdown(mix, costs, 1.0, start_month)
+
+
+@counted_cache()
+def cached_partner_returns(assumptions, partnership):
+    """Cached per-partner ROI table, reusing the cached cashflow projection"""
+    return partner_returns(cached_cashflow(assumptions), partnership, assumptions.equity)
+
+
+@counted_cache()
+def cached_distribution_waterfall(assumptions, partnership):
+    """Cached total paid to each partner from each waterfall tier"""
+    return distribution_waterfall(cached_cashflow(assumptions), partnership, assumptions.equity)
+
+
+@counted_cache(32)
+def cached_plan_vs_actual(actuals, mix, assumptions):
+    """Cached planned and actual units and revenue per channel and month"""
+    return plan_vs_actual(actuals, mix, assumptions)
+
+
+@counted_cache(32)
+def cached_comparison(named_scenarios):
+    """Cached batched projection of several scenarios"""
+    return compare_scenarios(named_scenarios)
+
+
+# ==================== FIGURES ====================
+@counted_cache()
+def cached_revenue_forecast_chart(mix, monthly_growth_pct, months=12, growth_decay=GROWTH_DECAY, calendar=None):
+    """Cached revenue forecast chart"""
+    return charts.revenue_forecast_chart(cached_revenue_forecast(mix, monthly_growth_pct, months, growth_decay,
+                                                                 calendar))
+
+
+@counted_cache()
+def cached_expense_pie(assumptions):
+    """Cached fixed expense pie chart"""
+    return charts.fixed_expense_pie(cached_expense_breakdown(assumptions))
+
+
+@counted_cache()
+def cached_pnl_waterfall(revenue, variable_costs, fixed_costs):
+    """Cached profit & loss waterfall"""
+    return charts.pnl_waterfall(revenue, variable_costs, fixed_costs)
+
+
+@counted_cache()
+def cached_cashflow_chart(assumptions):
+    """Cached cumulative cashflow chart"""
+    projection = cached_cashflow(assumptions)
+    frame = projection.to_frame(month_labels(assumptions.calendar, assumptions.months))
+    return charts.cumulative_cashflow_chart(frame, projection.breakeven_month)
+
+
+@counted_cache()
+def cached_partner_returns_chart(assumptions, partnership):
+    """Cached partner investment and returns chart"""
+    return charts.partner_returns_chart(cached_partner_returns(assumptions, partnership),
+                                        horizon_label(assumptions.months))
+
+
+@counted_cache(32)
+def cached_comparison_chart(named_scenarios):
+    """Cached multi-scenario comparison chart"""
+    return charts.scenario_comparison_chart(cached_comparison(named_scenarios))
+
+
+# ==================== SIMULATION ====================
+def cached_simulation(assumptions, risk, paths, seed):
+    """Monte Carlo summary from the shared result store; raw path matrices are never kept"""
+    return stored_simulation(result_store(), assumptions, risk, paths, seed)
+
+
+@counted_cache(32)
+def cached_schedule(brewhouse, mix, assumptions):
+    """Cached demand-following brew schedule plus flat-out capacity and its schedule"""
+    start_month = assumptions.calendar.start_month
+    result = simulate_schedule(brewhouse, monthly_demand(mix, assumptions), start_month)
+    return result, *sustainable_capacity(brewhouse, start_month, min(assumptions.months, 12))
+
+
+@counted_cache(16)
+def cached_configuration_grid(brewhouse, mix, assumptions, fermenters, brite_tanks):
+    """Cached lost sales % and capacity over fermenter and brite-tank counts"""
+    return configuration_grid(brewhouse, monthly_demand(mix, assumptions), assumptions.calendar.start_month,
+                              fermenters, brite_tanks)
+
+
+# ==================== OPTIMIZATION ====================
+@counted_cache(64)
+def cached_mix_optimum(mix, limits, value_factor=1.0, peak_factor=1.0):
+    """Cached LP product mix and shadow prices"""
+    # Imported here so SciPy only loads once someone opens Revenue Projections
+    from brewery.optimizer import optimize_mix
+    return optimize_mix(mix, limits, value_factor, peak_factor)
+
+
+# ==================== BACKGROUND SERVICES ====================
+@st.cache_resource
+def actuals_store():
+    """Imported POS totals shared by every session on this server"""
+    return ActualsStore()
+
+
+@st.cache_resource
+def result_store():
+    """Sweep and simulation results shared by every session on this server, read memory-mapped"""
+    return ResultStore()
+
+
+@st.cache_resource
+def report_service():
+    """PDF report renderer shared by every session on this server"""
+    # Imported here so reportlab only loads once someone opens the Dashboard
+    from brewery.report import ReportService
+    return ReportService()
+
@@ -0,0 +1,217 @@
+"""Discrete-event brew-schedule simulator for brewhouse and cellar capacity
+
+Each batch is brewed on a brew day into a free fermenter, moves to a brite tank
+when fermentation ends (holding its fermenter while every brite tank is full)
+and is packaged into inventory when conditioning ends. Events sit on a heap
+keyed by day, so a simulation costs a few heap operations per batch rather than
+a pass over every tank every day.
+
+Demand drains inventory continuously. Inventory only rises at packaging
+events, so between two events the sales are settled in closed form from
+cumulative daily demand; whatever inventory cannot cover is a lost sale.
+Brewing follows demand: a brew day is used when a fermenter is free and
+inventory plus beer in process falls short of the demand expected before a
+new batch could be packaged.
+"""
+import heapq
+from collections import deque
+from dataclasses import dataclass, replace
+from functools import lru_cache
+
+import numpy as np
+
+from brewery.costs import demand_index
+
+# System size, fermenters and brite tanks an equipment budget buys:
+# (minimum budget, batch BBL, fermenters, brite tanks)
+EQUIPMENT_TIERS = (
+    (0, 3.5, 4, 1),
+    (100000, 7.0, 6, 2),
+    (200000, 10.0, 8, 3),
+    (350000, 15.0, 10, 4),
+)
+
+# Days of demand kept in stock on top of the brewing lead time
+COVER_DAYS = 14
+
+# Event kinds, in the order they are handled on the same day
+_CLOSE, _PACKAGE, _TRANSFER, _BREW = range(4)
+
+
+@dataclass(frozen=True)
+class ScheduleResult:
+    """Monthly volumes (BBL) and resource use from one simulated schedule"""
+    demand: np.ndarray
+    produced: np.ndarray
+    sold: np.ndarray
+    lost: np.ndarray
+    brews: int
+    brewhouse_use: float    # share of brew days used
+    fermenter_use: float    # share of fermenter-days occupied, including beer held for a brite tank
+    brite_use: float        # share of brite-tank-days occupied
+    fermenter_held: float   # share of fermenter-days spent holding finished beer for a brite tank
+
+    @property
+    def fill_rate(self):
+        """Share of each month's demand that was sold"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self.lost > 0, 1 - self.lost / self.demand, 1.0)
+
+    @property
+    def lost_pct(self):
+        """Lost sales as a % of total demand"""
+        total = self.demand.sum()
+        return float(self.lost.sum() / total * 100) if total > 0 else 0.0
+
+    @property
+    def bottleneck(self):
+        """Resource that limits output: 'Brite Tanks', 'Fermenters' or 'Brewhouse'"""
+        if self.fermenter_held > 0.02:
+            return "Brite Tanks"
+        return "Fermenters" if self.fermenter_use - self.fermenter_held >= self.brewhouse_use else "Brewhouse"
+
+
+def sized_for_budget(brewhouse, equipment_cost):
+    """The brewhouse with system size and tank counts from the equipment budget, if auto-sized"""
+    if not brewhouse.auto_size:
+        return brewhouse
+    _, batch_bbl, fermenters, brite_tanks = [tier for tier in EQUIPMENT_TIERS if equipment_cost >= tier[0]][-1]
+    return replace(brewhouse, batch_bbl=batch_bbl, fermenters=fermenters, brite_tanks=brite_tanks)
+
+
+def monthly_demand(mix, assumptions):
+    """BBL demanded each projected month: the Sales Volume mix at the cashflow's uncapped sales volumes"""
+    return mix.total_bbls * demand_index(mix, assumptions)
+
+
+def simulate_schedule(brewhouse, demand, start_month, follow_demand=True):
+    """Simulate daily brewing, fermentation, conditioning and sales against monthly ``demand``
+
+    The schedule starts a lead time before ``start_month`` so the cellar can
+    fill before opening. With ``follow_demand`` off every free fermenter is
+    filled on every brew day, which measures what the cellar can produce flat out.
+    """
+    b = brewhouse
+    demand = np.asarray(demand, dtype=float)
+    months = len(demand)
+    lead = b.ferment_days + b.condition_days
+    preopen = lead if follow_demand else 0
+    packaged = b.batch_bbl * b.yield_pct / 100
+
+    # Day offsets of each month boundary and cumulative daily demand from the first simulated day
+    first = np.datetime64(start_month, 'M')
+    boundaries = (first + np.arange(months + 1)).astype('datetime64[D]')
+    month_days = np.diff(boundaries).astype(int)
+    closes = preopen + np.concatenate([[0], np.cumsum(month_days)])
+    days = int(closes[-1])
+    daily = np.concatenate([np.zeros(preopen), np.repeat(demand / np.maximum(month_days, 1), month_days)])
+    cumulative = np.concatenate([[0.0], np.cumsum(daily)])
+
+    # Brew days are the first ``brew_days_per_week`` weekdays, Monday first
+    opening_weekday = int((boundaries[0] - np.datetime64('1970-01-05')).astype(int) % 7)
+    day = np.arange(days)
+    brew_days = day[(opening_weekday - preopen + day) % 7 < b.brew_days_per_week]
+
+    events = [(int(close), _CLOSE, 0) for close in closes]
+    events += [(int(brew_day), _BREW, 0) for brew_day in brew_days]
+    heapq.heapify(events)
+
+    free_fermenters, free_brites = b.fermenters, b.brite_tanks
+    held = deque()    # days that batches finished fermenting while waiting for a brite tank
+    inventory = in_process = 0.0
+    produced, sold, lost = np.zeros(months), np.zeros(months), np.zeros(months)
+    month, settled = -1, 0
+    brews = slots = 0
+    fermenter_days = brite_days = held_days = 0.0
+
+    while events:
+        today, kind, _ = heapq.heappop(events)
+
+        # Sell from inventory for the demand since the last event
+        if today > settled:
+            wanted = cumulative[today] - cumulative[settled]
+            sale = min(inventory, wanted)
+            inventory -= sale
+            if month >= 0:
+                sold[month] += sale
+                lost[month] += wanted - sale
+            settled = today
+
+        if kind == _CLOSE:
+            month += 1
+            if month == months:
+                break
+        elif kind == _PACKAGE:
+            inventory += packaged
+            in_process -= packaged
+            if month >= 0:
+                produced[month] += packaged
+            brite_days += b.condition_days
+            if held:
+                held_days += today - held.popleft()
+                fermenter_days += b.ferment_days
+                free_fermenters += 1
+                heapq.heappush(events, (today + b.condition_days, _PACKAGE, today))
+            else:
+                free_brites += 1
+        elif kind == _TRANSFER:
+            if free_brites:
+                free_brites -= 1
+                free_fermenters += 1
+                fermenter_days += b.ferment_days
+                heapq.heappush(events, (today + b.condition_days, _PACKAGE, today))
+            else:
+                held.append(today)
+        else:
+            slots += 1
+            needed = cumulative[min(today + lead + COVER_DAYS, days)] - cumulative[today]
+            if free_fermenters and (not follow_demand or inventory + in_process < needed):
+                free_fermenters -= 1
+                in_process += packaged
+                brews += 1
+                heapq.heappush(events, (today + b.ferment_days, _TRANSFER, today))
+
+    fermenter_capacity = max(b.fermenters * days, 1)
+    return ScheduleResult(
+        demand=demand, produced=produced, sold=sold, lost=lost, brews=brews,
+        brewhouse_use=brews / max(slots, 1),
+        fermenter_use=(fermenter_days + held_days) / fermenter_capacity,
+        brite_use=brite_days / max(b.brite_tanks * days, 1),
+        fermenter_held=held_days / fermenter_capacity
+    )
+
+
+def sustainable_capacity(brewhouse, start_month, months=12):
+    """Packaged BBL/month brewing flat out, once the first batches are through, and the flat-out schedule"""
+    result = simulate_schedule(brewhouse, np.zeros(months), start_month, follow_demand=False)
+    warmup = min(-(-(brewhouse.ferment_days + brewhouse.condition_days) // 28), months - 1)
+    return float(result.produced[warmup:].mean()), result
+
+
+def configuration_grid(brewhouse, demand, start_month, fermenters, brite_tanks):
+    """Lost sales % and sustainable BBL/month for every fermenter x brite-tank count
+
+    Returns two arrays of shape (len(brite_tanks), len(fermenters)).
+    """
+    lost_pct = np.empty((len(brite_tanks), len(fermenters)))
+    capacity = np.empty_like(lost_pct)
+    months = min(len(demand), 12)
+    for i, brites in enumerate(brite_tanks):
+        for j, tanks in enumerate(fermenters):
+            cellar = replace(brewhouse, fermenters=int(tanks), brite_tanks=int(brites))
+            lost_pct[i, j] = simulate_schedule(cellar, demand, start_month).lost_pct
+            capacity[i, j] = sustainable_capacity(cellar, start_month, months)[0]
+    return lost_pct, capacity
+
+
+@lru_cache(maxsize=64)
+def supply_share(brewhouse, equipment_cost, mix, assumptions):
+    """Share of each month's projected revenue the cellar can supply, for ``Assumptions.supply_share``
+
+    Lost beer sales scale down the beer share of revenue; tours, merchandise and
+    food are unaffected.
+    """
+    result = simulate_schedule(sized_for_budget(brewhouse, equipment_cost),
+                               monthly_demand(mix, assumptions), assumptions.calendar.start_month)
+    beer_share = mix.beer_revenue / mix.total_revenue if mix.total_revenue > 0 else 0.0
+    return tuple((1 - beer_share * (1 - result.fill_rate)).tolist())
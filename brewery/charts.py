@@ -0,0 +1,423 @@
+"""Plotly figure builders for the analyzer pages"""
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+# Line traces longer than this are thinned before they are sent to the browser
+MAX_LINE_POINTS = 150
+
+# Revenue forecasts longer than this are drawn as yearly bars
+MAX_MONTHLY_BARS = 36
+
+
+def downsample(x, y, max_points=MAX_LINE_POINTS):
+    """Thin a long series to each bucket's minimum and maximum point
+
+    Peaks and troughs such as the cashflow low point survive, so the line on
+    screen keeps the full series' shape at a fraction of the points.
+    """
+    x, y = np.asarray(x), np.asarray(y, dtype=float)
+    if len(y) <= max_points:
+        return x, y
+    buckets = max_points // 2
+    size = -(-len(y) // buckets)
+    padded = np.full(buckets * size, np.nan)
+    padded[:len(y)] = y
+    padded = padded.reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    lows = np.argmin(np.where(np.isnan(padded), np.inf, padded), axis=1) + offsets
+    highs = np.argmax(np.where(np.isnan(padded), -np.inf, padded), axis=1) + offsets
+    keep = np.unique(np.concatenate([[0, len(y) - 1], lows, highs]))
+    keep = keep[keep < len(y)]
+    return x[keep], y[keep]
+
+
+def downsample_index(n, max_points=MAX_LINE_POINTS):
+    """Evenly spaced indices (first and last included) for series that must share an x axis"""
+    return np.unique(np.linspace(0, n - 1, min(n, max_points)).round().astype(int))
+
+
+def revenue_forecast_chart(forecast_df):
+    """Stacked taproom/wholesale bar chart for a monthly revenue forecast"""
+    months = len(forecast_df)
+    if months > MAX_MONTHLY_BARS:
+        # Yearly totals keep long forecasts readable
+        forecast_df = forecast_df.groupby(np.arange(months) // 12).sum(numeric_only=True)
+        forecast_df['Month'] = [f"Year {year + 1}" for year in forecast_df.index]
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        name='Taproom Sales',
+        x=forecast_df['Month'],
+        y=forecast_df['Taproom'],
+        marker_color='gold'
+    ))
+
+    fig.add_trace(go.Bar(
+        name='Wholesale Distribution',
+        x=forecast_df['Month'],
+        y=forecast_df['Wholesale'],
+        marker_color='lightseagreen'
+    ))
+
+    fig.update_layout(
+        title=f"{months}-Month Revenue Projection by Channel",
+        xaxis_title="Month" if months <= MAX_MONTHLY_BARS else "Year",
+        yaxis_title="Revenue ($)",
+        barmode='stack',
+        height=500,
+        showlegend=True
+    )
+    return fig
+
+
+def seasonality_chart(labels, multipliers):
+    """Monthly revenue multipliers around the 1.0 baseline"""
+    multipliers = np.asarray(multipliers)
+    fig = go.Figure(go.Bar(
+        x=labels,
+        y=multipliers,
+        marker_color=np.where(multipliers >= 1, 'gold', 'lightslategray').tolist()
+    ))
+    fig.add_hline(y=1.0, line_dash="dash", line_color="gray")
+    fig.update_layout(
+        title="Revenue Multiplier by Month",
+        xaxis_title="Month",
+        yaxis_title="Multiplier",
+        height=350
+    )
+    return fig
+
+
+def capacity_chart(labels, result, capacity):
+    """Monthly beer sold and lost against demand and sustainable capacity (BBL)"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(name='Sold', x=labels, y=result.sold, marker_color='gold'))
+    fig.add_trace(go.Bar(name='Lost Sales', x=labels, y=result.lost, marker_color='indianred'))
+    fig.add_trace(go.Scatter(name='Demand', x=labels, y=result.demand, mode='lines',
+                             line=dict(color='black', dash='dot')))
+    fig.add_hline(y=capacity, line_dash="dash", line_color="lightseagreen",
+                  annotation_text="Sustainable Capacity", annotation_position="top left")
+    fig.update_layout(
+        title="Monthly Beer Sales vs Brewing Capacity",
+        xaxis_title="Month",
+        yaxis_title="Barrels (BBL)",
+        barmode='stack',
+        height=450
+    )
+    return fig
+
+
+def plan_vs_actual_chart(monthly):
+    """Actual monthly revenue bars against the projected revenue line"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        name='Actual', x=monthly['Month'], y=monthly['Actual Revenue'],
+        marker_color=np.where(monthly['Revenue Variance'] >= 0, 'gold', 'indianred').tolist()
+    ))
+    fig.add_trace(go.Scatter(name='Plan', x=monthly['Month'], y=monthly['Planned Revenue'], mode='lines+markers',
+                             line=dict(color='black', dash='dot')))
+    fig.update_layout(
+        title="Actual vs Planned Revenue",
+        xaxis_title="Month",
+        yaxis_title="Revenue ($)",
+        height=400
+    )
+    return fig
+
+
+def reforecast_chart(labels, plan, reforecast, observed):
+    """Planned and re-forecast monthly revenue, with the ``observed`` months' actuals as markers"""
+    observed = np.asarray(sorted(observed), dtype=int)
+    labels = np.asarray(labels)
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(name='Plan', x=labels, y=plan, mode='lines', line=dict(color='gray', dash='dot')))
+    fig.add_trace(go.Scatter(name='Re-forecast', x=labels, y=reforecast, mode='lines',
+                             line=dict(color='darkgoldenrod', width=3)))
+    fig.add_trace(go.Scatter(name='Actual', x=labels[observed], y=np.asarray(reforecast)[observed],
+                             mode='markers', marker=dict(color='black', size=7)))
+    fig.update_layout(
+        title="Monthly Revenue: Plan vs Rolling Re-forecast",
+        xaxis_title="Month",
+        yaxis_title="Revenue ($)",
+        height=400
+    )
+    return fig
+
+
+def debt_service_chart(labels, interest, principal, balance):
+    """Interest and principal payments as stacked bars, with the loan balance still owed"""
+    months = len(interest)
+    interest, principal, balance = (np.asarray(values, dtype=float) for values in (interest, principal, balance))
+    if months > MAX_MONTHLY_BARS:
+        # Yearly totals and year-end balances keep long horizons readable
+        years = np.arange(months) // 12
+        interest, principal = np.bincount(years, interest), np.bincount(years, principal)
+        balance = balance[np.minimum(np.arange(12, months + 12, 12), months) - 1]
+        labels = [f"Year {year + 1}" for year in range(len(balance))]
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig.add_trace(go.Bar(name='Interest', x=labels, y=interest, marker_color='indianred'))
+    fig.add_trace(go.Bar(name='Principal', x=labels, y=principal, marker_color='darkgoldenrod'))
+    fig.add_trace(go.Scatter(name='Balance Owed', x=labels, y=balance, mode='lines',
+                             line=dict(color='black', width=2)), secondary_y=True)
+    fig.update_layout(
+        title="Debt Service and Loan Balance",
+        xaxis_title="Month" if months <= MAX_MONTHLY_BARS else "Year",
+        barmode='stack',
+        height=450,
+        hovermode='x unified'
+    )
+    fig.update_yaxes(title_text="Payments ($)", secondary_y=False)
+    fig.update_yaxes(title_text="Balance Owed ($)", secondary_y=True)
+    return fig
+
+
+def fixed_expense_pie(fixed_expenses):
+    """Pie chart of monthly fixed expenses by category"""
+    return px.pie(fixed_expenses, values='Monthly Cost', names='Expense Category',
+                  title='Fixed Expense Distribution',
+                  color_discrete_sequence=px.colors.sequential.YlOrBr)
+
+
+def pnl_waterfall(revenue, variable_costs, fixed_costs):
+    """Monthly profit & loss waterfall"""
+    profit = revenue - variable_costs - fixed_costs
+    fig = go.Figure(go.Waterfall(
+        name="Cost Structure",
+        orientation="v",
+        measure=["relative", "relative", "relative", "total"],
+        x=["Revenue", "Variable Costs", "Fixed Costs", "Net Profit"],
+        y=[revenue, -variable_costs, -fixed_costs, profit],
+        text=[f"${revenue:,.0f}", f"-${variable_costs:,.0f}",
+             f"-${fixed_costs:,.0f}", f"${profit:,.0f}"],
+        textposition="outside",
+        connector={"line": {"color": "rgb(63, 63, 63)"}},
+    ))
+
+    fig.update_layout(
+        title="Monthly Profit & Loss Waterfall",
+        showlegend=False,
+        height=500
+    )
+    return fig
+
+
+def cumulative_cashflow_chart(cashflow_df, breakeven_month=None):
+    """Cumulative cashflow line with breakeven marker, hover-dated if the frame has a Date column"""
+    fig = go.Figure()
+    months, cumulative = downsample(cashflow_df['Month'], cashflow_df['Cumulative Cashflow'])
+    dates = cashflow_df['Date'].to_numpy()[months - 1] if 'Date' in cashflow_df else None
+
+    fig.add_trace(go.Scatter(
+        x=months,
+        y=cumulative,
+        text=dates,
+        hovertemplate="Month %{x} (%{text}): $%{y:,.0f}<extra></extra>" if dates is not None else None,
+        mode='lines',
+        name='Cumulative Cashflow',
+        line=dict(color='darkgoldenrod', width=3),
+        fill='tozeroy',
+        fillcolor='rgba(218, 165, 32, 0.3)'
+    ))
+
+    # Add breakeven line
+    fig.add_hline(y=0, line_dash="dash", line_color="red",
+                 annotation_text="Breakeven", annotation_position="right")
+
+    if breakeven_month:
+        fig.add_annotation(
+            x=breakeven_month,
+            y=0,
+            text=f"Breakeven: Month {breakeven_month}" + (
+                f" ({cashflow_df['Date'].iloc[breakeven_month - 1]})" if 'Date' in cashflow_df else ""),
+            showarrow=True,
+            arrowhead=2,
+            ax=40,
+            ay=-40
+        )
+
+    fig.update_layout(
+        title=f"{len(cashflow_df)}-Month Cumulative Cashflow Projection",
+        xaxis_title="Month",
+        yaxis_title="Cumulative Cashflow ($)",
+        height=500,
+        hovermode='x unified'
+    )
+    return fig
+
+
+def partner_returns_chart(returns_df, horizon="3-Year"):
+    """Grouped bars of investment, cash returns and equity value per partner"""
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        name='Initial Investment',
+        x=returns_df['Partner'],
+        y=returns_df['Initial Investment'],
+        marker_color='indianred'
+    ))
+
+    fig.add_trace(go.Bar(
+        name=f'{horizon} Cash Returns',
+        x=returns_df['Partner'],
+        y=returns_df['Cash Distributions'],
+        marker_color='gold'
+    ))
+
+    fig.add_trace(go.Bar(
+        name='Equity Value (Est.)',
+        x=returns_df['Partner'],
+        y=returns_df['Ownership Value'],
+        marker_color='lightseagreen'
+    ))
+
+    fig.update_layout(
+        title=f"Investment, Returns & Equity Value ({horizon})",
+        xaxis_title="Partner",
+        yaxis_title="Amount ($)",
+        barmode='group',
+        height=400
+    )
+    return fig
+
+
+def cashflow_fan_chart(result):
+    """Percentile fan of simulated cumulative cashflow"""
+    keep = downsample_index(result.percentiles.shape[-1])
+    p5, p25, p50, p75, p95 = result.percentiles[:, keep]
+    months = keep + 1
+    fig = go.Figure()
+
+    for low, high, label, opacity in [(p5, p95, '5th-95th percentile', 0.2),
+                                      (p25, p75, '25th-75th percentile', 0.4)]:
+        fig.add_trace(go.Scatter(x=months, y=high, mode='lines', line=dict(width=0),
+                                 showlegend=False, hoverinfo='skip'))
+        fig.add_trace(go.Scatter(
+            x=months, y=low, mode='lines', line=dict(width=0),
+            fill='tonexty', fillcolor=f'rgba(218, 165, 32, {opacity})', name=label
+        ))
+
+    fig.add_trace(go.Scatter(x=months, y=p50, mode='lines', name='Median',
+                             line=dict(color='darkgoldenrod', width=3)))
+
+    fig.add_hline(y=0, line_dash="dash", line_color="red",
+                 annotation_text="Breakeven", annotation_position="right")
+
+    fig.update_layout(
+        title=f"Simulated Cumulative Cashflow ({result.paths:,} paths)",
+        xaxis_title="Month",
+        yaxis_title="Cumulative Cashflow ($)",
+        height=500,
+        hovermode='x unified'
+    )
+    return fig
+
+
+def breakeven_histogram(result):
+    """Distribution of simulated breakeven month"""
+    months = result.breakeven_months
+    horizon = len(result.percentiles[0])
+    counts = np.bincount(months, minlength=horizon + 1)
+    labels = [f"Month {m}" for m in range(1, horizon + 1)] + [f"After {horizon}"]
+    share = np.append(counts[1:], counts[0]) / len(months) * 100
+
+    fig = go.Figure(go.Bar(x=labels, y=share, marker_color='lightseagreen'))
+    fig.update_layout(
+        title="Breakeven Month Distribution",
+        xaxis_title="Breakeven Month",
+        yaxis_title="Share of Paths (%)",
+        height=400
+    )
+    return fig
+
+
+def sweep_heatmap(values, x_values, y_values, x_label, y_label, metric_label):
+    """Heatmap of a sweep metric over two swept inputs"""
+    fig = go.Figure(go.Heatmap(
+        z=values,
+        x=x_values,
+        y=y_values,
+        colorscale='YlOrBr',
+        colorbar=dict(title=metric_label),
+        hovertemplate=f"{x_label}: %{{x}}<br>{y_label}: %{{y}}<br>{metric_label}: %{{z:,.1f}}<extra></extra>"
+    ))
+    fig.update_layout(
+        title=f"{metric_label} by {x_label} and {y_label}",
+        xaxis_title=x_label,
+        yaxis_title=y_label,
+        height=500
+    )
+    return fig
+
+
+def tornado_chart(tornado_df, metric_label):
+    """Horizontal bars showing each input's low/high swing around the base case"""
+    base = tornado_df['Base'].iloc[0] if len(tornado_df) else 0
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        name='Low Value',
+        y=tornado_df['Input'],
+        x=tornado_df['Low'] - base,
+        base=base,
+        orientation='h',
+        marker_color='indianred'
+    ))
+
+    fig.add_trace(go.Bar(
+        name='High Value',
+        y=tornado_df['Input'],
+        x=tornado_df['High'] - base,
+        base=base,
+        orientation='h',
+        marker_color='lightseagreen'
+    ))
+
+    fig.update_layout(
+        title=f"Sensitivity of {metric_label}",
+        xaxis_title=metric_label,
+        barmode='overlay',
+        height=max(300, 60 * len(tornado_df) + 150)
+    )
+    return fig
+
+
+def scenario_comparison_chart(comparison):
+    """Cumulative cashflow and partner ROI curves for several scenarios on shared month axes"""
+    fig = make_subplots(rows=2, cols=1, shared_xaxes=True, vertical_spacing=0.08,
+                        subplot_titles=("Cumulative Cashflow", "Partner Cash ROI"))
+    months = comparison.months
+    colors = px.colors.qualitative.Dark24
+    roi = comparison.roi_curves
+
+    for i, name in enumerate(comparison.names):
+        color = colors[i % len(colors)]
+        x, y = downsample(months, comparison.cumulative[i])
+        fig.add_trace(go.Scatter(x=x, y=y, mode='lines', name=name,
+                                 legendgroup=name, line=dict(color=color)), row=1, col=1)
+        x, y = downsample(months, roi[i])
+        fig.add_trace(go.Scatter(x=x, y=y, mode='lines', name=name, legendgroup=name,
+                                 showlegend=False, line=dict(color=color)), row=2, col=1)
+
+    # One marker trace for every breakeven point keeps the figure light at 50+ scenarios
+    breakeven = comparison.breakeven_months
+    reached = np.flatnonzero(breakeven)
+    fig.add_trace(go.Scatter(
+        x=breakeven[reached], y=np.zeros(len(reached)), mode='markers', name='Breakeven',
+        marker=dict(symbol='diamond', size=10, color='red'),
+        text=[comparison.names[i] for i in reached],
+        hovertemplate="%{text}: breaks even in month %{x}<extra></extra>"
+    ), row=1, col=1)
+
+    fig.add_hline(y=0, line_dash="dash", line_color="red", row=1, col=1)
+    fig.add_hline(y=0, line_dash="dash", line_color="gray", row=2, col=1)
+    fig.update_yaxes(title_text="Cumulative Cashflow ($)", row=1, col=1)
+    fig.update_yaxes(title_text="Cash ROI (%)", row=2, col=1)
+    fig.update_xaxes(title_text="Month", row=2, col=1)
+    fig.update_layout(
+        title=f"Scenario Comparison ({len(comparison.names)} scenarios)",
+        height=800,
+        hovermode='x'
+    )
+    return fig
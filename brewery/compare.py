@@ -0,0 +1,119 @@
+"""Side-by-side evaluation of many scenarios in one batched pass
+
+Each scenario's cashflow inputs are stacked into 1-D arrays and pushed through
+``cashflow_arrays`` together, producing (scenarios x months) matrices. Comparing
+fifty plans costs one vectorized projection rather than fifty.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from brewery.debt import debt_service
+from brewery.projection import VALUATION_MULTIPLE, breakeven_month, cashflow_arrays, revenue_multipliers
+from brewery.returns import annual_irr, distribution_schedule, equity_flows
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Monthly projections for several named scenarios, one row per scenario"""
+    names: tuple
+    revenue: np.ndarray
+    profit: np.ndarray
+    cumulative: np.ndarray
+    initial_capital: np.ndarray
+    distribution_pct: np.ndarray
+    debt: np.ndarray          # loan principal drawn at opening
+    principal: np.ndarray     # loan principal repaid each month
+
+    @property
+    def equity(self):
+        """Initial capital the partners fund after loan proceeds"""
+        return np.maximum(self.initial_capital - self.debt, 0.0)
+
+    @property
+    def months(self):
+        """1-based month numbers shared by every row"""
+        return np.arange(1, self.revenue.shape[-1] + 1)
+
+    @property
+    def breakeven_months(self):
+        """Breakeven month per scenario, 0 where it never breaks even"""
+        return breakeven_month(np.nan_to_num(self.cumulative, nan=-np.inf))
+
+    @property
+    def roi_curves(self):
+        """Partners' cumulative cash ROI % by month; equal for every partner in a scenario"""
+        cash_flow = np.nan_to_num(self.profit - self.principal)
+        distributed = np.cumsum(distribution_schedule(cash_flow, self.distribution_pct), axis=-1)
+        equity = self.equity[:, None]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            roi = np.where(equity > 0, (distributed / equity - 1) * 100, 0.0)
+        return np.where(np.isnan(self.profit), np.nan, roi)
+
+    def summary(self):
+        """Headline metrics per scenario"""
+        breakeven = self.breakeven_months
+        last = (~np.isnan(self.profit)).sum(axis=-1) - 1
+        offset = last[:, None] - np.arange(self.revenue.shape[-1])
+        final_year = (offset >= 0) & (offset < 12)
+        owed = self.debt - np.nansum(self.principal, axis=-1)
+        value = np.where(final_year, self.revenue, 0).sum(axis=-1) * VALUATION_MULTIPLE - owed
+        # Each row exits at the end of its own horizon; every IRR is solved in one batch
+        cash_flow = np.nan_to_num(self.profit - self.principal)
+        flows = equity_flows(cash_flow, self.distribution_pct, self.equity, value, horizon=last + 1)
+        retained = cash_flow.sum(axis=-1) - distribution_schedule(cash_flow, self.distribution_pct).sum(axis=-1)
+        return pd.DataFrame({
+            'Scenario': list(self.names),
+            'Initial Capital': self.initial_capital,
+            'Loans': self.debt,
+            'Breakeven Month': np.where(breakeven > 0, breakeven, np.nan),
+            'Total Profit': np.nansum(self.profit, axis=-1),
+            'Partner Cash ROI %': self.roi_curves[np.arange(len(self.names)), last],
+            'Equity IRR %': annual_irr(flows),
+            'Exit Value + Retained Cash': value + retained,
+        })
+
+
+def compare_scenarios(named_scenarios):
+    """Project every scenario in ``{name: Scenario}`` together
+
+    Scenarios with a shorter horizon than the longest are padded with NaN so all
+    rows share one month axis.
+    """
+    names = tuple(named_scenarios)
+    assumptions = [scenario.assumptions for scenario in named_scenarios.values()]
+    months = max((a.months for a in assumptions), default=0)
+
+    def stack(attr):
+        return np.array([getattr(a, attr) for a in assumptions], dtype=float)
+
+    # One growth-decay curve per row, each padded with its final multiplier
+    years = max((len(a.growth_decay) for a in assumptions), default=1)
+    decay = np.array([a.growth_decay + a.growth_decay[-1:] * (years - len(a.growth_decay))
+                      for a in assumptions], dtype=float).reshape(len(assumptions), years)
+
+    # One seasonal row per scenario, computed once per distinct calendar and capacity cap
+    multipliers = {}
+    for a in assumptions:
+        key = (a.calendar, a.supply_share)
+        if key not in multipliers:
+            multipliers[key] = revenue_multipliers(a, months)
+    seasonality = np.array([multipliers[a.calendar, a.supply_share] for a in assumptions]
+                           ).reshape(len(assumptions), months)
+
+    # Every tranche of every scenario amortized together, summed into its scenario's row
+    interest, repaid = debt_service([a.loans for a in assumptions], months)
+    revenue, _, profit, cumulative = cashflow_arrays(
+        stack('starting_monthly_revenue'), stack('monthly_revenue_growth'),
+        np.array([a.total_monthly_fixed for a in assumptions], dtype=float),
+        stack('initial_capital'), stack('variable_cost_pct'), months, decay, seasonality,
+        interest, repaid, stack('debt')
+    )
+    beyond = np.arange(months) >= stack('months')[:, None]
+    revenue, profit, cumulative, repaid = (np.where(beyond, np.nan, values)
+                                           for values in (revenue, profit, cumulative, repaid))
+    distribution_pct = np.array([s.partnership.profit_distribution_pct
+                                 for s in named_scenarios.values()], dtype=float)
+    return Comparison(names, revenue, profit, cumulative, stack('initial_capital'), distribution_pct,
+                      stack('debt'), repaid)
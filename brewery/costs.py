@@ -0,0 +1,111 @@
+"""Volume-driven variable cost engine: COGS, excise, sales tax and card fees
+
+Every cost is computed from the monthly volume arrays in one vectorized pass.
+Volumes are the Sales Volume mix scaled by a volume index of shape
+(*batch, months). Federal excise is tiered on barrels removed so far in the
+calendar year: each month is taxed as the difference of the bracket schedule at
+its year-to-date total before and after the month. A year that crosses a bracket
+is therefore taxed exactly, and no month needs a loop.
+"""
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from brewery.projection import revenue_path, seasonal_multipliers, supply_shares
+
+# Federal excise for domestic brewers: (annual BBL up to, $ per BBL), 26 U.S.C. 5051
+FEDERAL_EXCISE_BRACKETS = ((60000, 3.50), (6000000, 16.00), (np.inf, 18.00))
+
+# Cost lines, in the order ``variable_costs`` stacks them
+COST_COMPONENTS = ("Beer COGS", "Packaging", "Federal Excise", "State Excise", "Sales Tax", "Card Fees",
+                   "Distribution", "Merch & Food COGS")
+
+GALLONS_PER_BBL = 31
+
+
+def _bracket_tax(bbl):
+    """Federal excise due on ``bbl`` barrels removed from the start of a calendar year"""
+    edges, rates = [0.0], []
+    for limit, rate in FEDERAL_EXCISE_BRACKETS:
+        edges.append(min(limit, 1e15))
+        rates.append(rate)
+    owed = np.concatenate([[0.0], np.cumsum(np.diff(edges) * rates)])
+    return np.interp(bbl, edges, owed)
+
+
+def federal_excise(bbl, start_month):
+    """Monthly federal excise on barrels ``bbl`` (*batch, months), brackets resetting every January"""
+    bbl = np.asarray(bbl, dtype=float)
+    month = int(start_month[5:7]) - 1 + np.arange(bbl.shape[-1])
+    before = np.cumsum(bbl, axis=-1) - bbl
+    # Barrels removed before each month in the same calendar year
+    year_start = np.maximum.accumulate(np.where(month % 12 == 0, before, 0.0), axis=-1)
+    year_to_date = before - year_start
+    return _bracket_tax(year_to_date + bbl) - _bracket_tax(year_to_date)
+
+
+def variable_costs(mix, costs, volume_index=1.0, start_month="2027-01"):
+    """Monthly cost of each of ``COST_COMPONENTS``, shape (len(COST_COMPONENTS), *batch, months)
+
+    Month ``t`` sells ``volume_index[t]`` times every Sales Volume in ``mix``.
+    """
+    index = np.atleast_1d(np.asarray(volume_index, dtype=float))
+    c = costs
+    bbl = mix.total_bbls * index
+    taproom = (mix.taproom_revenue + mix.food_revenue) * index
+    wholesale = mix.wholesale_revenue * index
+
+    tax_rate = c.sales_tax_pct / 100
+    if c.prices_include_tax:
+        sales_tax, charged = taproom * tax_rate / (1 + tax_rate), taproom
+    else:
+        # Collected on top of the price and passed straight through, but card fees apply to it
+        sales_tax, charged = np.zeros_like(taproom), taproom * (1 + tax_rate)
+    card_fees = (charged * c.taproom_card_pct + wholesale * c.wholesale_card_pct) / 100 * c.card_fee_pct / 100
+
+    return np.stack([
+        mix.beer_cogs * index,
+        mix.monthly_cases * 24 * c.packaging_per_can * index,
+        federal_excise(bbl, start_month),
+        bbl * GALLONS_PER_BBL * c.state_excise_per_gallon,
+        sales_tax,
+        card_fees,
+        wholesale * c.distribution_pct / 100,
+        (mix.monthly_merch * mix.merch_avg * c.merch_cogs_pct + mix.food_revenue * c.food_cogs_pct) / 100 * index,
+    ])
+
+
+def demand_index(mix, assumptions):
+    """Sales volumes demanded each projected month relative to the mix, before any capacity cap"""
+    a = assumptions
+    scale = a.starting_monthly_revenue / mix.total_revenue if mix.total_revenue > 0 else 0.0
+    return (scale * revenue_path(1.0, a.monthly_revenue_growth, a.months, a.growth_decay)
+            * seasonal_multipliers(a.calendar, a.months))
+
+
+def volume_index(mix, assumptions):
+    """Sales volumes each projected month relative to the mix, matching the cashflow's revenue"""
+    return demand_index(mix, assumptions) * supply_shares(assumptions)
+
+
+@lru_cache(maxsize=256)
+def variable_cost_pct(mix, costs, assumptions):
+    """Variable costs as a % of revenue over the projected months, for ``Assumptions.variable_cost_pct``"""
+    if mix.total_revenue <= 0 or assumptions.months <= 0:
+        return assumptions.variable_cost_pct
+    index = volume_index(mix, assumptions)
+    total = variable_costs(mix, costs, index, assumptions.calendar.start_month).sum()
+    return float(total / (mix.total_revenue * index.sum()) * 100)
+
+
+def cost_breakdown(mix, costs, volume_index=1.0, start_month="2027-01"):
+    """Cost per component over the months of ``volume_index``, with its share of revenue"""
+    index = np.atleast_1d(np.asarray(volume_index, dtype=float))
+    totals = variable_costs(mix, costs, index, start_month).sum(axis=-1)
+    revenue = mix.total_revenue * index.sum()
+    return pd.DataFrame({
+        'Cost': list(COST_COMPONENTS),
+        'Amount': totals,
+        '% of Revenue': totals / revenue * 100 if revenue > 0 else np.zeros(len(totals)),
+    })
@@ -0,0 +1,93 @@
+"""Amortization schedules for the loans funding the startup capital
+
+A loan's balance after any number of payments has a closed form, so a whole
+schedule is one broadcast NumPy expression over the month axis. Loan terms may
+carry leading batch dimensions (tranches, scenarios, sweep points), and every
+tranche of every scenario is amortized in a single evaluation with no loop
+over months, loans or paths.
+"""
+import numpy as np
+import pandas as pd
+
+from brewery.assumptions import Loan
+
+# Typical terms for the financing options named on the Capital Requirements tab
+LOAN_PRESETS = {
+    "SBA 7(a)": Loan("SBA 7(a)", 100000, 10.5, 120),
+    "SBA 504": Loan("SBA 504", 150000, 7.0, 240),
+    "Equipment Financing": Loan("Equipment Financing", 90000, 9.0, 84),
+    "Friends & Family Note": Loan("Friends & Family Note", 50000, 6.0, 60, interest_only_months=12,
+                                  balloon_pct=50.0),
+}
+
+# Loan fields that feed the amortization kernel, in its argument order
+_TERMS = ('principal', 'annual_rate_pct', 'term_months', 'interest_only_months', 'balloon_pct')
+
+
+def amortization(principal, annual_rate_pct, term_months, interest_only_months=0, balloon_pct=0.0, months=36):
+    """Monthly interest, principal repaid and closing balance, each shape (*batch, months)
+
+    Interest-only months come first. The level payments after them leave
+    ``balloon_pct`` of the principal owed, which is repaid with the final
+    payment at ``term_months``. All loan terms broadcast against each other.
+    """
+    principal = np.asarray(principal, dtype=float)[..., None]
+    rate = np.asarray(annual_rate_pct, dtype=float)[..., None] / 1200
+    term = np.asarray(term_months, dtype=float)[..., None]
+    interest_only = np.minimum(np.asarray(interest_only_months, dtype=float)[..., None], term)
+    balloon = principal * np.asarray(balloon_pct, dtype=float)[..., None] / 100
+
+    # Level payments made by the end of each month, out of ``payments`` in all
+    payments = term - interest_only
+    month = np.arange(1, months + 1)
+    paid = np.clip(month - interest_only, 0, payments)
+
+    # Balance after ``paid`` level payments: L g^k - (L g^n - B) (g^k - 1) / (g^n - 1), or
+    # straight-line at a zero rate; both land exactly on the balloon after the last one
+    with np.errstate(divide='ignore', invalid='ignore'):
+        grown, grown_full = (1 + rate) ** paid, (1 + rate) ** payments
+        amortized = np.where(rate > 0,
+                             (principal * grown_full - balloon) * (grown - 1) / (grown_full - 1),
+                             (principal - balloon) * paid / payments)
+    amortized = np.where(payments > 0, amortized, 0.0)
+    balance = np.where(month < term, principal * grown - amortized, 0.0)
+
+    opening = np.concatenate([np.broadcast_to(principal, balance.shape[:-1] + (1,)), balance[..., :-1]], axis=-1)
+    return opening * rate, opening - balance, balance
+
+
+def _loan_terms(loans):
+    """Arrays of each ``_TERMS`` field, one entry per loan"""
+    return tuple(np.array([getattr(loan, name) for loan in loans], dtype=float) for name in _TERMS)
+
+
+def debt_service(loan_sets, months):
+    """Monthly interest and principal repaid for each set of loans, shape (len(loan_sets), months)
+
+    Every tranche of every set is amortized in one broadcast evaluation and
+    then summed into its set's row.
+    """
+    interest = np.zeros((len(loan_sets), months))
+    repaid = np.zeros_like(interest)
+    tranches = [loan for loans in loan_sets for loan in loans]
+    if tranches:
+        owner = np.repeat(np.arange(len(loan_sets)), [len(loans) for loans in loan_sets])
+        tranche_interest, tranche_repaid, _ = amortization(*_loan_terms(tranches), months=months)
+        np.add.at(interest, owner, tranche_interest)
+        np.add.at(repaid, owner, tranche_repaid)
+    return interest, repaid
+
+
+def schedule_frame(loans, months, labels=None):
+    """Month-by-month payment, interest, principal and balance for each loan, as one long table"""
+    if not loans:
+        return pd.DataFrame(columns=['Month', 'Loan', 'Payment', 'Interest', 'Principal', 'Balance'])
+    interest, repaid, balance = amortization(*_loan_terms(loans), months=months)
+    return pd.DataFrame({
+        'Month': np.tile(labels if labels is not None else np.arange(1, months + 1), len(loans)),
+        'Loan': np.repeat([loan.name for loan in loans], months),
+        'Payment': (interest + repaid).ravel(),
+        'Interest': interest.ravel(),
+        'Principal': repaid.ravel(),
+        'Balance': balance.ravel(),
+    })
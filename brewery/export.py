@@ -0,0 +1,140 @@
+"""Excel export of the financial model
+
+Workbooks are written straight into an in-memory buffer and returned as bytes
+for ``st.download_button``; nothing is saved to disk. Large scenario sweeps are
+streamed row by row in xlsxwriter's constant-memory mode, so a 1M-row sweep
+sheet never exists in memory as a DataFrame or as a grid of cell objects.
+"""
+import io
+from dataclasses import asdict
+
+import numpy as np
+import xlsxwriter
+
+from brewery.debt import schedule_frame
+from brewery.projection import (distribution_waterfall, fixed_expense_breakdown, month_labels, partner_returns,
+                                project_cashflow, revenue_forecast)
+from brewery.sweep import METRICS, SWEEPABLE
+
+# Sweeps with more rows than this are written in constant-memory mode
+STREAMING_THRESHOLD = 50000
+
+# Excel's sheet limit, less the header row
+MAX_SHEET_ROWS = 1048575
+
+_STARTUP_LABELS = {
+    'equipment_cost': "Brewing Equipment",
+    'facility_buildout': "Facility Build-out & Renovations",
+    'licensing_fees': "Licensing & Legal Fees",
+    'pos_system': "POS System & Technology",
+    'initial_inventory': "Initial Inventory",
+    'kegs_cans': "Kegs, Canning/Bottling Equipment",
+    'taproom_setup': "Taproom Furniture & Bar Equipment",
+    'contingency': "Contingency Fund",
+}
+
+
+def _write_rows(worksheet, rows, header, formats, first_row=0):
+    """Write a header and then rows in order, as constant-memory mode requires"""
+    worksheet.write_row(first_row, 0, header)
+    for r, row in enumerate(rows, start=first_row + 1):
+        for c, value in enumerate(row):
+            if value == value:  # Leave NaN cells (such as DSCR with nothing owed) blank
+                worksheet.write(r, c, value, formats[c])
+    worksheet.set_column(0, len(header) - 1, 22)
+
+
+def _write_frame(workbook, name, frame, formats):
+    """Write a small DataFrame to its own sheet"""
+    worksheet = workbook.add_worksheet(name)
+    column_formats = [formats.get(col) for col in frame.columns]
+    _write_rows(worksheet, frame.itertuples(index=False), list(frame.columns), column_formats)
+
+
+def _write_sweep(workbook, result, formats, chunk_size=50000):
+    """Stream every evaluated sweep grid point to a sheet in chunks"""
+    spec = result.spec
+    worksheet = workbook.add_worksheet("Scenario Sweep")
+    header = [SWEEPABLE[axis.name] for axis in spec.axes] + list(METRICS.values())
+    worksheet.write_row(0, 0, header)
+    worksheet.set_column(0, len(header) - 1, 22)
+
+    rows = min(spec.size, MAX_SHEET_ROWS)
+    axis_values = [np.asarray(axis.values) for axis in spec.axes]
+    write_number = worksheet.write_number
+    for start in range(0, rows, chunk_size):
+        stop = min(start + chunk_size, rows)
+        coords = np.unravel_index(np.arange(start, stop), spec.shape)
+        columns = [values[idx].tolist() for values, idx in zip(axis_values, coords)]
+        columns += [result.metrics[name][start:stop].tolist() for name in METRICS]
+        for r, row in enumerate(zip(*columns), start=start + 1):
+            for c, value in enumerate(row):
+                if value == value:  # Leave NaN (never breaks even) cells blank
+                    write_number(r, c, value, formats[c])
+
+    if spec.size > rows:
+        worksheet.write(rows + 1, 0, f"Truncated: {spec.size - rows:,} more rows exceed Excel's sheet limit")
+
+
+def excel_workbook(startup, assumptions, partnership, mix, forecast_growth_pct, forecast_months=12,
+                   sweep_result=None):
+    """Build the financial model workbook and return it as .xlsx bytes"""
+    buffer = io.BytesIO()
+    streaming = sweep_result is not None and sweep_result.spec.size > STREAMING_THRESHOLD
+    options = {'constant_memory': True} if streaming else {'in_memory': True}
+    workbook = xlsxwriter.Workbook(buffer, options)
+
+    money = workbook.add_format({'num_format': '$#,##0'})
+    number = workbook.add_format({'num_format': '#,##0.00'})
+    pct = workbook.add_format({'num_format': '0.0"%"'})
+    formats = {
+        'Amount': money, 'Monthly Cost': money, 'Annual Cost': money,
+        'Taproom': money, 'Wholesale': money, 'Total Revenue': money,
+        'Revenue': money, 'Expenses': money, 'Profit': money, 'Cumulative Cashflow': money,
+        'Debt Service': money, 'DSCR': number,
+        'Payment': money, 'Interest': money, 'Principal': money, 'Balance': money,
+        'Initial Investment': money, 'Cash Distributions': money, 'Ownership Value': money,
+        'Cash ROI %': pct, 'Ownership %': pct, 'Capital %': pct,
+        'MOIC': number, 'IRR %': pct, 'NPV': money,
+    }
+
+    # Startup capital
+    worksheet = workbook.add_worksheet("Startup Capital")
+    rows = [(_STARTUP_LABELS[k], v) for k, v in asdict(startup).items()]
+    rows.append(("Total Initial Capital", startup.total))
+    if assumptions.loans:
+        rows += [(f"Less {loan.name}", -loan.principal) for loan in assumptions.loans]
+        rows.append(("Partner Equity", assumptions.equity))
+    _write_rows(worksheet, rows, ["Item", "Amount"], [None, money])
+
+    _write_frame(workbook, "Fixed Expenses", fixed_expense_breakdown(assumptions), formats)
+    forecast = revenue_forecast(mix, forecast_growth_pct, forecast_months, assumptions.growth_decay,
+                                assumptions.calendar)
+    _write_frame(workbook, "Revenue Forecast", forecast, formats)
+
+    projection = project_cashflow(assumptions)
+    _write_frame(workbook, f"{assumptions.months}-Month Cashflow",
+                 projection.to_frame(month_labels(assumptions.calendar, assumptions.months)), formats)
+
+    if assumptions.loans:
+        labels = month_labels(assumptions.calendar, assumptions.months)
+        _write_frame(workbook, "Debt Schedule", schedule_frame(assumptions.loans, assumptions.months, labels),
+                     formats)
+
+    returns = partner_returns(projection, partnership, assumptions.equity)
+    returns.insert(1, 'Ownership %', list(partnership.partner_pcts))
+    if partnership.capital_pcts:
+        returns.insert(2, 'Capital %', list(partnership.capital_pcts))
+    _write_frame(workbook, "Investor ROI", returns, formats)
+
+    if partnership.waterfall:
+        waterfall = distribution_waterfall(projection, partnership, assumptions.equity)
+        _write_frame(workbook, "Distribution Waterfall", waterfall,
+                     {column: money for column in waterfall.columns[1:]})
+
+    if sweep_result is not None:
+        axis_formats = [number] * len(sweep_result.spec.axes)
+        _write_sweep(workbook, sweep_result, axis_formats + [number, money, pct, pct])
+
+    workbook.close()
+    return buffer.getvalue()
@@ -0,0 +1,125 @@
+"""Lightweight timing spans and cache counters for each script rerun
+
+``begin`` opens a record for the current rerun, ``span`` times one stage of a
+page section (model math, table building, figure building, rendering to the
+browser) and ``count`` tallies cache calls and misses. With no rerun open, as in
+benchmarks and batch runs, both are near-free no-ops. Finished reruns go into a
+``History`` that can be summarised or exported as JSON lines.
+
+Uses only the standard library so it can load with the login screen.
+"""
+import json
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+
+_current = ContextVar('rerun', default=None)
+
+# Process-wide cache tallies, shared by every session like the caches themselves
+_totals = Counter()
+_totals_lock = threading.Lock()
+
+
+@dataclass
+class Rerun:
+    """Timings and cache counters for one execution of main.py"""
+    page: str
+    user: str
+    started: str = field(default_factory=lambda: datetime.now().isoformat(timespec='seconds'))
+    seconds: float = 0.0
+    spans: list = field(default_factory=list)    # [section, stage, seconds]
+    cache: dict = field(default_factory=dict)    # {function: {'calls': n, 'misses': n}}
+    _start: float = field(default_factory=time.perf_counter, repr=False)
+
+    def breakdown(self):
+        """``{section: {stage: seconds}}`` summed over repeated spans"""
+        sections = {}
+        for section, stage, seconds in self.spans:
+            stages = sections.setdefault(section, {})
+            stages[stage] = stages.get(stage, 0.0) + seconds
+        return sections
+
+    def to_dict(self):
+        """Plain-dict form for JSON export"""
+        data = asdict(self)
+        del data['_start']
+        return data
+
+
+def begin(page, user):
+    """Start recording the current rerun"""
+    rerun = Rerun(page, user)
+    _current.set(rerun)
+    return rerun
+
+
+def finish():
+    """Stop recording and return the finished rerun, or None if none was open"""
+    rerun = _current.get()
+    if rerun is not None:
+        rerun.seconds = time.perf_counter() - rerun._start
+        _current.set(None)
+    return rerun
+
+
+@contextmanager
+def span(section, stage):
+    """Time one stage of a page section"""
+    rerun = _current.get()
+    if rerun is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        rerun.spans.append([section, stage, time.perf_counter() - start])
+
+
+def count(function, event):
+    """Tally a cache event (``'calls'`` or ``'misses'``) for a cached function"""
+    with _totals_lock:
+        _totals[function, event] += 1
+    rerun = _current.get()
+    if rerun is not None:
+        counts = rerun.cache.setdefault(function, {'calls': 0, 'misses': 0})
+        counts[event] += 1
+
+
+def cache_totals():
+    """``{function: {'calls': n, 'misses': n}}`` since the server started"""
+    totals = {}
+    with _totals_lock:
+        for (function, event), n in _totals.items():
+            totals.setdefault(function, {'calls': 0, 'misses': 0})[event] = n
+    return totals
+
+
+class History:
+    """Most recent finished reruns, oldest dropped first"""
+
+    def __init__(self, maxlen=500):
+        self._reruns = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def add(self, rerun):
+        """Record a finished rerun"""
+        with self._lock:
+            self._reruns.append(rerun)
+
+    def recent(self):
+        """Reruns oldest first"""
+        with self._lock:
+            return list(self._reruns)
+
+    def slowest(self, n=5):
+        """The ``n`` slowest recorded reruns"""
+        return sorted(self.recent(), key=lambda rerun: rerun.seconds, reverse=True)[:n]
+
+    def to_jsonl(self):
+        """Every recorded rerun as one JSON object per line"""
+        return "".join(json.dumps(rerun.to_dict()) + "\n" for rerun in self.recent())
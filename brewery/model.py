@@ -0,0 +1,139 @@
+"""Dependency graph from the scenario inputs to the values every page derives from them
+
+Each node names the nodes it is computed from. ``update`` compares a new
+scenario with the last one part by part and marks only the nodes downstream of
+the parts that changed; ``graph[name]`` recomputes a dirty node the first time
+it is read. A node whose recomputed value equals its old one stops the change
+there, so editing rent reaches the fixed expenses, assumptions and projection
+but never reruns the brew schedule or the cost engine.
+
+Uses only the input dataclasses so a session can hold a graph before any page
+loads NumPy; the heavy stages import their engines inside the node.
+"""
+from dataclasses import fields, replace
+
+from brewery import instrument
+from brewery.assumptions import Assumptions, Scenario
+
+# Scenario parts, the graph's inputs
+INPUTS = tuple(f.name for f in fields(Scenario))
+
+# Cashflow inputs that set monthly sales volumes; the brew schedule and cost engine read nothing else
+VOLUME_FIELDS = ('starting_monthly_revenue', 'monthly_revenue_growth', 'variable_cost_pct', 'months',
+                 'growth_decay', 'calendar')
+
+
+# ==================== NODES ====================
+def _volume_drivers(cashflow):
+    """Cashflow assumptions with everything but the sales volume inputs left at defaults"""
+    return Assumptions(**{name: getattr(cashflow, name) for name in VOLUME_FIELDS})
+
+
+def _supply_share(brewhouse, equipment_cost, mix, drivers):
+    """Share of each month's revenue brewing capacity allows, () unless sales are capped"""
+    if not brewhouse.cap_sales:
+        return ()
+    from brewery.capacity import supply_share
+    return supply_share(brewhouse, equipment_cost, mix, drivers)
+
+
+def _variable_cost_pct(mix, costs, drivers, share):
+    """Cost model share of revenue over the projected months"""
+    from brewery.costs import variable_cost_pct
+    return variable_cost_pct(mix, costs, replace(drivers, supply_share=share))
+
+
+def _assumptions(cashflow, initial_capital, share, variable_pct):
+    """Cashflow assumptions funded by the startup capital, with capped sales and modelled variable costs"""
+    return replace(cashflow, initial_capital=initial_capital, supply_share=share, variable_cost_pct=variable_pct)
+
+
+# name: (compute, names of the nodes it reads); every dependency is listed before its dependents
+NODES = {
+    'fixed_expenses': (lambda cashflow: cashflow.total_monthly_fixed, ('cashflow',)),
+    'startup_capital': (lambda startup: startup.total, ('startup',)),
+    'equipment_cost': (lambda startup: startup.equipment_cost, ('startup',)),
+    'volume_drivers': (_volume_drivers, ('cashflow',)),
+    'supply_share': (_supply_share, ('brewhouse', 'equipment_cost', 'mix', 'volume_drivers')),
+    'variable_cost_pct': (_variable_cost_pct, ('mix', 'costs', 'volume_drivers', 'supply_share')),
+    'assumptions': (_assumptions, ('cashflow', 'startup_capital', 'supply_share', 'variable_cost_pct')),
+    'projection': (None, ('assumptions',)),  # built by the graph's ``project``
+}
+
+
+def _same(old, new):
+    """Whether a recomputed value equals the one it replaces; arrays and frames never compare equal"""
+    try:
+        return bool(old == new)
+    except (TypeError, ValueError):
+        return False
+
+
+class ModelGraph:
+    """Lazily recomputed values derived from one scenario at a time
+
+    ``project`` turns assumptions into the cashflow projection; sessions pass
+    the shared Streamlit cache so pages and charts reuse one projection.
+    """
+
+    def __init__(self, scenario=None, project=None):
+        self._project = project
+        self._values = {}
+        self._versions = dict.fromkeys(INPUTS + tuple(NODES), 0)  # bumped whenever a value changes
+        self._seen = {}                                              # dependency versions each node was built from
+        self._dirty = set(NODES)
+        self._dependents = {name: set() for name in self._versions}
+        for name, (_, deps) in NODES.items():
+            for dep in deps:
+                self._dependents[dep].add(name)
+        self.update(scenario or Scenario())
+
+    def update(self, scenario):
+        """Take the inputs from ``scenario``, marking the nodes downstream of every changed part dirty"""
+        for name in INPUTS:
+            value = getattr(scenario, name)
+            if name in self._values and self._values[name] is value:
+                continue
+            if name not in self._values or not _same(self._values[name], value):
+                self._versions[name] += 1
+                self._mark_dirty(name)
+            self._values[name] = value
+        self.scenario = scenario
+        return self
+
+    def _mark_dirty(self, name):
+        """Mark everything downstream of ``name``"""
+        stack = list(self._dependents[name])
+        while stack:
+            node = stack.pop()
+            if node not in self._dirty:
+                self._dirty.add(node)
+                stack.extend(self._dependents[node])
+
+    def __getitem__(self, name):
+        """Current value of a node, recomputed first if an input it depends on changed"""
+        if name in self._dirty:
+            self._refresh(name)
+        return self._values[name]
+
+    def _refresh(self, name):
+        """Bring a dirty node up to date, skipping the recompute when no dependency actually changed"""
+        compute, deps = NODES[name]
+        args = [self[dep] for dep in deps]
+        instrument.count(f"model.{name}", 'calls')
+        versions = tuple(self._versions[dep] for dep in deps)
+        if self._seen.get(name) != versions:
+            instrument.count(f"model.{name}", 'misses')
+            value = compute(*args) if compute is not None else self._projection(*args)
+            if name not in self._values or not _same(self._values[name], value):
+                self._versions[name] += 1
+            self._values[name] = value
+            self._seen[name] = versions
+        self._dirty.discard(name)
+
+    def _projection(self, assumptions):
+        """Monthly cashflow projection for the assumptions node"""
+        if self._project is None:
+            from brewery.projection import project_cashflow
+            return project_cashflow(assumptions)
+        return self._project(assumptions)
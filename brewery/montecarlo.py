@@ -0,0 +1,106 @@
+"""Monte Carlo risk simulation for the monthly cashflow projection
+
+Uncertain inputs are drawn once per path and pushed through the projection
+kernel as a single (paths x months) matrix, so 100k paths cost one batched
+NumPy evaluation instead of a Python loop per path. Summaries are kept in the
+shared result store, so each set of inputs is simulated once per server.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+from brewery import instrument
+from brewery.projection import breakeven_month, cashflow_arrays, debt_arrays, revenue_multipliers
+from brewery.results import run_id
+
+# Percentile bands shown on the cashflow fan chart
+FAN_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+@dataclass(frozen=True)
+class Triangular:
+    """Triangular distribution given by its low, most likely and high values"""
+    low: float
+    mode: float
+    high: float
+
+    def sample(self, rng, size):
+        """Draw ``size`` values; a zero-width range returns the constant value"""
+        if self.high <= self.low:
+            return np.full(size, float(self.mode))
+        mode = min(max(self.mode, self.low), self.high)
+        return rng.triangular(self.low, mode, self.high, size)
+
+
+@dataclass(frozen=True)
+class RiskModel:
+    """Distributions for the uncertain cashflow inputs"""
+    monthly_revenue_growth: Triangular
+    variable_cost_pct: Triangular
+    monthly_rent: Triangular
+    monthly_payroll: Triangular
+    cash_reserve: float = 0  # Operating cash on hand after startup spend
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    """Summary of a Monte Carlo run"""
+    percentiles: np.ndarray       # (len(FAN_PERCENTILES), months) cumulative cashflow bands
+    breakeven_months: np.ndarray  # Per-path breakeven month, 0 if never within horizon
+    prob_out_of_cash: float       # Share of paths whose cash balance dips below zero
+    paths: int
+
+    @property
+    def prob_breakeven(self):
+        """Share of paths reaching breakeven within the horizon"""
+        return float((self.breakeven_months > 0).mean())
+
+    @property
+    def median_breakeven(self):
+        """Median breakeven month across paths that break even, or None"""
+        reached = self.breakeven_months[self.breakeven_months > 0]
+        return int(np.median(reached)) if len(reached) else None
+
+
+def simulate(assumptions, risk, paths=10000, seed=None):
+    """Run ``paths`` cashflow projections with inputs drawn from ``risk``"""
+    a = assumptions
+    rng = np.random.default_rng(seed)
+    growth = risk.monthly_revenue_growth.sample(rng, paths)
+    variable_pct = risk.variable_cost_pct.sample(rng, paths)
+    rent = risk.monthly_rent.sample(rng, paths)
+    payroll = risk.monthly_payroll.sample(rng, paths)
+    total_fixed = a.total_monthly_fixed - a.monthly_rent - a.monthly_payroll + rent + payroll
+
+    # Loan payments are the same on every path, so one schedule broadcasts across them all
+    interest, repaid = debt_arrays(a)
+    _, _, _, cumulative = cashflow_arrays(
+        a.starting_monthly_revenue, growth, total_fixed, a.initial_capital, variable_pct, a.months,
+        a.growth_decay, revenue_multipliers(a), interest, repaid, a.debt
+    )
+
+    # Cash on hand is the reserve plus cashflow after debt service since opening
+    cash_low = cumulative.min(axis=1) + a.initial_capital - a.debt + risk.cash_reserve
+    return SimulationResult(
+        # Months-major copy keeps each percentile partition on contiguous memory
+        percentiles=np.percentile(np.ascontiguousarray(cumulative.T), FAN_PERCENTILES, axis=1),
+        breakeven_months=breakeven_month(cumulative).astype(np.int16),
+        prob_out_of_cash=float((cash_low < 0).mean()),
+        paths=paths
+    )
+
+
+def stored_simulation(store, assumptions, risk, paths=10000, seed=None):
+    """``simulate`` through the result store, its arrays memory-mapped; unseeded runs are never stored"""
+    if seed is None:
+        return simulate(assumptions, risk, paths)
+    key = run_id('simulation', assumptions, risk, paths, seed)
+    instrument.count('results.simulation', 'calls')
+    run = store.open(key)
+    if run is None:
+        instrument.count('results.simulation', 'misses')
+        result = simulate(assumptions, risk, paths, seed)
+        run = store.put(key, {'percentiles': result.percentiles, 'breakeven_months': result.breakeven_months},
+                        {'kind': 'simulation', 'prob_out_of_cash': result.prob_out_of_cash, 'paths': paths})
+    return SimulationResult(run['percentiles'], run['breakeven_months'], run.meta['prob_out_of_cash'],
+                            run.meta['paths'])
@@ -0,0 +1,140 @@
+"""Linear-programming optimizer for the taproom vs wholesale product mix
+
+Chooses monthly pints, flights, growlers, kegs and cases to maximize beer gross
+profit (or its discounted value over the projection horizon). The limits are
+brewing capacity, taproom seat-hours, distribution minimums and a market ceiling
+on each product. The LP is solved locally with HiGHS. Its duals are the shadow
+prices: what one more unit of each limit would be worth.
+"""
+from dataclasses import dataclass, replace
+
+import numpy as np
+import pandas as pd
+from scipy.optimize import linprog
+
+from brewery.projection import revenue_multipliers, revenue_path
+
+# ProductMix volume fields the optimizer allocates, with display labels
+PRODUCTS = {
+    'monthly_pints': "Pints",
+    'monthly_flights': "Flights",
+    'monthly_growlers': "Growler Fills",
+    'monthly_kegs': "Kegs",
+    'monthly_cases': "Cases",
+}
+
+# Barrels per unit sold (31-gallon barrel = 3,968 oz; kegs are half barrels)
+BBL_PER_UNIT = np.array([16, 20, 64, 1984, 288]) / 3968
+
+
+@dataclass(frozen=True)
+class MixLimits:
+    """Constraints on the optimized product mix"""
+    capacity_bbl: float = 75.0            # BBL/month the cellar can package
+    seats: int = 60
+    open_hours_per_week: float = 50.0
+    seat_utilization_pct: float = 50.0    # share of seat-hours that can realistically be filled
+    hours_per_pint: float = 0.5           # seat time per pint poured
+    hours_per_flight: float = 0.75
+    min_kegs: float = 20.0                # distribution commitments per month
+    min_cases: float = 50.0
+    max_pints: float = 6000.0             # most of each product the market will take per month
+    max_flights: float = 400.0
+    max_growlers: float = 300.0
+    max_kegs: float = 60.0
+    max_cases: float = 200.0
+
+    @property
+    def seat_hours(self):
+        """Seat-hours per month the taproom can fill"""
+        return self.seats * self.open_hours_per_week * 52 / 12 * self.seat_utilization_pct / 100
+
+    @property
+    def market_ceilings(self):
+        """Most pints, flights, growlers, kegs and cases the market will take, in ``PRODUCTS`` order"""
+        return np.array([self.max_pints, self.max_flights, self.max_growlers, self.max_kegs, self.max_cases])
+
+
+@dataclass(frozen=True)
+class MixSolution:
+    """Optimal mix, its gross profit and the shadow price of each limit"""
+    status: str                 # 'optimal' or the solver's reason for failing
+    mix: object                 # optimized ProductMix, or the input mix if no solution
+    gross_profit: float         # monthly beer gross profit of the optimized mix
+    objective: float            # value of the objective (monthly or discounted gross profit)
+    limits: tuple               # (limit, unit, shadow price $, slack) per constraint
+
+    @property
+    def optimal(self):
+        """Whether the solver found an optimal mix"""
+        return self.status == 'optimal'
+
+    def to_frame(self):
+        """Shadow price table, binding limits first"""
+        frame = pd.DataFrame(list(self.limits), columns=['Limit', 'Unit', 'Shadow Price', 'Slack'])
+        return frame.sort_values('Shadow Price', key=abs, ascending=False, ignore_index=True)
+
+
+def unit_margins(mix):
+    """Gross profit per pint, flight, growler, keg and case at the mix's prices and COGS"""
+    # Flights are 1.25 pints, growlers 4 and cases 18, as in ProductMix.beer_cogs
+    prices = np.array([mix.pint_price, mix.flight_price, mix.growler_price, mix.keg_price, mix.case_price])
+    cogs = np.array([1, 1.25, 4, 0, 18]) * mix.pint_cogs + np.array([0, 0, 0, mix.keg_cogs, 0])
+    return prices - cogs
+
+
+def horizon_factors(assumptions, discount_rate_pct):
+    """(discounted value, peak) of the monthly volume index over the projection horizon
+
+    Volumes follow the revenue path, so month-1 gross profit times the first
+    factor is its discounted total, and month-1 usage times the second is
+    usage in the busiest month.
+    """
+    a = assumptions
+    index = revenue_path(1.0, a.monthly_revenue_growth, a.months, a.growth_decay) * revenue_multipliers(a)
+    discount = (1 + discount_rate_pct / 100) ** (-np.arange(a.months) / 12)
+    return float((index * discount).sum()), float(index.max())
+
+
+def optimize_mix(mix, limits, value_factor=1.0, peak_factor=1.0):
+    """Maximize ``value_factor`` x monthly beer gross profit subject to ``limits``
+
+    Capacity and seat-hours must hold in the busiest month, ``peak_factor``
+    times month 1. Pass the factors from ``horizon_factors`` to optimize
+    discounted value, or leave them at 1 for this month's gross profit.
+    """
+    margins = unit_margins(mix)
+    current = np.array([getattr(mix, field) for field in PRODUCTS], dtype=float)
+    minimums = np.array([0, 0, 0, limits.min_kegs, limits.min_cases])
+    # Distribution commitments hold even where they exceed the market ceiling
+    ceilings = np.maximum(limits.market_ceilings, minimums)
+    seat_use = np.array([limits.hours_per_pint, limits.hours_per_flight, 0, 0, 0])
+
+    result = linprog(
+        -value_factor * margins,
+        A_ub=peak_factor * np.vstack([BBL_PER_UNIT, seat_use]),
+        b_ub=[limits.capacity_bbl, limits.seat_hours],
+        bounds=list(zip(minimums, ceilings)),
+        method='highs'
+    )
+    if result.status != 0:
+        return MixSolution(result.message, mix, float(margins @ current), float('nan'), ())
+
+    # Sales volumes are whole units, like the Sales Volume inputs
+    volumes = np.round(result.x)
+    optimized = replace(mix, **{field: int(v) for field, v in zip(PRODUCTS, volumes)})
+    capacity_price, seat_price = -result.ineqlin.marginals
+    capacity_slack, seat_slack = result.ineqlin.residual
+    names = list(PRODUCTS.values())
+    shadow = [
+        ("Brewing Capacity", "BBL/month", capacity_price, capacity_slack),
+        ("Taproom Seat-Hours", "seat-hour", seat_price, seat_slack),
+        ("Keg Minimum", "keg", -result.lower.marginals[3], volumes[3] - minimums[3]),
+        ("Case Minimum", "case", -result.lower.marginals[4], volumes[4] - minimums[4]),
+    ]
+    shadow += [(f"{name} Market Ceiling", "unit", -upper, ceiling - volume)
+               for name, upper, ceiling, volume in zip(names, result.upper.marginals, ceilings, volumes)]
+    # Adding 0.0 turns the solver's -0.0 duals on non-binding limits into 0.0
+    limits_table = tuple((name, unit, float(price) + 0.0, max(float(slack), 0.0))
+                         for name, unit, price, slack in shadow)
+    return MixSolution('optimal', optimized, float(margins @ volumes), float(-result.fun), limits_table)
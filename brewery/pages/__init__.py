@@ -0,0 +1,13 @@
+"""Analyzer pages, each imported only when it is first shown"""
+
+# Page title -> module under brewery/pages
+PAGES = {
+    "Market Overview": "market_overview",
+    "Financial Inputs": "financial_inputs",
+    "Revenue Projections": "revenue_projections",
+    "Expense Analysis": "expense_analysis",
+    "Investor Analysis": "investor_analysis",
+    "Scenario Sweep": "scenario_sweep",
+    "Scenario Comparison": "scenario_comparison",
+    "Dashboard": "dashboard",
+}
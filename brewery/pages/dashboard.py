@@ -0,0 +1,368 @@
+"""Dashboard page: headline metrics, reports and exports"""
+import time
+
+import pandas as pd
+import streamlit as st
+
+from brewery.cache import report_service, result_store
+from brewery.export import excel_workbook
+from brewery.instrument import span
+from brewery.projection import breakeven_revenue, partner_investments
+from brewery.report import report_key
+from brewery.session import model
+from brewery.sweep import open_sweep
+
+
+def render(scenario):
+    """Draw the page for the current scenario"""
+    st.header("📊 Executive Dashboard")
+    
+    # Calculate key metrics
+    graph = model()
+    assumptions = graph['assumptions']
+    total_monthly_fixed = graph['fixed_expenses']
+    variable_pct = graph['variable_cost_pct']
+    
+    # Top-level metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    col1.metric(
+        "Initial Capital Required",
+        f"${graph['startup_capital']:,.0f}",
+        help="Total startup costs including equipment, build-out, inventory"
+    )
+    
+    col2.metric(
+        "Monthly Fixed Costs",
+        f"${total_monthly_fixed:,.0f}",
+        help="Fixed operating expenses that must be covered monthly"
+    )
+    
+    col3.metric(
+        "Breakeven Revenue",
+        f"${breakeven_revenue(total_monthly_fixed, variable_pct):,.0f}/mo",
+        help=f"Monthly revenue needed to break even ({variable_pct:.1f}% variable costs from the cost model)"
+    )
+    
+    # Each partner's capital contribution, as on the Investor Analysis page
+    investments = partner_investments(assumptions.equity, scenario.partnership)
+    col4.metric(
+        "Investment per Partner",
+        " / ".join(f"${amount / 1000:,.0f}k" for amount in investments),
+        help="Each partner's capital share of the startup capital not funded by loans: "
+             + ", ".join(f"{name} ${amount:,.0f}" for name, amount in zip(scenario.partnership.names, investments))
+    )
+    
+    st.markdown("---")
+    
+    # Summary sections
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("💼 Market Position")
+        st.markdown("""
+        **Charlotte-Concord Region Analysis:**
+        - 30+ established craft breweries
+        - Vibrant craft beer culture (since 2009)
+        - Strong brewery tourism
+        - Supportive craft beer community
+        - Growing population base
+        
+        **Competitive Advantages:**
+        - Unique beer styles and recipes
+        - Strong taproom experience (highest margins)
+        - Local community engagement
+        - Quality and consistency
+        - Strategic location selection
+        
+        **Market Opportunity:**
+        - $26.8B US craft beer market
+        - Charlotte designated as craft beer destination
+        - Brewery-hopping culture well-established
+        - Tourism and events drive taproom traffic
+        """)
+        
+        st.subheader("🎯 Revenue Targets")
+        target_monthly = 50000
+        target_annual = target_monthly * 12
+        
+        st.markdown(f"""
+        **Conservative Year 1 Targets:**
+        - **Monthly Revenue**: ${target_monthly:,.0f}
+        - **Annual Revenue**: ${target_annual:,.0f}
+        - **Taproom Sales**: 60% (higher margin)
+        - **Wholesale**: 40% (volume)
+        
+        **Production Targets:**
+        - Year 1: 300-500 barrels
+        - Year 2: 500-800 barrels
+        - Year 3: 800-1,200 barrels
+        
+        **Industry Benchmarks:**
+        - Small craft brewery: $1M-$3M annual revenue
+        - Net profit margins: 20-25%
+        - Gross margins: 74-92% (before expenses)
+        - Breakeven timeline: 18-36 months typical
+        """)
+    
+    with col2:
+        st.subheader("💰 Financial Summary")
+        
+        # Create sample P&L
+        with span("Dashboard P&L", "model"):
+            sample_revenue = 50000
+            sample_var_costs = sample_revenue * variable_pct / 100
+            sample_profit = sample_revenue - sample_var_costs - total_monthly_fixed
+            sample_margin = (sample_profit / sample_revenue * 100) if sample_revenue > 0 else 0
+        
+        with span("Dashboard P&L", "table"):
+            pl_df = pd.DataFrame({
+                'Item': ['Monthly Revenue', f'Variable Costs ({variable_pct:.1f}%)', 'Fixed Operating Costs', 
+                        'Net Profit', 'Profit Margin %'],
+                'Amount': [f"${sample_revenue:,.0f}", f"(${sample_var_costs:,.0f})", 
+                          f"(${total_monthly_fixed:,.0f})", f"${sample_profit:,.0f}", 
+                          f"{sample_margin:.1f}%"]
+            })
+        
+        with span("Dashboard P&L", "render"):
+            st.dataframe(pl_df, use_container_width=True, hide_index=True)
+        
+        st.subheader("📈 Growth Strategy")
+        st.markdown("""
+        **Phase 1 (Months 1-6): Launch & Build Foundation**
+        - Focus on core beer lineup (4-6 styles)
+        - Build taproom traffic and regulars
+        - Establish quality and consistency
+        - Begin self-distribution to select accounts
+        - Target: Cover operating costs, build awareness
+        
+        **Phase 2 (Months 7-12): Scale & Refine**
+        - Increase production by 30-50%
+        - Expand distribution strategically
+        - Launch seasonal and specialty releases
+        - Build event calendar (tours, music, food trucks)
+        - Target: Achieve positive cashflow
+        
+        **Phase 3 (Year 2): Expand & Optimize**
+        - Consider equipment upgrades if at capacity
+        - Expand wholesale accounts or add distributor
+        - Develop barrel-aging program
+        - Enhance merchandise and events
+        - Target: 20%+ profit margins
+        
+        **Phase 4 (Year 3+): Mature & Grow**
+        - Consider second location or expansion
+        - Premium/limited release series
+        - Regional distribution
+        - Build brand equity for potential exit
+        """)
+    
+    st.markdown("---")
+    
+    # Decision matrix
+    st.subheader("✅ Investment Decision Matrix")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("### 🟢 Strengths")
+        st.markdown("""
+        - Established market (30+ breweries = proven demand)
+        - High gross margins (74-92%)
+        - Multiple revenue streams (taproom, wholesale, events)
+        - Faster production cycle than spirits (2-4 weeks)
+        - Charlotte's craft beer tourism
+        - Taproom = highest margin channel
+        - Creative differentiation opportunities
+        - Community-building potential
+        """)
+    
+    with col2:
+        st.markdown("### 🟡 Considerations")
+        st.markdown("""
+        - Competitive market (30+ breweries)
+        - Requires brewing expertise
+        - Labor-intensive operations
+        - Working capital needs (ingredients, kegs)
+        - Quality control critical
+        - Location selection important
+        - Regulatory compliance (TTB, state, local)
+        - 18-36 month breakeven typical
+        """)
+    
+    with col3:
+        st.markdown("### 🔴 Risks")
+        st.markdown("""
+        - Market saturation potential
+        - Changing consumer preferences
+        - Distribution challenges
+        - Equipment maintenance/failure
+        - Staffing and retention
+        - Economic sensitivity (discretionary spending)
+        - Quality consistency issues
+        - Cash flow management during growth
+        """)
+    
+    st.markdown("---")
+    
+    # Next steps
+    st.subheader("🚀 Recommended Next Steps")
+    
+    st.markdown("""
+    ### Immediate Actions (Weeks 1-4)
+    1. **Market Validation**
+       - Visit 10+ Charlotte-Concord breweries for competitive analysis
+       - Identify gaps in market (underserved styles, locations)
+       - Talk to brewery owners about lessons learned
+       - Survey potential customers on preferences
+    
+    2. **Team Building**
+       - Identify and recruit experienced head brewer
+       - Build advisory board with brewery operators
+       - Connect with Charlotte brewing community
+    
+    3. **Financial Planning**
+       - Finalize partnership agreement and ownership structure
+       - Get pre-qualification from SBA lenders
+       - Identify equipment financing options
+       - Create detailed 5-year financial model
+    
+    ### Short Term (Months 2-4)
+    4. **Business Planning**
+       - Develop comprehensive business plan
+       - Create beer lineup and recipes
+       - Define brand identity and story
+       - Outline marketing strategy
+    
+    5. **Location Scouting**
+       - Identify 3-5 potential locations
+       - Analyze foot traffic, accessibility, parking
+       - Consider zoning and lease terms
+       - Evaluate build-out requirements
+    
+    6. **Legal & Regulatory**
+       - Hire beverage attorney (TTB experience)
+       - Begin TTB Brewer's Notice application (4-6 months)
+       - Research NC ABC requirements
+       - Structure business entity (LLC, S-Corp, etc.)
+    
+    ### Medium Term (Months 5-8)
+    7. **Equipment & Build-Out**
+       - Get quotes from 3+ equipment vendors
+       - Compare new vs. used equipment options
+       - Design brewery layout and workflow
+       - Plan taproom design and capacity
+    
+    8. **Financing**
+       - Finalize investor agreements
+       - Close on SBA loan (if applicable)
+       - Arrange equipment financing
+       - Establish business banking relationships
+    
+    9. **Operations Planning**
+       - Develop production schedule
+       - Create recipes and brewing procedures
+       - Plan quality control processes
+       - Design inventory management system
+    
+    ### Pre-Launch (Months 9-12)
+    10. **Marketing & Brand**
+        - Develop brand identity (logo, colors, story)
+        - Create website and social media presence
+        - Plan grand opening events
+        - Build email list and community
+    
+    11. **Hiring & Training**
+        - Hire initial team (2-4 people)
+        - Train on brewing and taproom operations
+        - Develop standard operating procedures
+    
+    12. **Soft Opening**
+        - Friends & family events
+        - Limited taproom hours
+        - Test operations and refine
+        - Build initial customer base
+    """)
+    
+    # Export options
+    st.markdown("---")
+    st.subheader("📥 Export Analysis")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        report_inputs = (scenario.startup, assumptions, scenario.partnership,
+                         scenario.mix, scenario.forecast_growth, scenario.forecast_months)
+        
+        if st.button("Generate PDF Report"):
+            # Rendering happens on a shared background pool; this session only polls for progress
+            st.session_state.report_key = report_service().submit(*report_inputs)
+        
+        if st.session_state.get("report_key") == report_key(*report_inputs):
+            progress_bar = st.empty()
+            while True:
+                fraction, message, pdf, error = report_service().status(st.session_state.report_key)
+                if pdf is not None or error is not None or message == "Not started":
+                    break
+                progress_bar.progress(fraction, text=message)
+                time.sleep(0.25)
+            progress_bar.empty()
+            
+            if error:
+                st.error(f"❌ Report generation failed: {error}")
+            elif pdf is not None:
+                st.download_button(
+                    "💾 Save PDF Report",
+                    data=pdf,
+                    file_name="brewery_financial_report.pdf",
+                    mime="application/pdf"
+                )
+    with col2:
+        sweep_spec = st.session_state.get("sweep_spec")
+        sweep_result = open_sweep(result_store(), sweep_spec) if sweep_spec is not None else None
+        include_sweep = False
+        if sweep_result is not None:
+            include_sweep = st.checkbox(f"Include scenario sweep ({sweep_result.spec.size:,} rows)")
+        
+        if st.button("Download Financial Model (Excel)"):
+            with st.spinner("Building workbook..."):
+                workbook = excel_workbook(
+                    scenario.startup, assumptions, scenario.partnership, scenario.mix,
+                    scenario.forecast_growth, scenario.forecast_months,
+                    sweep_result if include_sweep else None
+                )
+            st.download_button(
+                "💾 Save Excel File",
+                data=workbook,
+                file_name="brewery_financial_model.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            )
+    
+    # Resources
+    with st.expander("📚 Useful Resources"):
+        st.markdown("""
+        **Industry Organizations:**
+        - Brewers Association: www.brewersassociation.org
+        - North Carolina Craft Brewers Guild: ncbeer.org
+        - American Brewers Guild (education): abgbrew.com
+        
+        **Regulatory:**
+        - TTB (Federal): www.ttb.gov
+        - NC ABC Commission: abc.nc.gov
+        
+        **Equipment Vendors:**
+        - Research multiple vendors for quotes
+        - Consider used equipment marketplaces
+        - Attend brewery equipment expos
+        
+        **Software & Tools:**
+        - Ekos Brewmaster (inventory/production)
+        - Toast POS (taproom point of sale)
+        - BeerMenus (online presence)
+        - Untappd (customer engagement)
+        
+        **Education:**
+        - Siebel Institute of Technology
+        - American Brewers Guild
+        - UC Davis Master Brewers Program
+        - Local homebrewing clubs and workshops
+        """)
@@ -0,0 +1,180 @@
+"""Expense Analysis page: fixed, variable and total cost structure"""
+from dataclasses import replace
+
+import streamlit as st
+
+from brewery.cache import cached_cost_breakdown, cached_expense_breakdown, cached_expense_pie, cached_pnl_waterfall
+from brewery.costs import FEDERAL_EXCISE_BRACKETS
+from brewery.projection import breakeven_revenue
+from brewery.session import model, scenario_key, update_scenario
+
+
+def render(scenario):
+    """Draw the page for the current scenario"""
+    st.header("💸 Comprehensive Expense Analysis")
+    
+    # Calculate totals from inputs
+    graph = model()
+    assumptions = graph['assumptions']
+    total_monthly_fixed = graph['fixed_expenses']
+    
+    tab1, tab2, tab3 = st.tabs(["Fixed Expenses", "Variable Expenses", "Total Cost Structure"])
+    
+    with tab1:
+        st.subheader("Monthly Fixed Operating Expenses Breakdown")
+        
+        # Create breakdown dataframe
+        fixed_expenses = cached_expense_breakdown(assumptions)
+        
+        # Display table
+        st.dataframe(fixed_expenses, use_container_width=True, hide_index=True)
+        
+        # Pie chart
+        fig = cached_expense_pie(assumptions)
+        st.plotly_chart(fig, use_container_width=True)
+        
+        col1, col2 = st.columns(2)
+        col1.metric("Total Monthly Fixed Expenses", f"${total_monthly_fixed:,.0f}")
+        col2.metric("Total Annual Fixed Expenses", f"${total_monthly_fixed * 12:,.0f}")
+    
+    with tab2:
+        st.subheader("Variable Expenses (Scale with Production)")
+        
+        st.markdown("""
+        Variable costs change with your sales volume:
+        - **Beer COGS** (malt, hops, yeast, water) from the unit costs on Revenue Projections
+        - **Packaging** (cans, labels, carriers for case sales)
+        - **Federal Excise Tax** ($3.50/barrel on the first 60K BBL each year, then $16/BBL)
+        - **NC Excise Tax** (per gallon of malt beverage sold)
+        - **Sales Tax** (only a cost when taproom prices include it)
+        - **Credit Card Fees** (by channel)
+        - **Distribution** (if using 3rd party)
+        """)
+        
+        # Cost model inputs
+        costs = scenario.costs
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            packaging_per_can = st.slider("Packaging Cost per Can", 0.20, 2.00, float(costs.packaging_per_can), 0.05,
+                                          help="Can, label and carrier. Typical: $0.40-$0.80/unit",
+                                          key=scenario_key("packaging_per_can"))
+            distribution_pct = st.slider("Distribution Cost % (if applicable)", 0.0, 30.0,
+                                         float(costs.distribution_pct), 1.0,
+                                         help="3rd party distributor margin on wholesale. 0 if self-distributing",
+                                         key=scenario_key("distribution_pct"))
+            merch_cogs_pct = st.slider("Merchandise Cost (% of Merch Sales)", 0.0, 80.0, float(costs.merch_cogs_pct),
+                                       1.0, key=scenario_key("merch_cogs_pct"))
+            food_cogs_pct = st.slider("Food Cost (% of Food Sales)", 0.0, 60.0, float(costs.food_cogs_pct), 1.0,
+                                      key=scenario_key("food_cogs_pct"))
+        
+        with col2:
+            card_fee_pct = st.slider("Credit Card Processing %", 2.0, 4.0, float(costs.card_fee_pct), 0.1,
+                                     key=scenario_key("card_fee_pct"))
+            taproom_card_pct = st.slider("Taproom Sales Paid by Card %", 0.0, 100.0, float(costs.taproom_card_pct),
+                                         5.0, key=scenario_key("taproom_card_pct"))
+            wholesale_card_pct = st.slider("Wholesale Sales Paid by Card %", 0.0, 100.0,
+                                           float(costs.wholesale_card_pct), 5.0,
+                                           key=scenario_key("wholesale_card_pct"))
+        
+        with st.expander("🏛️ Tax Rates"):
+            col1, col2, col3 = st.columns(3)
+            sales_tax_pct = col1.number_input("Sales Tax %", 0.0, 15.0, float(costs.sales_tax_pct), 0.25,
+                                              help="Mecklenburg County: 7.25%. Cabarrus County (Concord): 7.00%",
+                                              key=scenario_key("sales_tax_pct"))
+            state_excise = col2.number_input("NC Excise ($/gallon)", 0.0, 5.0, float(costs.state_excise_per_gallon),
+                                             0.01, format="%.4f", key=scenario_key("state_excise_per_gallon"))
+            prices_include_tax = col3.checkbox("Taproom prices include sales tax", value=costs.prices_include_tax,
+                                               key=scenario_key("prices_include_tax"))
+            st.caption("Federal excise brackets: " + ", ".join(
+                f"${rate:.2f}/BBL" + (f" up to {limit:,.0f} BBL" if limit != float('inf') else " above")
+                for limit, rate in FEDERAL_EXCISE_BRACKETS) + " a calendar year")
+        
+        scenario = update_scenario(costs=replace(
+            costs, packaging_per_can=packaging_per_can, distribution_pct=distribution_pct,
+            merch_cogs_pct=merch_cogs_pct, food_cogs_pct=food_cogs_pct, card_fee_pct=card_fee_pct,
+            taproom_card_pct=taproom_card_pct, wholesale_card_pct=wholesale_card_pct, sales_tax_pct=sales_tax_pct,
+            state_excise_per_gallon=state_excise, prices_include_tax=prices_include_tax
+        ))
+        assumptions = graph.update(scenario)['assumptions']
+        variable_pct = graph['variable_cost_pct']
+        
+        # Month-1 costs at the Sales Volume mix
+        mix = scenario.mix
+        breakdown = cached_cost_breakdown(mix, scenario.costs, assumptions.calendar.start_month)
+        total_variable = breakdown['Amount'].sum()
+        breakdown.loc[len(breakdown)] = ["Total Variable", total_variable, breakdown['% of Revenue'].sum()]
+        
+        st.markdown(f"On ${mix.total_revenue:,.0f} monthly revenue (~{mix.total_bbls:,.1f} BBL) "
+                    f"from the Sales Volume mix:")
+        st.dataframe(breakdown.style.format({'Amount': "${:,.0f}", '% of Revenue': "{:.1f}%"}),
+                     use_container_width=True, hide_index=True)
+        st.info(f"""
+        **Estimated Variable Costs**: {variable_pct:.1f}% of Revenue over the {assumptions.months}-month projection
+        
+        Used by the cashflow projections, investor returns and dashboard.
+        Industry Benchmark: 20-30% of revenue for variable costs
+        """)
+    
+    with tab3:
+        st.subheader("Total Cost Structure & Profitability Analysis")
+        
+        # Revenue input for analysis
+        analysis_revenue = st.number_input(
+            "Enter Monthly Revenue for Analysis",
+            min_value=0,
+            value=50000,
+            step=1000,
+            help="Use revenue projection from previous page"
+        )
+        
+        # Calculate costs
+        variable_costs = analysis_revenue * (variable_pct / 100)
+        total_costs = total_monthly_fixed + variable_costs
+        gross_profit = analysis_revenue - total_costs
+        gross_margin_pct = (gross_profit / analysis_revenue * 100) if analysis_revenue > 0 else 0
+        
+        # Display metrics
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Revenue", f"${analysis_revenue:,.0f}")
+        col2.metric("Variable Costs", f"${variable_costs:,.0f}", f"{variable_pct:.1f}%")
+        col3.metric("Fixed Costs", f"${total_monthly_fixed:,.0f}")
+        col4.metric("Net Profit", f"${gross_profit:,.0f}", f"{gross_margin_pct:.1f}%",
+                   delta_color="normal" if gross_profit > 0 else "inverse")
+        
+        # Waterfall chart
+        fig = cached_pnl_waterfall(analysis_revenue, variable_costs, total_monthly_fixed)
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Breakeven analysis
+        monthly_breakeven = breakeven_revenue(total_monthly_fixed, variable_pct)
+        breakeven_pints = monthly_breakeven / 7  # Assuming $7/pint average
+        
+        st.warning(f"""
+        ### Breakeven Analysis
+        - **Monthly Breakeven Revenue**: ${monthly_breakeven:,.0f}
+        - **Breakeven in Pints**: {breakeven_pints:,.0f} pints/month (~{breakeven_pints/30:.0f}/day)
+        - **Annual Breakeven Revenue**: ${monthly_breakeven * 12:,.0f}
+        - Current revenue is {((analysis_revenue / monthly_breakeven - 1) * 100):.1f}% {'above' if analysis_revenue > monthly_breakeven else 'below'} breakeven
+        
+        **Industry Benchmark**: Most breweries become profitable within 18-36 months
+        """)
+        
+        # Profitability tips
+        with st.expander("💡 Tips to Improve Profitability"):
+            st.markdown("""
+            **Increase Margins:**
+            1. **Maximize Taproom Sales** - Higher margins than wholesale (50%+ vs 20-30%)
+            2. **Self-Distribute Initially** - Keep distributor margin (25-35%)
+            3. **Premium Pricing for Unique Beers** - Specialty/limited releases
+            4. **Merchandise Sales** - T-shirts, glassware (70%+ margins)
+            5. **Brewery Tours & Events** - High-margin experiential revenue
+            
+            **Reduce Costs:**
+            1. **Negotiate Bulk Ingredient Contracts** - Annual commitments
+            2. **Improve Production Efficiency** - Reduce waste, optimize recipes
+            3. **Energy Efficiency** - LED lighting, heat recovery systems
+            4. **Smart Staffing** - Cross-train employees, optimize scheduling
+            5. **DIY Marketing** - Social media, grassroots community building
+            """)
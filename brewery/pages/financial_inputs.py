@@ -0,0 +1,288 @@
+"""Financial Inputs page: startup capital, monthly fixed expenses and loan financing"""
+from dataclasses import replace
+
+import pandas as pd
+import streamlit as st
+
+from brewery import charts
+from brewery.assumptions import Loan, StartupCosts
+from brewery.debt import LOAN_PRESETS
+from brewery.instrument import span
+from brewery.projection import horizon_label, month_labels
+from brewery.session import model, scenario_key, update_scenario
+
+# Debt service coverage lenders commonly require (SBA lenders look for 1.15-1.25x)
+MIN_DSCR = 1.25
+
+
+def render(scenario):
+    """Draw the page for the current scenario"""
+    st.header("💵 Capital & Fixed Expenses Input")
+    
+    tab1, tab2, tab3 = st.tabs(["Initial Capital", "Monthly Operating Expenses", "Financing"])
+    
+    with tab1:
+        st.subheader("One-Time Startup Costs")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            equipment_cost = st.number_input(
+                "Brewing Equipment (Brewhouse, Fermenters, etc.)",
+                min_value=0,
+                value=scenario.startup.equipment_cost, key=scenario_key("equipment_cost"),
+                step=10000,
+                help="7-barrel system: ~$150K; 15-barrel: ~$250K; includes brewhouse, fermenters, bright tanks"
+            )
+            
+            facility_buildout = st.number_input(
+                "Facility Build-out & Renovations",
+                min_value=0,
+                value=scenario.startup.facility_buildout, key=scenario_key("facility_buildout"),
+                step=5000,
+                help="Production space, taproom, plumbing, electrical, $10-30/sq ft typical"
+            )
+            
+            licensing_fees = st.number_input(
+                "Licensing & Legal Fees",
+                min_value=0,
+                value=scenario.startup.licensing_fees, key=scenario_key("licensing_fees"),
+                step=1000,
+                help="TTB Brewer's Notice (federal), state licenses, legal counsel"
+            )
+            
+            pos_system = st.number_input(
+                "POS System & Technology",
+                min_value=0,
+                value=scenario.startup.pos_system, key=scenario_key("pos_system"),
+                step=1000,
+                help="Point of sale, draft system, inventory management software"
+            )
+        
+        with col2:
+            initial_inventory = st.number_input(
+                "Initial Inventory (Malt, Hops, Yeast, etc.)",
+                min_value=0,
+                value=scenario.startup.initial_inventory, key=scenario_key("initial_inventory"),
+                step=2500,
+                help="Ingredients for first batches, ~$1/pint production cost"
+            )
+            
+            kegs_cans = st.number_input(
+                "Kegs, Canning/Bottling Equipment",
+                min_value=0,
+                value=scenario.startup.kegs_cans, key=scenario_key("kegs_cans"),
+                step=5000,
+                help="Kegs ($100-150 each), canning line or bottling equipment"
+            )
+            
+            taproom_setup = st.number_input(
+                "Taproom Furniture & Bar Equipment",
+                min_value=0,
+                value=scenario.startup.taproom_setup, key=scenario_key("taproom_setup"),
+                step=5000,
+                help="Bar setup, draft system, glassware, seating, decor"
+            )
+            
+            contingency = st.number_input(
+                "Contingency Fund (10-20% recommended)",
+                min_value=0,
+                value=scenario.startup.contingency, key=scenario_key("contingency"),
+                step=5000,
+                help="Buffer for unexpected expenses, delays, cost overruns"
+            )
+        
+        startup_costs = StartupCosts(
+            equipment_cost=equipment_cost,
+            facility_buildout=facility_buildout,
+            licensing_fees=licensing_fees,
+            pos_system=pos_system,
+            initial_inventory=initial_inventory,
+            kegs_cans=kegs_cans,
+            taproom_setup=taproom_setup,
+            contingency=contingency
+        )
+        scenario = update_scenario(startup=startup_costs)
+        total_startup = model()['startup_capital']
+        
+        st.success(f"### Total Initial Capital Required: ${total_startup:,.0f}")
+        
+        # Equipment size guidance
+        st.info("""
+        **Brewery Size Guidance (First Year):**
+        - **Nano (1-3 BBL)**: $100K-$200K equipment | 50-150 BBL/year production
+        - **Micro (7-10 BBL)**: $150K-$300K equipment | 300-800 BBL/year production  
+        - **Small (15-30 BBL)**: $300K-$600K equipment | 1,000-3,000 BBL/year production
+        
+        *1 BBL (barrel) = 31 gallons = 248 pints*
+        
+        **Taproom Rule of Thumb**: 1,000-1,500 pints per seat per year capacity
+        """)
+    
+    with tab2:
+        st.subheader("Fixed Monthly Operating Expenses")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            monthly_rent = st.number_input(
+                "Facility Rent/Lease",
+                min_value=0,
+                value=scenario.cashflow.monthly_rent, key=scenario_key("monthly_rent"),
+                step=500,
+                help="Varies by location and size. Typical: $3,000-$8,000/month"
+            )
+            
+            monthly_payroll = st.number_input(
+                "Monthly Payroll (All Staff)",
+                min_value=0,
+                value=scenario.cashflow.monthly_payroll, key=scenario_key("monthly_payroll"),
+                step=1000,
+                help="Head Brewer ($40K-$70K), Assistants, Taproom staff ($30K-$50K each)"
+            )
+            
+            monthly_insurance = st.number_input(
+                "Insurance (Liability, Property, Workers Comp)",
+                min_value=0,
+                value=scenario.cashflow.monthly_insurance, key=scenario_key("monthly_insurance"),
+                step=100,
+                help="General liability, product liability, property insurance"
+            )
+        
+        with col2:
+            monthly_utilities = st.number_input(
+                "Utilities (Electric, Water, Gas, Sewer)",
+                min_value=0,
+                value=scenario.cashflow.monthly_utilities, key=scenario_key("monthly_utilities"),
+                step=100,
+                help="Brewing uses significant water and energy. Typical: $2,000-$4,000/month"
+            )
+            
+            monthly_marketing = st.number_input(
+                "Marketing & Advertising",
+                min_value=0,
+                value=scenario.cashflow.monthly_marketing, key=scenario_key("monthly_marketing"),
+                step=500,
+                help="Social media, events, merchandise, local advertising"
+            )
+            
+            monthly_other = st.number_input(
+                "Other Fixed Expenses (Accounting, Maintenance, etc.)",
+                min_value=0,
+                value=scenario.cashflow.monthly_other, key=scenario_key("monthly_other"),
+                step=100,
+                help="Accounting, legal, software subscriptions, routine maintenance"
+            )
+        
+        scenario = update_scenario(cashflow=replace(
+            scenario.cashflow,
+            monthly_rent=monthly_rent,
+            monthly_payroll=monthly_payroll,
+            monthly_insurance=monthly_insurance,
+            monthly_utilities=monthly_utilities,
+            monthly_marketing=monthly_marketing,
+            monthly_other=monthly_other
+        ))
+        total_monthly_fixed = model()['fixed_expenses']
+        
+        st.warning(f"### Total Monthly Fixed Expenses: ${total_monthly_fixed:,.0f}")
+        st.caption(f"Annual Fixed Overhead: ${total_monthly_fixed * 12:,.0f}")
+        
+        st.info("""
+        **Labor Cost Breakdown (Typical Micro Brewery):**
+        - Head Brewer/Brewmaster: $40,000-$100,000/year
+        - Assistant Brewer(s): $30,000-$50,000/year each
+        - Taproom Manager: $35,000-$50,000/year
+        - Taproom Staff (2-4): $25,000-$35,000/year each
+        - Part-time/Seasonal help as needed
+        """)
+    
+    with tab3:
+        st.subheader("Loans & Equipment Financing")
+        st.caption("Loans are drawn at opening to fund part of the startup capital; the partners fund the rest "
+                   "as equity. Interest is an expense, and every payment comes out of cumulative cashflow, "
+                   "DSCR and partner ROI.")
+        
+        # The editor applies its edits on top of the loans it started from, so keep those fixed
+        base_loans = st.session_state.setdefault(scenario_key("loans_base"), scenario.cashflow.loans)
+        edited = st.data_editor(
+            pd.DataFrame({
+                'Loan': pd.Series([loan.name for loan in base_loans], dtype=str),
+                'Principal': pd.Series([loan.principal for loan in base_loans], dtype=float),
+                'Rate %': pd.Series([loan.annual_rate_pct for loan in base_loans], dtype=float),
+                'Term (Months)': pd.Series([loan.term_months for loan in base_loans], dtype=int),
+                'Interest-Only Months': pd.Series([loan.interest_only_months for loan in base_loans], dtype=int),
+                'Balloon %': pd.Series([loan.balloon_pct for loan in base_loans], dtype=float),
+            }),
+            column_config={
+                'Principal': st.column_config.NumberColumn(min_value=0.0, step=5000.0, format="$%.0f"),
+                'Rate %': st.column_config.NumberColumn(min_value=0.0, max_value=30.0, step=0.25),
+                'Term (Months)': st.column_config.NumberColumn(min_value=1, max_value=360, step=12),
+                'Interest-Only Months': st.column_config.NumberColumn(
+                    min_value=0, max_value=120, help="Months paying interest only before principal payments start"),
+                'Balloon %': st.column_config.NumberColumn(
+                    min_value=0.0, max_value=100.0, step=5.0, help="Share of principal repaid in one final payment"),
+            },
+            num_rows="dynamic", use_container_width=True, hide_index=True, key=scenario_key("loans")
+        )
+        # Rows without a name or principal are still being typed in
+        default = Loan("", 0.0)
+        loans = tuple(
+            Loan(row['Loan'].strip(), float(row['Principal']), float(row['Rate %']), int(row['Term (Months)']),
+                 int(row['Interest-Only Months']), float(row['Balloon %']))
+            for row in edited.fillna({'Rate %': default.annual_rate_pct, 'Term (Months)': default.term_months,
+                                      'Interest-Only Months': 0, 'Balloon %': 0.0}).to_dict('records')
+            if isinstance(row['Loan'], str) and row['Loan'].strip() and row['Principal'] > 0
+        )
+        scenario = update_scenario(cashflow=replace(scenario.cashflow, loans=loans))
+        
+        with st.expander("Typical Terms"):
+            st.dataframe(pd.DataFrame({
+                'Financing': list(LOAN_PRESETS),
+                'Typical Amount': [loan.principal for loan in LOAN_PRESETS.values()],
+                'Rate %': [loan.annual_rate_pct for loan in LOAN_PRESETS.values()],
+                'Term (Months)': [loan.term_months for loan in LOAN_PRESETS.values()],
+                'Interest-Only Months': [loan.interest_only_months for loan in LOAN_PRESETS.values()],
+                'Balloon %': [loan.balloon_pct for loan in LOAN_PRESETS.values()],
+            }).style.format({'Typical Amount': '${:,.0f}', 'Rate %': '{:.2f}', 'Balloon %': '{:.0f}'}),
+                use_container_width=True, hide_index=True)
+            st.caption("SBA 7(a) rates float with prime; SBA 504 covers real estate and major equipment; "
+                       "equipment loans are secured by the brewhouse itself")
+        
+        graph = model()
+        assumptions = graph['assumptions']
+        if not loans:
+            st.info(f"No loans entered: the partners fund the full ${assumptions.initial_capital:,.0f} "
+                    f"startup capital as equity.")
+        else:
+            with span("Financing", "model"):
+                projection = graph['projection']
+            min_dscr = projection.min_dscr
+            
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Total Loans", f"${assumptions.debt:,.0f}",
+                        f"{assumptions.debt / assumptions.initial_capital * 100:.0f}% of startup capital"
+                        if assumptions.initial_capital > 0 else None, delta_color="off")
+            col2.metric("Partner Equity", f"${assumptions.equity:,.0f}")
+            col3.metric("Peak Monthly Debt Service", f"${projection.debt_service.max():,.0f}")
+            col4.metric("Minimum Annual DSCR", f"{min_dscr:.2f}x" if min_dscr is not None else "n/a",
+                        help="Yearly profit before interest divided by loan payments; "
+                             f"lenders commonly require {MIN_DSCR:.2f}x")
+            
+            if assumptions.debt > assumptions.initial_capital:
+                st.warning(f"Loans exceed the ${assumptions.initial_capital:,.0f} startup capital; the extra "
+                           f"${assumptions.debt - assumptions.initial_capital:,.0f} is held as opening cash.")
+            if min_dscr is not None and min_dscr < MIN_DSCR:
+                weak_years = [year + 1 for year, dscr in enumerate(projection.dscr(yearly=True)) if dscr < MIN_DSCR]
+                st.warning(f"Debt service coverage is below {MIN_DSCR:.2f}x in year{'s' * (len(weak_years) > 1)} "
+                           f"{', '.join(map(str, weak_years))}, which most lenders would not approve.")
+            
+            with span("Financing", "figure"):
+                fig = charts.debt_service_chart(month_labels(assumptions.calendar, assumptions.months),
+                                                projection.interest, projection.principal, projection.balance)
+            with span("Financing", "render"):
+                st.plotly_chart(fig, use_container_width=True)
+            
+            owed = projection.balance[-1]
+            st.caption(f"{horizon_label(assumptions.months)} interest: ${projection.interest.sum():,.0f} | "
+                       f"principal repaid: ${projection.principal.sum():,.0f} | "
+                       f"still owed at the end: ${owed:,.0f}")
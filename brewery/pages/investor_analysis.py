@@ -0,0 +1,558 @@
+"""Investor Analysis page: capital split, cashflow, ROI and risk for the three partners"""
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from brewery import charts
+from brewery.assumptions import Partnership
+from brewery.actuals import monthly_variance
+from brewery.cache import (actuals_store, cached_cashflow_chart, cached_distribution_waterfall, cached_partner_returns,
+                           cached_partner_returns_chart, cached_plan_vs_actual, cached_simulation)
+from brewery.instrument import span
+from brewery.montecarlo import RiskModel, Triangular
+from brewery.projection import GROWTH_CURVES, equity_irr, fading_curve, horizon_label, partner_investments
+from brewery.session import model, scenario_key, update_scenario
+from brewery.solver import solve_input
+
+
+def render(scenario):
+    """Draw the page for the current scenario"""
+    st.header("👥 Three-Investor Partnership Analysis")
+    
+    st.info("""
+    **Key Performance Indicators for Investors:**
+    1. Initial Capital Contribution per Partner
+    2. Time to Positive Cashflow
+    3. Return on Investment (ROI)
+    4. Monthly Profit Distribution
+    """)
+    
+    tab1, tab2, tab3, tab4 = st.tabs(["Capital Requirements", "Cashflow Projections", "ROI Analysis",
+                                      "Risk Simulation"])
+    
+    with tab1:
+        st.subheader("Initial Capital Investment (3 Partners)")
+        
+        funded = model()['assumptions']
+        total_startup, debt, equity = funded.initial_capital, funded.debt, funded.equity
+        
+        # Equal vs unequal split
+        equal_pcts = Partnership().partner_pcts
+        investment_split = st.radio(
+            "Investment Structure",
+            ["Equal Split (33.3% each)", "Custom Split"],
+            index=0 if scenario.partnership.partner_pcts == equal_pcts else 1,
+            key=scenario_key("investment_split")
+        )
+        
+        if investment_split == "Equal Split (33.3% each)":
+            partner_1_pct, partner_2_pct, partner_3_pct = equal_pcts
+        else:
+            saved_pcts = scenario.partnership.partner_pcts
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                partner_1_pct = st.number_input("Partner 1 Ownership %", 0.0, 100.0, float(saved_pcts[0]), 0.01,
+                                                key=scenario_key("partner_1_pct"))
+            with col2:
+                partner_2_pct = st.number_input("Partner 2 Ownership %", 0.0, 100.0, float(saved_pcts[1]), 0.01,
+                                                key=scenario_key("partner_2_pct"))
+            with col3:
+                partner_3_pct = st.number_input("Partner 3 Ownership %", 0.0, 100.0, float(saved_pcts[2]), 0.01,
+                                                key=scenario_key("partner_3_pct"))
+            
+            if abs((partner_1_pct + partner_2_pct + partner_3_pct) - 100) > 0.01:
+                st.error("⚠️ Ownership percentages must sum to 100%")
+        
+        # Capital can be contributed in different shares than ownership, e.g. a managing partner with sweat equity
+        capital_pcts = ()
+        if st.checkbox("Capital contributions differ from ownership", value=bool(scenario.partnership.capital_pcts),
+                       key=scenario_key("split_capital")):
+            saved_capital = scenario.partnership.capital_shares
+            col1, col2, col3 = st.columns(3)
+            capital_pcts = tuple(
+                col.number_input(f"Partner {i + 1} Capital %", 0.0, 100.0, float(saved_capital[i]), 0.01,
+                                 key=scenario_key(f"partner_{i + 1}_capital_pct"))
+                for i, col in enumerate((col1, col2, col3))
+            )
+            if abs(sum(capital_pcts) - 100) > 0.01:
+                st.error("⚠️ Capital contributions must sum to 100%")
+        
+        # Calculate contributions
+        partnership = replace(scenario.partnership, partner_pcts=(partner_1_pct, partner_2_pct, partner_3_pct),
+                              capital_pcts=capital_pcts)
+        scenario = update_scenario(partnership=partnership)
+        partner_1_investment, partner_2_investment, partner_3_investment = \
+            partner_investments(equity, partnership)
+        
+        # Display investment summary
+        investment_df = pd.DataFrame({
+            'Partner': ['Partner 1', 'Partner 2', 'Partner 3', 'TOTAL'],
+            'Ownership %': [f"{partner_1_pct:.2f}%", f"{partner_2_pct:.2f}%", 
+                           f"{partner_3_pct:.2f}%", "100.00%"],
+            'Initial Investment': [f"${partner_1_investment:,.0f}", f"${partner_2_investment:,.0f}",
+                                  f"${partner_3_investment:,.0f}", f"${equity:,.0f}"]
+        })
+        if capital_pcts:
+            investment_df.insert(2, 'Capital %', [f"{pct:.2f}%" for pct in capital_pcts] + ["100.00%"])
+        
+        st.table(investment_df)
+        
+        if debt:
+            st.success(f"**Total Initial Capital**: ${total_startup:,.0f} (${debt:,.0f} from loans, "
+                       f"${equity:,.0f} partner equity)")
+        else:
+            st.success(f"**Total Initial Capital**: ${total_startup:,.0f}")
+        
+        # Additional funding discussion
+        with st.expander("💡 Funding Options & Considerations"):
+            st.markdown("""
+            **Financing Options for Micro Breweries:**
+            
+            1. **Personal Investment & Friends/Family**
+               - Simplest, maintains control
+               - Limited by personal resources
+            
+            2. **Small Business Loans (SBA 7(a) & 504)**
+               - Up to $5 million available
+               - Equipment can serve as collateral
+               - Requires strong credit and business plan
+            
+            3. **Equipment Financing**
+               - Leasing or financing brewing equipment
+               - Preserves working capital
+               - Terms: 5-7 years typically
+            
+            4. **Crowdfunding (Regulation CF or Debt)**
+               - Build customer base while raising funds
+               - Platforms: StartEngine, Wefunder, Mainvest
+               - Can raise up to $5M/year
+            
+            5. **Local Grants & Economic Development**
+               - Check Charlotte-Concord economic development programs
+               - Some cities offer brewery-specific incentives
+               - Tourism/downtown revitalization grants
+            
+            6. **Angel Investors / VC**
+               - For scalable, high-growth concepts
+               - May require giving up equity
+               - Look for food/beverage industry experience
+            
+            **Tip**: Many successful breweries use a mix of personal investment (50%), 
+            equipment financing (30%), and SBA loans (20%)
+            
+            Enter loan terms under **Financial Inputs → Financing** to see the payments in every projection.
+            """)
+    
+    with tab2:
+        header = st.empty()
+        
+        # Inputs for cashflow modeling
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            starting_monthly_revenue = st.number_input(
+                "Starting Monthly Revenue (Month 1)",
+                min_value=0,
+                value=scenario.cashflow.starting_monthly_revenue, key=scenario_key("starting_monthly_revenue"),
+                step=1000,
+                help="Conservative estimate - taproom + initial accounts"
+            )
+            
+            monthly_revenue_growth = st.slider(
+                "Average Monthly Revenue Growth %",
+                0.0, 15.0, scenario.cashflow.monthly_revenue_growth, 0.5,
+                key=scenario_key("monthly_revenue_growth"),
+                help="Typical: 3-5% per month Year 1, slowing to 2-3% Year 2-3"
+            )
+        
+        with col2:
+            profit_distribution_pct = st.slider(
+                "% of Profit Distributed to Partners",
+                0, 100, scenario.partnership.profit_distribution_pct, 5,
+                key=scenario_key("profit_distribution_pct"),
+                help="Remaining % retained for growth, equipment, inventory"
+            )
+            
+            horizon_years = st.slider(
+                "Projection Horizon (Years)",
+                1, 20, max(scenario.cashflow.months // 12, 1), 1,
+                key=scenario_key("horizon_years"),
+                help="Long horizons are summarised by year below the chart"
+            )
+            
+            curves = {**GROWTH_CURVES, "Custom Fade": None}
+            current_curve = next((name for name, decay in GROWTH_CURVES.items()
+                                  if decay == scenario.cashflow.growth_decay), "Custom Fade")
+            curve_name = st.selectbox(
+                "Growth Curve", list(curves), list(curves).index(current_curve),
+                key=scenario_key("growth_curve"),
+                help="Share of the monthly growth rate that carries into each later year"
+            )
+            if curves[curve_name] is None:
+                # Start from the saved curve's year-2 retention so opening the page never rewrites it
+                saved = scenario.cashflow.growth_decay
+                saved_retention = (min(max(round(saved[1] / saved[0] * 100), 0), 100)
+                                   if len(saved) >= 2 and saved[0] > 0 else 60)
+                retention = st.slider("Growth Retained Each Year %", 0, 100, saved_retention, 1,
+                                      key=scenario_key("growth_retention"))
+                if current_curve == "Custom Fade" and retention == saved_retention:
+                    growth_decay = saved
+                else:
+                    growth_decay = fading_curve(retention, horizon_years)
+            else:
+                growth_decay = curves[curve_name]
+        
+        # Calculate the cashflow (variable costs from the cost model on Expense Analysis)
+        scenario = update_scenario(
+            cashflow=replace(scenario.cashflow, starting_monthly_revenue=starting_monthly_revenue,
+                             monthly_revenue_growth=monthly_revenue_growth,
+                             months=horizon_years * 12, growth_decay=growth_decay),
+            partnership=replace(scenario.partnership, profit_distribution_pct=profit_distribution_pct)
+        )
+        graph = model()
+        assumptions = graph['assumptions']
+        months = assumptions.months
+        horizon = horizon_label(months)
+        header.subheader(f"{months}-Month Cashflow Projection")
+        with span("Cashflow Projections", "model"):
+            projection = graph['projection']
+        breakeven_month = projection.breakeven_month
+        
+        # Plot cumulative cashflow
+        with span("Cashflow Projections", "figure"):
+            fig = cached_cashflow_chart(assumptions)
+        
+        with span("Cashflow Projections", "render"):
+            st.plotly_chart(fig, use_container_width=True)
+        st.caption(f"Variable costs: {assumptions.variable_cost_pct:.1f}% of revenue (COGS, packaging, excise, "
+                   f"sales tax and card fees from the Expense Analysis cost model)")
+        actuals = actuals_store().monthly()
+        if not actuals.empty:
+            monthly = monthly_variance(cached_plan_vs_actual(actuals, scenario.mix, assumptions))
+            if not monthly.empty:
+                planned, actual = monthly['Planned Revenue'].sum(), monthly['Actual Revenue'].sum()
+                st.caption(f"Imported actuals through {monthly['Month'].iloc[-1]}: ${actual:,.0f} revenue against "
+                           f"${planned:,.0f} projected for those months (Plan vs Actual on Revenue Projections)")
+        
+        # Key metrics
+        yearly_profit = projection.yearly(projection.profit)
+        year1_cash = projection.yearly(projection.cash_flow)[0]
+        
+        columns = st.columns(1 + min(len(yearly_profit), 3))
+        
+        if breakeven_month:
+            columns[0].metric("Breakeven Month", f"Month {breakeven_month}",
+                              help="When cumulative cashflow becomes positive")
+        else:
+            columns[0].metric("Breakeven Month", f"After Month {months}",
+                              help=f"Cumulative cashflow still negative after {months} months")
+        
+        # Years 1 and 2, then the final year
+        shown_years = sorted({0, 1, len(yearly_profit) - 1} & set(range(len(yearly_profit))))
+        for col, year in zip(columns[1:], shown_years):
+            col.metric(f"Year {year + 1} Net Profit", f"${yearly_profit[year]:,.0f}")
+        
+        if assumptions.loans:
+            min_dscr = projection.min_dscr
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Year 1 Debt Service", f"${projection.yearly(projection.debt_service)[0]:,.0f}")
+            col2.metric("Minimum Annual DSCR", f"{min_dscr:.2f}x" if min_dscr is not None else "n/a",
+                        help="Yearly profit before interest divided by loan payments")
+            col3.metric(f"Loans Owed After Month {months}", f"${projection.balance[-1]:,.0f}",
+                        f"of ${assumptions.debt:,.0f} borrowed", delta_color="off")
+        
+        if len(yearly_profit) > 3 or assumptions.loans:
+            with st.expander("📅 Yearly Summary"):
+                yearly_df = pd.DataFrame({
+                    'Year': np.arange(1, len(yearly_profit) + 1),
+                    'Revenue': projection.yearly(projection.revenue),
+                    'Net Profit': yearly_profit,
+                    'Ending Cumulative Cashflow': projection.cumulative[11::12]
+                })
+                formats = {'Revenue': '${:,.0f}', 'Net Profit': '${:,.0f}', 'Ending Cumulative Cashflow': '${:,.0f}'}
+                if assumptions.loans:
+                    yearly_df.insert(3, 'Debt Service', projection.yearly(projection.debt_service))
+                    yearly_df.insert(4, 'DSCR', projection.dscr(yearly=True))
+                    formats.update({'Debt Service': '${:,.0f}', 'DSCR': '{:.2f}x'})
+                st.dataframe(yearly_df.style.format(formats, na_rep="n/a"),
+                             use_container_width=True, hide_index=True)
+        
+        # Monthly distribution to partners, from cash left after any loan payments
+        if year1_cash > 0:
+            monthly_avg_profit_yr1 = year1_cash / 12
+            distributable = monthly_avg_profit_yr1 * (profit_distribution_pct / 100)
+            partner_1_monthly = distributable * (partner_1_pct / 100)
+            
+            st.info(f"""
+            **Average Monthly Distribution (Year 1)**:
+            - Total Distributable Profit: ${distributable:,.0f}
+            - Partner 1 ({partner_1_pct:.2f}%): ${partner_1_monthly:,.0f}/month
+            - Partner 2 ({partner_2_pct:.2f}%): ${distributable * (partner_2_pct / 100):,.0f}/month
+            - Partner 3 ({partner_3_pct:.2f}%): ${distributable * (partner_3_pct / 100):,.0f}/month
+            
+            *Note: Most owners work for reduced/no salary in Year 1-2 and reinvest profits*
+            """)
+        
+        # Goal seek: solve for the input that hits a target
+        with st.expander("🎯 Goal Seek: What Would It Take?"):
+            goal_inputs = {
+                'starting_monthly_revenue': ("Starting Monthly Revenue", starting_monthly_revenue, "${:,.0f}"),
+                'pint_price': ("Pint Price", scenario.mix.pint_price, "${:,.2f}"),
+                'monthly_rent': ("Monthly Rent", assumptions.monthly_rent, "${:,.0f}"),
+                'monthly_revenue_growth': ("Monthly Revenue Growth", monthly_revenue_growth, "{:.2f}%"),
+            }
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                goal_input = st.selectbox("Solve For", list(goal_inputs),
+                                          format_func=lambda name: goal_inputs[name][0])
+            with col2:
+                goal_type = st.selectbox("Target", ["Breakeven by Month", f"{horizon} Partner Cash ROI %",
+                                                    "Equity IRR %"])
+            with col3:
+                if goal_type == "Breakeven by Month":
+                    goal_value = st.number_input("Target Month", 1, assumptions.months, 18)
+                    goal_metric = 'breakeven_month'
+                elif goal_type == "Equity IRR %":
+                    goal_value = st.number_input("Target IRR %", -50.0, 500.0, 25.0, 5.0)
+                    goal_metric = 'equity_irr'
+                else:
+                    goal_value = st.number_input("Target ROI %", -100.0, 500.0, 0.0, 5.0)
+                    goal_metric = 'partner_roi'
+            
+            label, current, fmt = goal_inputs[goal_input]
+            solution = solve_input(assumptions, scenario.mix, profit_distribution_pct,
+                                   goal_input, goal_value, metric=goal_metric)
+            if np.isnan(solution):
+                st.warning(f"No {label.lower()} within the search range reaches this target "
+                           f"(or every value in it already does).")
+            else:
+                st.success(f"**Required {label}**: {fmt.format(solution)} "
+                           f"(currently {fmt.format(current)})")
+    
+    with tab3:
+        st.subheader("Return on Investment (ROI) Analysis")
+        
+        # Distribution terms
+        partnership = scenario.partnership
+        col1, col2 = st.columns(2)
+        with col1:
+            structure = st.radio("Distribution Structure", ["Pro Rata", "Waterfall"],
+                                 index=1 if partnership.waterfall else 0, horizontal=True,
+                                 key=scenario_key("distribution_structure"),
+                                 help="Pro rata pays every distribution by ownership. A waterfall returns "
+                                      "capital and a preferred return first, then pays the managing partner "
+                                      "a catch-up and carried interest.")
+        with col2:
+            discount_rate_pct = st.slider("Discount Rate for NPV (%)", 0.0, 30.0,
+                                          float(partnership.discount_rate_pct), 0.5,
+                                          key=scenario_key("discount_rate_pct"))
+        
+        waterfall = structure == "Waterfall"
+        terms = {}
+        if waterfall:
+            col1, col2, col3, col4 = st.columns(4)
+            terms['preferred_return_pct'] = col1.number_input(
+                "Preferred Return (%/yr)", 0.0, 30.0, float(partnership.preferred_return_pct), 0.5,
+                key=scenario_key("preferred_return_pct"))
+            terms['catch_up_pct'] = col2.number_input(
+                "Catch-Up (%)", 0.0, 100.0, float(partnership.catch_up_pct), 5.0,
+                key=scenario_key("catch_up_pct"),
+                help="Share of distributions past the preferred return paid to the managing partner "
+                     "until they have their carried interest in all profit")
+            terms['carry_pct'] = col3.number_input(
+                "Carried Interest (%)", 0.0, 50.0, float(partnership.carry_pct), 1.0,
+                key=scenario_key("carry_pct"))
+            terms['managing_partner'] = col4.selectbox(
+                "Managing Partner", range(len(partnership.names)), index=partnership.managing_partner,
+                format_func=lambda i: partnership.names[i], key=scenario_key("managing_partner"))
+        
+        partnership = replace(partnership, waterfall=waterfall, discount_rate_pct=discount_rate_pct, **terms)
+        scenario = update_scenario(partnership=partnership)
+        
+        # Calculate horizon totals and per partner ROI
+        with span("ROI Analysis", "model"):
+            returns_df = cached_partner_returns(assumptions, partnership)
+            irr = equity_irr(projection, partnership, assumptions.equity)
+        total_profit = projection.profit.sum()
+        partner_1_roi = returns_df['Cash ROI %'].iloc[0]
+        
+        # Business valuation (conservative 2x final-year revenue for craft breweries)
+        estimated_valuation = returns_df['Ownership Value'].sum()
+        
+        # Display ROI summary
+        with span("ROI Analysis", "table"):
+            roi_df = pd.DataFrame({
+                'Partner': returns_df['Partner'],
+                'Initial Investment': returns_df['Initial Investment'].map(lambda v: f"${v:,.0f}"),
+                f'{horizon} Cash Distributions': returns_df['Cash Distributions'].map(lambda v: f"${v:,.0f}"),
+                'Ownership Value (Estimated)': returns_df['Ownership Value'].map(lambda v: f"${v:,.0f}"),
+                f'Cash ROI ({horizon})': returns_df['Cash ROI %'].map(lambda v: f"{v:.1f}%"),
+                'MOIC': returns_df['MOIC'].map(lambda v: f"{v:.2f}x" if v == v else "n/a"),
+                'IRR': returns_df['IRR %'].map(lambda v: f"{v:.1f}%" if v == v else "n/a"),
+                f'NPV @ {discount_rate_pct:g}%': returns_df['NPV'].map(lambda v: f"${v:,.0f}"),
+            })
+        
+        with span("ROI Analysis", "render"):
+            st.table(roi_df)
+        
+        if waterfall:
+            with span("ROI Analysis", "table"):
+                tiers_df = cached_distribution_waterfall(assumptions, partnership)
+                tiers_df = tiers_df.set_index('Tier').map(lambda v: f"${v:,.0f}").reset_index()
+            st.markdown("**Distribution Waterfall** (operating distributions and exit proceeds)")
+            st.table(tiers_df)
+        
+        # Visualize ROI
+        with span("ROI Analysis", "figure"):
+            fig = cached_partner_returns_chart(assumptions, partnership)
+        
+        with span("ROI Analysis", "render"):
+            st.plotly_chart(fig, use_container_width=True)
+        
+        # Additional metrics
+        col1, col2, col3 = st.columns(3)
+        col1.metric(f"{horizon} Total Profit", f"${total_profit:,.0f}")
+        col2.metric("Estimated Business Value", f"${estimated_valuation:,.0f}",
+                   help="Based on 2x final-year annual revenue, less debt owed, plus cash held back "
+                        "from distributions")
+        col3.metric("Average Annual ROI", f"{(partner_1_roi / (months / 12)):.1f}%",
+                   help="Cash return only, not including equity value")
+        
+        invested = returns_df['Initial Investment'].sum()
+        received = returns_df['Cash Distributions'].sum() + estimated_valuation
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Equity IRR", f"{irr:.1f}%" if irr == irr else "n/a",
+                    help=f"Annual return on all partner equity, with the business sold at its estimated "
+                         f"value after {months} months")
+        col2.metric("Equity MOIC", f"{received / invested:.2f}x" if invested > 0 else "n/a",
+                    help="Distributions plus exit value, per dollar invested")
+        col3.metric(f"Equity NPV @ {discount_rate_pct:g}%", f"${returns_df['NPV'].sum():,.0f}")
+        
+        # Comparison to other investments
+        with st.expander("📊 ROI Comparison to Other Investments"):
+            st.markdown(f"""
+            **{horizon} ROI Comparison:**
+            - **Your Brewery**: {partner_1_roi:.1f}% cash + equity value
+            - **S&P 500 (historical avg)**: ~{10 * months / 12:.0f}% (10% annually)
+            - **Small Business Average**: 20-40% (varies widely)
+            - **Real Estate**: 15-30% (depending on market)
+            
+            **Key Differences:**
+            - Brewery requires active involvement (not passive)
+            - Higher risk, potentially higher reward
+            - Building a business asset with ongoing value
+            - Personal fulfillment & community impact
+            - Less liquid than stocks (harder to sell quickly)
+            
+            **Note**: Most brewery owners view first 2-3 years as "building phase" 
+            with full ROI potential realized in years 4-7 as business matures.
+            """)
+        
+        # Risk considerations
+        with st.expander("⚠️ Risk Factors & Mitigation"):
+            st.markdown("""
+            **Key Risks for Micro Brewery Ventures:**
+            
+            1. **Market Competition**
+               - 30+ existing breweries in Charlotte metro
+               - **Mitigation**: Unique beer styles, strong brand identity, niche focus
+            
+            2. **Operating Complexity**
+               - Brewing requires technical skill
+               - Quality control critical
+               - **Mitigation**: Hire experienced brewmaster, invest in training, QC processes
+            
+            3. **Capital Intensity**
+               - High upfront equipment costs
+               - Working capital needs (ingredients, payroll)
+               - **Mitigation**: Phased growth, equipment financing, maintain reserves
+            
+            4. **Regulatory Requirements**
+               - Federal (TTB) and state licensing
+               - Ongoing compliance and reporting
+               - **Mitigation**: Work with experienced beverage attorney, maintain good records
+            
+            5. **Market Shifts**
+               - Consumer preferences change
+               - Economic downturns affect discretionary spending
+               - **Mitigation**: Diversify beer styles, build loyal community, maintain quality
+            
+            6. **Distribution Challenges**
+               - Getting tap handles in crowded market
+               - Distributor relationships
+               - **Mitigation**: Focus on taproom first, self-distribute initially, build reputation
+            
+            **Success Factors:**
+            - Strong business plan with realistic projections
+            - Experienced brewing talent
+            - Differentiated product offering
+            - Community engagement and marketing
+            - Financial discipline and contingency planning
+            - Location with good foot traffic and visibility
+            """)
+    
+    with tab4:
+        st.subheader("Monte Carlo Risk Simulation")
+        
+        st.markdown(f"""
+        The cashflow projection above is a single deterministic path. This simulation draws revenue
+        growth, variable costs, rent and payroll from triangular distributions (low / most likely / high)
+        centred on your inputs and runs thousands of {months}-month paths at once.
+        """)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            growth_range = st.slider(
+                "Monthly Revenue Growth Range %",
+                0.0, 20.0,
+                (max(monthly_revenue_growth - 2.0, 0.0), monthly_revenue_growth + 2.0), 0.5,
+                help=f"Most likely value: {monthly_revenue_growth:.1f}% (from Cashflow Projections)"
+            )
+            cost_range = st.slider(
+                "Variable Costs Range (% of Revenue)",
+                5.0, 50.0, (float(max(round(assumptions.variable_cost_pct) - 6, 5)),
+                            float(min(round(assumptions.variable_cost_pct) + 6, 50))), 1.0,
+                help=f"Most likely value: {assumptions.variable_cost_pct:.1f}% (from the Expense Analysis cost model)"
+            )
+            cash_reserve = st.number_input(
+                "Operating Cash Reserve",
+                min_value=0,
+                value=40000,
+                step=5000,
+                help="Cash on hand after startup spend (e.g. contingency fund) to absorb early losses"
+            )
+        
+        with col2:
+            rent_spread = st.slider("Rent Uncertainty (±%)", 0, 50, 10, 5)
+            payroll_spread = st.slider("Payroll Uncertainty (±%)", 0, 50, 15, 5)
+            paths = st.select_slider("Simulated Paths", [10000, 25000, 50000, 100000], 25000)
+        
+        rent = assumptions.monthly_rent
+        payroll = assumptions.monthly_payroll
+        risk = RiskModel(
+            monthly_revenue_growth=Triangular(growth_range[0], monthly_revenue_growth, growth_range[1]),
+            variable_cost_pct=Triangular(cost_range[0], assumptions.variable_cost_pct, cost_range[1]),
+            monthly_rent=Triangular(rent * (1 - rent_spread / 100), rent, rent * (1 + rent_spread / 100)),
+            monthly_payroll=Triangular(payroll * (1 - payroll_spread / 100), payroll,
+                                       payroll * (1 + payroll_spread / 100)),
+            cash_reserve=cash_reserve
+        )
+        
+        with st.spinner("Simulating..."):
+            result = cached_simulation(assumptions, risk, paths, seed=42)
+        
+        st.plotly_chart(charts.cashflow_fan_chart(result), use_container_width=True)
+        
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Probability of Running Out of Cash", f"{result.prob_out_of_cash * 100:.1f}%",
+                   help="Share of paths where reserve plus operating cashflow drops below zero")
+        col2.metric(f"Probability of Breakeven ({months} mo)", f"{result.prob_breakeven * 100:.1f}%")
+        col3.metric("Median Breakeven Month",
+                   f"Month {result.median_breakeven}" if result.median_breakeven else f"After Month {months}",
+                   help=f"Among paths that break even within {months} months")
+        col4.metric(f"Median Month {months} Cashflow", f"${result.percentiles[2][-1]:,.0f}")
+        
+        st.plotly_chart(charts.breakeven_histogram(result), use_container_width=True)
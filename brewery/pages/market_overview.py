@@ -0,0 +1,116 @@
+"""Market Overview page: local breweries and industry benchmarks"""
+import pandas as pd
+import streamlit as st
+
+
+def render(scenario):
+    """Draw the page for the current scenario"""
+    st.header("Market Research: Charlotte-Concord Region")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("🍺 Local Craft Breweries")
+        st.markdown("**Charlotte has 30+ craft breweries** - one of the fastest-growing craft beer scenes in the Southeast")
+        
+        breweries = pd.DataFrame({
+            'Brewery': [
+                'Olde Mecklenburg Brewery (OMB)',
+                'NoDa Brewing Company',
+                'Wooden Robot Brewery',
+                'Divine Barrel Brewing',
+                'Cabarrus Brewing Co.',
+                'Birdsong Brewing',
+                'Lower Left Brewing',
+                'Petty Thieves Brewing',
+                'HopFly Brewing',
+                'Southern Strain (Concord)'
+            ],
+            'Location': [
+                'Charlotte (Since 2009)',
+                'Charlotte NoDa',
+                'Charlotte (NoDa & South End)',
+                'Charlotte NoDa',
+                'Concord',
+                'Charlotte Belmont',
+                'Charlotte LoSo',
+                'Charlotte (Camp North End)',
+                'Charlotte',
+                'Concord'
+            ],
+            'Specialties': [
+                'German-style lagers',
+                'IPAs, Wide variety',
+                'Good Morning Vietnam blonde ale',
+                'West Coast IPAs, Lagers',
+                'Core beers, Local focus',
+                'American-style unfiltered ale',
+                'IPAs, Sours, Belgian styles',
+                'Saisons, Sours, Lagers',
+                'Hazy IPAs, West Coast IPAs',
+                'Various craft styles'
+            ],
+            'Features': [
+                'Largest biergarten in Southeast',
+                'Beer garden, Established 2011',
+                'Two locations, Innovation',
+                'Rotating selections',
+                '100% local, Events venue',
+                'Est. 2011, Community focus',
+                '7-barrel brewhouse, Opened 2019',
+                'Eclectic, unique styles',
+                'Rocky Mount expansion',
+                'Plaza Midwood taproom'
+            ]
+        })
+        
+        st.dataframe(breweries, use_container_width=True, hide_index=True)
+        
+        st.success("""
+        **Key Insights**: 
+        - Charlotte established its craft beer scene in 2009 (OMB)
+        - 30+ breweries currently operating
+        - Strong brewery tourism and taproom culture
+        - Concord area has active breweries with Charlotte access
+        """)
+    
+    with col2:
+        st.subheader("📊 Industry Statistics")
+        
+        metrics_col1, metrics_col2 = st.columns(2)
+        with metrics_col1:
+            st.metric("US Craft Breweries", "9,552", help="Total craft breweries (2022)")
+            st.metric("Charlotte Metro Breweries", "30+", help="Within Charlotte-Concord region")
+            st.metric("Typical Profit Margin", "20-25%", help="Net profit margin for successful breweries")
+        with metrics_col2:
+            st.metric("Gross Margin on Beer", "74-92%", help="Before operating expenses")
+            st.metric("Taproom Advantage", "Higher", help="Direct sales = better margins")
+            st.metric("Avg Annual Revenue", "$1-3M", help="Small craft brewery range")
+        
+        st.subheader("💰 Market Opportunity")
+        st.markdown("""
+        **Revenue Channels:**
+        - **Taproom Sales**: Highest margins (direct-to-consumer)
+        - **Self-Distribution**: Better margins than distributors
+        - **Distribution Partnerships**: Volume sales, lower margins
+        - **Tours & Events**: Additional revenue + marketing
+        - **Merchandise**: Branded items (t-shirts, glassware)
+        - **Food Service** (optional): Gastropub model
+        
+        **Charlotte-Concord Advantages:**
+        - Established craft beer culture (15+ years)
+        - Growing population and tourism
+        - Brewery-hopping is popular activity
+        - Strong local support for craft businesses
+        - Lower costs than major metro areas
+        - NC beer-friendly regulations
+        """)
+        
+        st.info("""
+        **Competitive Positioning Tips:**
+        - Differentiate with unique beer styles
+        - Focus on quality and consistency
+        - Build strong taproom experience
+        - Engage local community
+        - Consider niche markets (sours, lagers, sessionable beers)
+        """)
@@ -0,0 +1,583 @@
+"""Revenue Projections page: pricing, sales volume, seasonality, brewing capacity, mix optimizer, revenue forecast
+and plan vs actual
+"""
+from dataclasses import replace
+from datetime import date
+
+import pandas as pd
+import streamlit as st
+
+from brewery import charts
+from brewery.assumptions import MONTH_NAMES, Brewhouse, Calendar, Event, ProductMix
+from brewery.actuals import import_actuals, monthly_variance
+from brewery.cache import (actuals_store, cached_configuration_grid, cached_mix_optimum, cached_plan_vs_actual,
+                           cached_revenue_forecast, cached_revenue_forecast_chart, cached_schedule, cached_seasonality)
+from brewery.capacity import sized_for_budget
+from brewery.instrument import span
+from brewery.optimizer import PRODUCTS, MixLimits, horizon_factors, unit_margins
+from brewery.projection import SEASONAL_PROFILES, horizon_label, month_labels, project_cashflow
+from brewery.reforecast import MIN_HISTORY, RollingFit, observed_cost_pct, observed_revenue, reforecast
+from brewery.session import model, reset_scenario, scenario_key, update_scenario
+
+# Months shown in the seasonality preview
+PREVIEW_MONTHS = 24
+
+# Highest seasonal revenue multiplier the monthly index inputs accept
+MAX_SEASONAL_INDEX = 3.0
+
+# Tank counts compared in the configuration grid
+FERMENTER_COUNTS = tuple(range(2, 17))
+BRITE_TANK_COUNTS = tuple(range(1, 7))
+
+
+def render(scenario):
+    """Draw the page for the current scenario"""
+    st.header("📈 Revenue Projections & Product Mix")
+    
+    st.info("""
+    **Brewery Revenue Model**: Unlike distilleries, breweries have faster production cycles (2-4 weeks) 
+    allowing for quicker revenue generation and more responsive production to customer preferences.
+    """)
+    
+    tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs(["Beer Pricing", "Sales Volume", "Seasonality & Events",
+                                                        "Brewing Capacity", "Mix Optimizer", "Revenue Forecast",
+                                                        "Plan vs Actual"])
+    
+    with tab1:
+        st.subheader("Beer Portfolio & Pricing Strategy")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### Taproom (Direct Sales)")
+            pint_price = st.number_input("Pint Price (16 oz)", min_value=0.0, value=scenario.mix.pint_price, key=scenario_key("pint_price"), step=0.25,
+                                        help="Typical range: $6-$9 depending on style")
+            flight_price = st.number_input("Flight Price (4x 5oz samples)", min_value=0.0,
+                                           value=scenario.mix.flight_price, key=scenario_key("flight_price"), step=0.50)
+            growler_price = st.number_input("Growler Fill (64 oz)", min_value=0.0,
+                                            value=scenario.mix.growler_price, key=scenario_key("growler_price"), step=1.0)
+            
+            # Calculate costs
+            pint_cogs = st.slider("Cost per Pint (COGS)", 0.50, 3.00, scenario.mix.pint_cogs, 0.10, key=scenario_key("pint_cogs"),
+                                 help="Ingredients + packaging for one pint")
+            
+            pint_margin = ((pint_price - pint_cogs) / pint_price) * 100
+            st.metric("Pint Gross Margin", f"{pint_margin:.1f}%",
+                     help=f"Price: ${pint_price} | COGS: ${pint_cogs}")
+        
+        with col2:
+            st.markdown("#### Wholesale/Distribution")
+            keg_price = st.number_input("Keg Price (1/2 BBL, 15.5 gal)", min_value=0.0,
+                                        value=scenario.mix.keg_price, key=scenario_key("keg_price"), step=10.0,
+                                       help="Price to distributor or direct to accounts. Typical: $150-$250")
+            case_price = st.number_input("Case Price (4-pack x 6 = 24 cans)", min_value=0.0,
+                                         value=scenario.mix.case_price, key=scenario_key("case_price"), step=2.0,
+                                        help="Wholesale case price to distributor")
+            
+            keg_cogs = st.slider("Cost per Keg (COGS)", 20.0, 80.0, scenario.mix.keg_cogs, 5.0, key=scenario_key("keg_cogs"),
+                                help="Ingredients + keg for 1/2 barrel")
+            
+            keg_margin = ((keg_price - keg_cogs) / keg_price) * 100
+            st.metric("Keg Gross Margin", f"{keg_margin:.1f}%",
+                     help=f"Price: ${keg_price} | COGS: ${keg_cogs}")
+            
+            st.caption("Note: 1 keg = 124 pints | Taproom pint more profitable than wholesale")
+        
+        st.markdown("---")
+        
+        # Additional revenue streams
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            tour_price = st.number_input("Brewery Tour Price", min_value=0.0, value=scenario.mix.tour_price, key=scenario_key("tour_price"), step=5.0)
+        with col2:
+            merch_avg = st.number_input("Avg Merch Sale", min_value=0.0, value=scenario.mix.merch_avg, key=scenario_key("merch_avg"), step=5.0,
+                                       help="T-shirts, glassware, etc.")
+        with col3:
+            food_enabled = st.checkbox("Include Food Sales", value=scenario.mix.food_enabled, key=scenario_key("food_enabled"),
+                                      help="Check if running gastropub model")
+    
+    with tab2:
+        st.subheader("Monthly Sales Volume Projections")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### Taproom Sales (Per Month)")
+            monthly_pints = st.number_input("Pints Sold", min_value=0, value=scenario.mix.monthly_pints, key=scenario_key("monthly_pints"), step=100,
+                                           help="Typical small taproom: 2,000-5,000 pints/month")
+            monthly_flights = st.number_input("Flights Sold", min_value=0, value=scenario.mix.monthly_flights, key=scenario_key("monthly_flights"), step=10)
+            monthly_growlers = st.number_input("Growler Fills", min_value=0, value=scenario.mix.monthly_growlers, key=scenario_key("monthly_growlers"), step=10)
+            monthly_tours = st.number_input("Tour Participants", min_value=0, value=scenario.mix.monthly_tours, key=scenario_key("monthly_tours"), step=10)
+            monthly_merch = st.number_input("Merchandise Transactions", min_value=0, value=scenario.mix.monthly_merch, key=scenario_key("monthly_merch"), step=5)
+        
+        with col2:
+            st.markdown("#### Wholesale Distribution (Per Month)")
+            monthly_kegs = st.number_input("Kegs Sold", min_value=0, value=scenario.mix.monthly_kegs, key=scenario_key("monthly_kegs"), step=5,
+                                          help="Typical start: 20-50 kegs/month to local accounts")
+            monthly_cases = st.number_input("Cases Sold (24-count)", min_value=0, value=scenario.mix.monthly_cases, key=scenario_key("monthly_cases"), step=10,
+                                           help="For canned/bottled distribution")
+            
+            if food_enabled:
+                monthly_food = st.number_input("Monthly Food Sales", min_value=0, value=scenario.mix.monthly_food, key=scenario_key("monthly_food"), step=500,
+                                             help="If operating as gastropub")
+            else:
+                monthly_food = 0
+        
+        # Calculate monthly revenue (a disabled food line keeps its last amount for later)
+        mix = ProductMix(
+            pint_price=pint_price, flight_price=flight_price, growler_price=growler_price,
+            pint_cogs=pint_cogs, keg_price=keg_price, case_price=case_price, keg_cogs=keg_cogs,
+            tour_price=tour_price, merch_avg=merch_avg, food_enabled=food_enabled,
+            monthly_pints=monthly_pints, monthly_flights=monthly_flights,
+            monthly_growlers=monthly_growlers, monthly_tours=monthly_tours,
+            monthly_merch=monthly_merch, monthly_kegs=monthly_kegs,
+            monthly_cases=monthly_cases,
+            monthly_food=monthly_food if food_enabled else scenario.mix.monthly_food
+        )
+        scenario = update_scenario(mix=mix)
+        
+        taproom_revenue = mix.taproom_revenue
+        wholesale_revenue = mix.wholesale_revenue
+        total_monthly_revenue = mix.total_revenue
+        
+        st.success(f"### Projected Monthly Revenue: ${total_monthly_revenue:,.0f}")
+        
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Taproom Revenue", f"${taproom_revenue:,.0f}", 
+                   f"{(taproom_revenue/total_monthly_revenue*100):.1f}%")
+        col2.metric("Wholesale Revenue", f"${wholesale_revenue:,.0f}",
+                   f"{(wholesale_revenue/total_monthly_revenue*100):.1f}%")
+        if food_enabled:
+            col3.metric("Food Revenue", f"${monthly_food:,.0f}",
+                       f"{(monthly_food/total_monthly_revenue*100):.1f}%")
+        col4.metric("Annual Projection", f"${total_monthly_revenue * 12:,.0f}")
+        
+        # Production capacity check
+        total_bbls_needed = mix.total_bbls
+        
+        st.info(f"""
+        **Production Requirements**: ~{total_bbls_needed:.0f} barrels/month ({total_bbls_needed * 12:.0f} BBL/year)
+        
+        This volume requires approximately:
+        - 7-BBL system: {total_bbls_needed/7:.1f} brews per month (brewing ~{total_bbls_needed/7/4:.1f}x per week)
+        - 10-BBL system: {total_bbls_needed/10:.1f} brews per month
+        - 15-BBL system: {total_bbls_needed/15:.1f} brews per month
+        
+        The Brewing Capacity tab checks this against your fermenters and brite tanks.
+        """)
+    
+    with tab3:
+        st.subheader("Seasonality & Event Calendar")
+        st.caption("Seasonal indices and events multiply projected revenue month by month, "
+                   "in the forecast below and in every cashflow projection")
+        calendar = scenario.cashflow.calendar
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            year, month = (int(part) for part in calendar.start_month.split('-'))
+            opening = st.date_input("Opening Month", date(year, month, 1), key=scenario_key("start_month"),
+                                    help="Calendar month of projection month 1")
+        with col2:
+            profiles = {**SEASONAL_PROFILES, "Custom": None}
+            current_profile = next((name for name, index in SEASONAL_PROFILES.items()
+                                    if index == calendar.seasonal_index), "Custom")
+            profile = st.selectbox("Seasonal Profile", list(profiles), list(profiles).index(current_profile),
+                                   key=scenario_key("seasonal_profile"),
+                                   help="Revenue multiplier for each calendar month; 1.0 is an average month")
+        
+        # One input per calendar month, starting fresh from a profile's values when it is picked
+        base_index = profiles[profile] or calendar.seasonal_index
+        index_cols = st.columns(6)
+        seasonal_index = tuple(
+            index_cols[m % 6].number_input(name, 0.0, MAX_SEASONAL_INDEX, float(base_index[m]), 0.05,
+                                           key=scenario_key(f"season_{profile}_{m}"))
+            for m, name in enumerate(MONTH_NAMES)
+        )
+        
+        st.markdown("**Event Calendar** (festivals, releases, closures)")
+        # The editor applies its edits on top of the events it started from, so keep those fixed
+        base_events = st.session_state.setdefault(scenario_key("events_base"), calendar.events)
+        edited = st.data_editor(
+            pd.DataFrame({
+                'Event': pd.Series([e.name for e in base_events], dtype=str),
+                'Month': pd.to_datetime([e.month for e in base_events]),
+                'Revenue Change %': pd.Series([e.uplift_pct for e in base_events], dtype=float),
+                'Annual': pd.Series([e.annual for e in base_events], dtype=bool),
+            }),
+            column_config={
+                'Month': st.column_config.DateColumn(format="MMM YYYY"),
+                'Revenue Change %': st.column_config.NumberColumn(min_value=-100.0, max_value=500.0, step=5.0),
+                'Annual': st.column_config.CheckboxColumn(help="Repeats in the same month every year"),
+            },
+            num_rows="dynamic", use_container_width=True, hide_index=True, key=scenario_key("events")
+        )
+        # Rows without a name or month are still being typed in
+        events = tuple(
+            Event(row['Event'].strip(), f"{row['Month']:%Y-%m}", float(row['Revenue Change %']), bool(row['Annual']))
+            for row in edited.fillna({'Revenue Change %': 0.0, 'Annual': False}).to_dict('records')
+            if isinstance(row['Event'], str) and row['Event'].strip() and not pd.isna(row['Month'])
+        )
+        
+        calendar = Calendar(f"{opening.year}-{opening.month:02d}", seasonal_index, events)
+        scenario = update_scenario(cashflow=replace(scenario.cashflow, calendar=calendar))
+        
+        with span("Seasonality", "model"):
+            multipliers = cached_seasonality(calendar, PREVIEW_MONTHS)
+        with span("Seasonality", "figure"):
+            fig = charts.seasonality_chart(month_labels(calendar, PREVIEW_MONTHS), multipliers)
+        with span("Seasonality", "render"):
+            st.plotly_chart(fig, use_container_width=True)
+        
+        average_index = sum(seasonal_index) / 12
+        if abs(average_index - 1) > 0.005:
+            st.warning(f"Seasonal indices average {average_index:.2f}, so they also scale annual revenue "
+                       f"by {(average_index - 1) * 100:+.0f}%. Indices averaging 1.0 only reshape the year.")
+    
+    with tab4:
+        st.subheader("Brewhouse & Cellar Capacity")
+        st.caption("Simulates every brew day, fermentation, brite tank and packaging run against the "
+                   "monthly demand from Sales Volume, growing and swinging with the cashflow projection")
+        brewhouse = scenario.brewhouse
+        equipment_cost = scenario.startup.equipment_cost
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            auto_size = st.checkbox("Size From Equipment Budget", brewhouse.auto_size, key=scenario_key("auto_size"),
+                                    help=f"${equipment_cost:,.0f} brewing equipment (Financial Inputs)")
+            if auto_size:
+                budget_sized = sized_for_budget(replace(brewhouse, auto_size=True), equipment_cost)
+                batch_bbl, fermenters, brite_tanks = (budget_sized.batch_bbl, budget_sized.fermenters,
+                                                      budget_sized.brite_tanks)
+                st.markdown(f"**{batch_bbl:g}-BBL brewhouse**, {fermenters} fermenters, {brite_tanks} brite tanks")
+            else:
+                batch_bbl = st.number_input("Brewhouse Size (BBL)", 1.0, 60.0, float(brewhouse.batch_bbl), 0.5,
+                                            key=scenario_key("batch_bbl"))
+                fermenters = st.number_input("Fermenters", 1, 40, brewhouse.fermenters,
+                                             key=scenario_key("fermenters"))
+                brite_tanks = st.number_input("Brite Tanks", 1, 20, brewhouse.brite_tanks,
+                                              key=scenario_key("brite_tanks"))
+        with col2:
+            ferment_days = st.slider("Fermentation (Days)", 7, 42, brewhouse.ferment_days,
+                                     key=scenario_key("ferment_days"), help="About 14 for ales, 28 for lagers")
+            condition_days = st.slider("Brite Tank & Packaging (Days)", 1, 14, brewhouse.condition_days,
+                                       key=scenario_key("condition_days"))
+            brew_days_per_week = st.slider("Brew Days per Week", 1, 7, brewhouse.brew_days_per_week,
+                                           key=scenario_key("brew_days_per_week"))
+        with col3:
+            yield_pct = st.slider("Packaged Yield %", 70.0, 100.0, brewhouse.yield_pct, 1.0,
+                                  key=scenario_key("yield_pct"), help="Share of brewed volume that reaches a glass")
+            cap_sales = st.checkbox("Cap Projected Sales at Capacity", brewhouse.cap_sales,
+                                    key=scenario_key("cap_sales"),
+                                    help="Cut beer revenue in cashflow projections by the simulated lost sales")
+        
+        scenario = update_scenario(brewhouse=Brewhouse(
+            auto_size=auto_size, batch_bbl=batch_bbl, fermenters=fermenters, brite_tanks=brite_tanks,
+            ferment_days=ferment_days, condition_days=condition_days, brew_days_per_week=brew_days_per_week,
+            yield_pct=yield_pct, cap_sales=cap_sales
+        ))
+        cellar = sized_for_budget(scenario.brewhouse, equipment_cost)
+        # Keyed on the sales volume inputs alone, so fixed-cost and financing edits keep the cached schedule
+        drivers = model()['volume_drivers']
+        
+        with span("Brewing Capacity", "model"):
+            result, capacity, flat_out = cached_schedule(cellar, scenario.mix, drivers)
+        
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Sustainable Capacity", f"{capacity:,.0f} BBL/mo",
+                   help="Packaged output brewing on every brew day a fermenter is free")
+        col2.metric("Peak Monthly Demand", f"{result.demand.max():,.0f} BBL")
+        col3.metric("Lost Sales", f"{result.lost.sum():,.0f} BBL", f"{result.lost_pct:.1f}% of demand",
+                   delta_color="inverse")
+        col4.metric("Bottleneck", flat_out.bottleneck,
+                   help="Resource that caps flat-out production")
+        
+        with span("Brewing Capacity", "figure"):
+            labels = month_labels(scenario.cashflow.calendar, len(result.demand))
+            fig = charts.capacity_chart(labels, result, capacity)
+        with span("Brewing Capacity", "render"):
+            st.plotly_chart(fig, use_container_width=True)
+        
+        st.dataframe(pd.DataFrame({
+            'Resource': ["Brewhouse (brew days)", "Fermenters", "Brite Tanks", "Fermenters Holding Finished Beer"],
+            'Use at Flat Out': [flat_out.brewhouse_use, flat_out.fermenter_use, flat_out.brite_use,
+                                flat_out.fermenter_held],
+            'Use Meeting Demand': [result.brewhouse_use, result.fermenter_use, result.brite_use,
+                                   result.fermenter_held],
+        }).style.format({'Use at Flat Out': '{:.0%}', 'Use Meeting Demand': '{:.0%}'}),
+            use_container_width=True, hide_index=True)
+        
+        if cap_sales:
+            st.info(f"Cashflow projections use capped sales: {result.lost_pct:.1f}% of beer demand goes unmet "
+                    f"over the {len(result.demand)}-month horizon.")
+        
+        if st.checkbox("Compare Tank Configurations", key=scenario_key("compare_tanks")):
+            with span("Tank Configurations", "model"):
+                lost_grid, _ = cached_configuration_grid(cellar, scenario.mix, drivers,
+                                                         FERMENTER_COUNTS, BRITE_TANK_COUNTS)
+            st.plotly_chart(charts.sweep_heatmap(lost_grid, FERMENTER_COUNTS, BRITE_TANK_COUNTS, "Fermenters",
+                                                 "Brite Tanks", "Lost Sales %"), use_container_width=True)
+            st.caption(f"{len(FERMENTER_COUNTS) * len(BRITE_TANK_COUNTS)} cellar layouts, each simulated "
+                       f"day by day over the projection horizon")
+    
+    with tab5:
+        st.subheader("Taproom vs Wholesale Mix Optimizer")
+        st.caption("Finds the pints, flights, growlers, kegs and cases that earn the most beer gross profit "
+                   "within brewing capacity, taproom seating and distribution commitments")
+        horizon = horizon_label(scenario.cashflow.months)
+        limits = MixLimits()
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.markdown("#### Objective & Capacity")
+            objective = st.radio("Maximize", ["monthly", "npv"], key="mix_objective",
+                                 format_func={"monthly": "Monthly Gross Profit",
+                                              "npv": f"{horizon} Gross Profit NPV"}.get,
+                                 help="NPV follows the growth and seasonality of the cashflow projection")
+            discount_rate = st.slider("Discount Rate %", 0.0, 30.0, 10.0, 0.5, key="mix_discount_rate",
+                                      disabled=objective == "monthly")
+            use_simulated = st.checkbox("Use Simulated Capacity", True, key="mix_use_simulated",
+                                        help=f"{capacity:,.0f} BBL/mo sustainable output from Brewing Capacity")
+            capacity_bbl = capacity if use_simulated else st.number_input(
+                "Brewing Capacity (BBL/mo)", 1.0, 2000.0, float(round(capacity)), 5.0, key="mix_capacity_bbl")
+        with col2:
+            st.markdown("#### Taproom Seating")
+            seats = st.number_input("Seats", 1, 500, limits.seats, key="mix_seats")
+            open_hours = st.number_input("Open Hours per Week", 1.0, 112.0, limits.open_hours_per_week, 1.0,
+                                         key="mix_open_hours")
+            seat_utilization = st.slider("Seat Utilization %", 10.0, 100.0, limits.seat_utilization_pct, 5.0,
+                                         key="mix_seat_utilization",
+                                         help="Share of open seat-hours that can realistically be filled")
+            hours_per_pint = st.number_input("Seat Hours per Pint", 0.1, 3.0, limits.hours_per_pint, 0.05,
+                                             key="mix_hours_per_pint")
+            hours_per_flight = st.number_input("Seat Hours per Flight", 0.1, 3.0, limits.hours_per_flight, 0.05,
+                                               key="mix_hours_per_flight")
+        with col3:
+            st.markdown("#### Distribution Commitments")
+            min_kegs = st.number_input("Minimum Kegs per Month", 0, 1000, int(limits.min_kegs), 5,
+                                       key="mix_min_kegs", help="Commitments to wholesale accounts")
+            min_cases = st.number_input("Minimum Cases per Month", 0, 5000, int(limits.min_cases), 10,
+                                        key="mix_min_cases")
+        
+        st.markdown("#### Market Demand (Most Each Product Will Sell per Month)")
+        ceiling_cols = st.columns(len(PRODUCTS))
+        ceilings = {
+            field: col.number_input(label, 0, 100000, int(getattr(limits, field.replace('monthly_', 'max_'))),
+                                    key=f"mix_max_{field}")
+            for col, (field, label) in zip(ceiling_cols, PRODUCTS.items())
+        }
+        
+        limits = MixLimits(
+            capacity_bbl=capacity_bbl, seats=seats, open_hours_per_week=open_hours,
+            seat_utilization_pct=seat_utilization, hours_per_pint=hours_per_pint,
+            hours_per_flight=hours_per_flight, min_kegs=min_kegs, min_cases=min_cases,
+            **{field.replace('monthly_', 'max_'): float(v) for field, v in ceilings.items()}
+        )
+        value_factor, peak_factor = (horizon_factors(scenario.cashflow, discount_rate) if objective == "npv"
+                                     else (1.0, 1.0))
+        
+        with span("Mix Optimizer", "model"):
+            solution = cached_mix_optimum(scenario.mix, limits, value_factor, peak_factor)
+        
+        if not solution.optimal:
+            st.warning(f"No mix meets every limit ({solution.status}). Lower the keg and case minimums "
+                       f"or raise brewing capacity.")
+        else:
+            margins = unit_margins(scenario.mix)
+            current_volumes = [getattr(scenario.mix, field) for field in PRODUCTS]
+            optimal_volumes = [getattr(solution.mix, field) for field in PRODUCTS]
+            current_profit = float(margins @ current_volumes)
+            
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Current Beer Gross Profit", f"${current_profit:,.0f}/mo")
+            col2.metric("Optimal Beer Gross Profit", f"${solution.gross_profit:,.0f}/mo",
+                       f"${solution.gross_profit - current_profit:+,.0f}")
+            if objective == "npv":
+                col3.metric(f"Optimal {horizon} NPV", f"${solution.objective:,.0f}",
+                           f"${solution.objective - current_profit * value_factor:+,.0f}")
+            else:
+                col3.metric("Optimal Volume", f"{solution.mix.total_bbls:,.1f} BBL/mo",
+                           f"{solution.mix.total_bbls - scenario.mix.total_bbls:+,.1f} BBL")
+            
+            st.dataframe(pd.DataFrame({
+                'Product': list(PRODUCTS.values()),
+                'Gross Profit per Unit': margins,
+                'Current': current_volumes,
+                'Optimal': optimal_volumes,
+                'Change': [optimal - current for optimal, current in zip(optimal_volumes, current_volumes)],
+            }).style.format({'Gross Profit per Unit': '${:,.2f}', 'Current': '{:,.0f}', 'Optimal': '{:,.0f}',
+                             'Change': '{:+,.0f}'}),
+                use_container_width=True, hide_index=True)
+            
+            st.markdown("#### Shadow Prices")
+            st.dataframe(solution.to_frame().style.format({'Shadow Price': '${:,.2f}', 'Slack': '{:,.1f}'}),
+                         use_container_width=True, hide_index=True)
+            st.caption(f"{'Monthly gross profit' if objective == 'monthly' else f'{horizon} NPV'} gained from "
+                       f"one more unit of each limit. Limits with slack are not binding and are worth nothing "
+                       f"at the margin.")
+            
+            if st.button("Apply Optimal Mix", disabled=solution.mix == scenario.mix,
+                         help="Replace the Sales Volume inputs with the optimal volumes"):
+                reset_scenario(replace(scenario, mix=solution.mix))
+                st.rerun()
+    
+    with tab6:
+        header = st.empty()
+        
+        # Growth assumptions
+        col1, col2 = st.columns(2)
+        with col1:
+            monthly_growth = st.slider("Month-over-Month Growth Rate %", 0.0, 15.0, scenario.forecast_growth, 0.5, key=scenario_key("forecast_growth"),
+                                       help="Typical: 2-5% per month as brand grows")
+        with col2:
+            forecast_months = st.slider("Forecast Horizon (Months)", 12, 120, scenario.forecast_months, 12,
+                                        key=scenario_key("forecast_months"),
+                                        help="Growth fades over the years following the curve set under Investor Analysis")
+        
+        scenario = update_scenario(forecast_growth=monthly_growth, forecast_months=forecast_months)
+        header.subheader(f"{forecast_months}-Month Revenue Forecast")
+        growth_decay = scenario.cashflow.growth_decay
+        
+        # Generate the monthly forecast
+        with span("Revenue Forecast", "model"):
+            forecast_df = cached_revenue_forecast(mix, monthly_growth, forecast_months, growth_decay, calendar)
+        
+        # Stacked bar chart
+        with span("Revenue Forecast", "figure"):
+            fig = cached_revenue_forecast_chart(mix, monthly_growth, forecast_months, growth_decay, calendar)
+        
+        with span("Revenue Forecast", "render"):
+            st.plotly_chart(fig, use_container_width=True)
+        if scenario.brewhouse.cap_sales:
+            st.caption("This forecast shows demand; brewing capacity caps apply to the cashflow projections.")
+        
+        # Summary metrics
+        total_year1_revenue = forecast_df['Total Revenue'].iloc[:12].sum()
+        avg_monthly_revenue = forecast_df['Total Revenue'].mean()
+        
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Year 1 Total Revenue", f"${total_year1_revenue:,.0f}")
+        col2.metric("Average Monthly Revenue", f"${avg_monthly_revenue:,.0f}")
+        col3.metric(f"{forecast_df['Month'].iloc[-1]} Revenue", f"${forecast_df['Total Revenue'].iloc[-1]:,.0f}")
+    
+    with tab7:
+        st.subheader("Plan vs Actual")
+        st.caption("Import POS transaction exports (CSV or Parquet) with a date, item or category, and optionally "
+                   "quantity and net sales columns. Files are read in chunks and only monthly totals are kept; "
+                   "re-importing a file re-reads it from its last imported month, replacing that month's totals.")
+        store = actuals_store()
+        
+        uploads = st.file_uploader("POS Exports", type=["csv", "parquet"], accept_multiple_files=True,
+                                   key="actuals_uploads")
+        col1, col2 = st.columns([1, 4])
+        if col1.button("Import", disabled=not uploads):
+            progress = st.progress(0.0, text="Importing...")
+            for number, upload in enumerate(uploads):
+                def report(rows, number=number, upload=upload):
+                    progress.progress(number / len(uploads), text=f"{upload.name}: {rows:,} rows read")
+                try:
+                    summary = import_actuals(store, upload, progress=report)
+                except ValueError as exc:
+                    st.error(f"❌ {upload.name}: {exc}")
+                    continue
+                if summary.skipped:
+                    st.info(f"{summary.source}: already imported, unchanged")
+                else:
+                    through = f", through {summary.through[:10]}" if summary.through else ", no dated rows"
+                    st.success(f"{summary.source}: {summary.rows_imported:,} of {summary.rows_read:,} rows read "
+                               f"imported{through}")
+            progress.empty()
+        if col2.button("Clear Imported Actuals"):
+            store.clear()
+        
+        actuals = store.monthly()
+        if actuals.empty:
+            st.info("No actuals imported yet.")
+        else:
+            with span("Plan vs Actual", "model"):
+                assumptions = model()['assumptions']
+                variance = cached_plan_vs_actual(actuals, scenario.mix, assumptions)
+                monthly = monthly_variance(variance)
+            if monthly.empty:
+                st.warning(f"None of the imported months ({actuals['Month'].iloc[0]} to "
+                           f"{actuals['Month'].iloc[-1]}) fall in the projection starting "
+                           f"{assumptions.calendar.start_month}.")
+            else:
+                planned, actual = monthly['Planned Revenue'].sum(), monthly['Actual Revenue'].sum()
+                col1, col2, col3 = st.columns(3)
+                col1.metric("Months With Actuals", f"{len(monthly)}")
+                col2.metric("Actual Revenue to Date", f"${actual:,.0f}",
+                            f"{(actual / planned - 1) * 100:+.1f}% vs plan" if planned > 0 else None)
+                col3.metric("Planned Revenue to Date", f"${planned:,.0f}")
+                
+                with span("Plan vs Actual", "figure"):
+                    fig = charts.plan_vs_actual_chart(monthly)
+                st.plotly_chart(fig, use_container_width=True)
+                
+                month = st.selectbox("Channel Detail for Month", list(monthly['Month']),
+                                     index=len(monthly) - 1, key="actuals_month")
+                st.dataframe(variance[variance['Month'] == month].drop(columns='Month').style.format({
+                    'Planned Units': "{:,.0f}", 'Actual Units': "{:,.0f}", 'Planned Revenue': "${:,.0f}",
+                    'Actual Revenue': "${:,.0f}", 'Unit Variance %': "{:+.1f}%", 'Revenue Variance': "${:+,.0f}",
+                }, na_rep="–"), use_container_width=True, hide_index=True)
+                st.caption("Planned units follow the Sales Volume mix along the cashflow projection's revenue path; "
+                           "food is in dollars.")
+                
+                st.markdown("#### Rolling Re-forecast")
+                st.caption("Opening revenue, growth and each month's seasonal index refitted to the actuals by "
+                           "least squares, pulled towards the plan until the data says otherwise; variable costs "
+                           "at the volumes actually sold. Months after the last import are re-projected.")
+                with span("Rolling Re-forecast", "model"):
+                    # Kept per session so each new month of actuals updates the fit instead of refitting
+                    if 'rolling_fit' not in st.session_state:
+                        st.session_state.rolling_fit = RollingFit(assumptions)
+                    fit = st.session_state.rolling_fit.update(observed_revenue(actuals, assumptions), assumptions)
+                    fitted, revenue = reforecast(fit, assumptions,
+                                                 observed_cost_pct(actuals, scenario.mix, scenario.costs, assumptions))
+                    plan = model()['projection']
+                    refit = project_cashflow(fitted, revenue)
+                    backtest = fit.backtest(plan.revenue)
+                
+                col1, col2, col3, col4 = st.columns(4)
+                col1.metric("Opening Revenue", f"${fitted.starting_monthly_revenue:,.0f}",
+                            f"{fitted.starting_monthly_revenue - assumptions.starting_monthly_revenue:+,.0f} vs plan")
+                col2.metric("Monthly Growth", f"{fitted.monthly_revenue_growth:.1f}%",
+                            f"{fitted.monthly_revenue_growth - assumptions.monthly_revenue_growth:+.1f} pts vs plan")
+                col3.metric("Variable Costs", f"{fitted.variable_cost_pct:.1f}%",
+                            f"{fitted.variable_cost_pct - assumptions.variable_cost_pct:+.1f} pts vs plan",
+                            delta_color="inverse")
+                col4.metric("Breakeven", f"Month {refit.breakeven_month}" if refit.breakeven_month else "Not reached",
+                            f"plan: {f'Month {plan.breakeven_month}' if plan.breakeven_month else 'not reached'}",
+                            delta_color="off")
+                
+                with span("Rolling Re-forecast", "figure"):
+                    fig = charts.reforecast_chart(month_labels(assumptions.calendar, assumptions.months),
+                                                  plan.revenue, revenue, fit.rows)
+                st.plotly_chart(fig, use_container_width=True)
+                
+                if backtest.empty:
+                    st.caption(f"Backtests need more than {MIN_HISTORY} months of actuals.")
+                else:
+                    st.markdown("**Backtest**: refitted at every past month-end and scored on the months after it")
+                    st.dataframe(backtest.style.format({'Re-forecast Error %': "{:.1f}%", 'Plan Error %': "{:.1f}%"}),
+                                 use_container_width=True, hide_index=True)
+                
+                # Kept inside the monthly index inputs' range, or Seasonality & Events could not show them
+                fitted_index = tuple(min(max(value, 0.0), MAX_SEASONAL_INDEX)
+                                     for value in fitted.calendar.seasonal_index)
+                capped = [name for name, value, kept in zip(MONTH_NAMES, fitted.calendar.seasonal_index, fitted_index)
+                          if value != kept]
+                if capped:
+                    st.warning(f"The fitted seasonal index for {', '.join(capped)} is outside 0.0 to "
+                               f"{MAX_SEASONAL_INDEX:.1f} and will be capped when applied.")
+                if st.button("Apply Fitted Growth & Seasonality",
+                             help="Replace the opening revenue, growth rate and seasonal index with the fit"):
+                    reset_scenario(replace(scenario, cashflow=replace(
+                        scenario.cashflow, starting_monthly_revenue=int(round(fitted.starting_monthly_revenue, -2)),
+                        # Kept inside the Investor Analysis growth slider's range
+                        monthly_revenue_growth=min(max(round(fitted.monthly_revenue_growth, 1), 0.0), 15.0),
+                        calendar=replace(scenario.cashflow.calendar, seasonal_index=fitted_index)
+                    )))
+                    st.rerun()
+        
+        with st.expander("Imported Files"):
+            st.dataframe(store.imports(), use_container_width=True, hide_index=True)
@@ -0,0 +1,40 @@
+"""Scenario Comparison page: saved plans overlaid on shared axes"""
+import streamlit as st
+
+from brewery.cache import cached_comparison, cached_comparison_chart
+from brewery.session import scenario_store
+
+
+def render(scenario):
+    """Draw the page for the current scenario"""
+    st.header("⚖️ Scenario Comparison")
+    
+    st.info("""
+    Overlay saved plans side by side. Every selected scenario is projected in a single
+    batched pass, so comparing dozens of plans is as quick as comparing two.
+    """)
+    
+    store = scenario_store()
+    username = st.session_state["username"]
+    saved_names = [name for name, _ in store.list(username)]
+    selected = st.multiselect("Saved Scenarios to Compare", saved_names, default=saved_names[:3])
+    include_current = st.checkbox("Include Current Inputs", value=True)
+    
+    named_scenarios = store.load_many(username, selected)
+    if include_current:
+        named_scenarios = {"Current Inputs": scenario, **named_scenarios}
+    
+    if not named_scenarios:
+        st.warning("Save some scenarios from the sidebar, then select them here to compare.")
+    else:
+        st.plotly_chart(cached_comparison_chart(named_scenarios), use_container_width=True)
+        
+        st.subheader("Headline Metrics")
+        summary = cached_comparison(named_scenarios).summary()
+        summary['Breakeven Month'] = [f"Month {m:.0f}" if m == m else "Not reached"
+                                      for m in summary['Breakeven Month']]
+        for col in ['Initial Capital', 'Loans', 'Total Profit', 'Exit Value + Retained Cash']:
+            summary[col] = summary[col].map("${:,.0f}".format)
+        summary['Partner Cash ROI %'] = summary['Partner Cash ROI %'].map("{:.1f}%".format)
+        summary['Equity IRR %'] = [f"{irr:.1f}%" if irr == irr else "n/a" for irr in summary['Equity IRR %']]
+        st.dataframe(summary, use_container_width=True, hide_index=True)
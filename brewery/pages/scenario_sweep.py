@@ -0,0 +1,119 @@
+"""Scenario Sweep page: grid sweeps, heatmaps and tornado sensitivity"""
+import time
+
+import numpy as np
+import streamlit as st
+
+from brewery import charts
+from brewery.cache import result_store
+from brewery.session import model
+from brewery.sweep import (MAX_SWEEP_POINTS, METRICS, SWEEPABLE, SweepAxis, SweepSpec, create_sweep, iter_sweep,
+                           open_sweep, tornado)
+
+
+def render(scenario):
+    """Draw the page for the current scenario"""
+    st.header("🧮 Scenario Sweep & Sensitivity Analysis")
+    
+    st.info("""
+    **What-if analysis across ranges of inputs**: choose the inputs to vary and their ranges.
+    Every combination is evaluated through the same cashflow model as the Investor Analysis page,
+    in vectorized batches spread across CPU cores.
+    """)
+    
+    base_assumptions = model()['assumptions']
+    base_mix = scenario.mix
+    distribution_pct = scenario.partnership.profit_distribution_pct
+    
+    def base_value(name):
+        """Current value of a sweepable input"""
+        source = base_mix if hasattr(base_mix, name) else base_assumptions
+        return float(getattr(source, name))
+    
+    selected = st.multiselect(
+        "Inputs to Sweep",
+        list(SWEEPABLE),
+        default=["pint_price", "monthly_revenue_growth"],
+        format_func=SWEEPABLE.get,
+        max_selections=5,
+        help="Base values come from Revenue Projections and Investor Analysis"
+    )
+    
+    axes = []
+    for name in selected:
+        base = base_value(name)
+        col1, col2, col3 = st.columns(3)
+        low = col1.number_input(f"{SWEEPABLE[name]} - Low", value=round(base * 0.8, 2), key=f"sweep_low_{name}")
+        high = col2.number_input(f"{SWEEPABLE[name]} - High", value=round(base * 1.2, 2), key=f"sweep_high_{name}")
+        steps = col3.number_input(f"{SWEEPABLE[name]} - Steps", min_value=2, max_value=1000, value=20,
+                                  key=f"sweep_steps_{name}")
+        axes.append(SweepAxis.linspace(name, low, high, steps))
+    
+    spec = SweepSpec(base_assumptions, base_mix, distribution_pct, tuple(axes))
+    
+    if len(axes) < 2:
+        st.warning("Select at least two inputs to sweep.")
+    else:
+        st.caption(f"Grid size: {spec.size:,} combinations")
+        too_large = spec.size > MAX_SWEEP_POINTS
+        if too_large:
+            st.error(f"❌ The grid is over the {MAX_SWEEP_POINTS:,} combination limit - reduce the steps "
+                     "or the number of inputs.")
+        
+        metric = st.selectbox("Metric", list(METRICS), format_func=METRICS.get)
+        col1, col2 = st.columns(2)
+        x_axis = col1.selectbox("Heatmap X Axis", selected, index=0, format_func=SWEEPABLE.get)
+        y_axis = col2.selectbox("Heatmap Y Axis", [n for n in selected if n != x_axis],
+                                format_func=SWEEPABLE.get)
+        
+        def heatmap(result):
+            """Heatmap of the selected metric from a (possibly partial) sweep result"""
+            values = result.pivot(metric, x_axis, y_axis)
+            x_values = next(a.values for a in spec.axes if a.name == x_axis)
+            y_values = next(a.values for a in spec.axes if a.name == y_axis)
+            return charts.sweep_heatmap(values, x_values, y_values, SWEEPABLE[x_axis],
+                                        SWEEPABLE[y_axis], METRICS[metric])
+        
+        chart_slot = st.empty()
+        
+        # Results live in the shared store: a grid any partner already ran loads without rerunning
+        store = result_store()
+        result = open_sweep(store, spec)
+        if st.button("Run Sweep", type="primary", disabled=too_large) and result is None:
+            run, result = create_sweep(store, spec)
+            progress = st.progress(0.0, text="Evaluating scenarios...")
+            last_draw = 0.0
+            for start, stop, batch in iter_sweep(spec):
+                result.add(start, stop, batch)
+                progress.progress(result.completed / spec.size,
+                                  text=f"Evaluated {result.completed:,} of {spec.size:,} scenarios")
+                # Redraw partial results at most a few times per second
+                if time.monotonic() - last_draw > 0.5:
+                    chart_slot.plotly_chart(heatmap(result), use_container_width=True,
+                                            key=f"sweep_partial_{result.completed}")
+                    last_draw = time.monotonic()
+            progress.empty()
+            run.commit()
+            # Reopen read-only from the store, as every later rerun will
+            result = open_sweep(store, spec) or result
+        
+        if result is not None:
+            # Only the spec stays in the session; the Dashboard export reopens the stored run
+            st.session_state.sweep_spec = spec
+            chart_slot.plotly_chart(heatmap(result), use_container_width=True)
+            
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Scenarios Breaking Even",
+                       f"{np.mean(~np.isnan(result.metrics['breakeven_month'])) * 100:.1f}%")
+            col2.metric("Median Total Profit", f"${np.median(result.metrics['total_profit']):,.0f}")
+            col3.metric("Median Partner ROI", f"{np.median(result.metrics['partner_roi']):.1f}%")
+            col4.metric("Median Equity IRR", f"{np.nanmedian(result.metrics['equity_irr']):.1f}%"
+                        if not np.isnan(result.metrics['equity_irr']).all() else "n/a")
+        elif st.session_state.get("sweep_spec") is not None:
+            st.caption("Inputs changed since the last sweep - run it again to refresh the heatmap.")
+        
+        # One-at-a-time sensitivity around the base case
+        st.subheader("Tornado Chart")
+        ranges = {axis.name: (axis.values[0], axis.values[-1]) for axis in spec.axes}
+        tornado_df = tornado(base_assumptions, base_mix, distribution_pct, ranges, metric)
+        st.plotly_chart(charts.tornado_chart(tornado_df, METRICS[metric]), use_container_width=True)
@@ -0,0 +1,362 @@
+"""Vectorized projection engine for revenue, expenses, profit and cashflow
+
+Every function here is pure: it takes assumption objects (or plain arrays) and
+returns NumPy arrays or pandas DataFrames, so the same math backs the Streamlit
+pages, batch runs and benchmarks. The array kernels broadcast over any leading
+batch dimensions, so passing arrays of inputs evaluates many scenarios at once.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from brewery.assumptions import GROWTH_DECAY, MONTH_NAMES
+from brewery.debt import debt_service
+from brewery.returns import (TIERS, annual_irr, distribution_schedule, equity_flows, moic, npv,
+                             partner_distributions)
+
+# Named growth-decay curves: multiplier on the base monthly growth rate in each
+# year, with the last value carrying on for every later year
+GROWTH_CURVES = {
+    "Standard (100% / 60% / 40%)": GROWTH_DECAY,
+    "Sustained Growth": (1.0,),
+    "Fast Fade": (1.0, 0.4, 0.15, 0.05),
+    "Mature Plateau": (1.0, 0.6, 0.4, 0.2, 0.1, 0.0),
+}
+
+# Named seasonal profiles: revenue multiplier for Jan..Dec, averaging 1.0.
+# Charlotte taprooms slow down after the holidays, peak on summer patio
+# weather and stay busy through football season.
+SEASONAL_PROFILES = {
+    "Flat": (1.0,) * 12,
+    "Charlotte Taproom": (0.82, 0.85, 0.95, 1.0, 1.05, 1.1, 1.1, 1.05, 1.05, 1.08, 0.98, 0.97),
+}
+
+# Business valuation as a multiple of final-year revenue (conservative for craft breweries)
+VALUATION_MULTIPLE = 2.0
+
+
+# ==================== ARRAY KERNELS ====================
+def fading_curve(retention_pct, years):
+    """Growth-decay curve keeping ``retention_pct`` of the previous year's rate each year"""
+    return tuple(((retention_pct / 100) ** np.arange(years)).tolist())
+
+
+def growth_rates(monthly_growth_pct, months, growth_decay=GROWTH_DECAY):
+    """Per-month growth rate, scaled in each year by that year's ``growth_decay`` multiplier
+
+    ``growth_decay`` may carry leading batch dimensions, one curve per scenario;
+    its last value applies to every year past the end of the curve.
+    """
+    decay = np.asarray(growth_decay, dtype=float)
+    year = np.minimum(np.arange(months) // 12, decay.shape[-1] - 1)
+    return np.asarray(monthly_growth_pct, dtype=float)[..., None] / 100 * decay[..., year]
+
+
+def revenue_path(starting_revenue, monthly_growth_pct, months, growth_decay=GROWTH_DECAY):
+    """Monthly revenue, shape (*batch, months)
+
+    Each month compounds on the one before at that month's growth rate, so a
+    fading curve slows growth without pulling revenue back down.
+    """
+    start = np.asarray(starting_revenue, dtype=float)[..., None]
+    factors = 1 + growth_rates(monthly_growth_pct, months, growth_decay)
+    factors[..., :1] = 1.0
+    return start * np.cumprod(factors, axis=-1)
+
+
+def cashflow_arrays(starting_revenue, monthly_growth_pct, total_fixed, initial_capital,
+                    variable_cost_pct=25.0, months=36, growth_decay=GROWTH_DECAY, seasonality=1.0,
+                    interest=0.0, principal_repaid=0.0, loan_proceeds=0.0):
+    """Revenue, expenses, profit and cumulative cashflow in one vectorized pass
+
+    All arguments broadcast against each other; each returned array has shape
+    (*batch, months). ``seasonality`` multiplies revenue month by month (see
+    ``seasonal_multipliers``). Debt is optional, as in ``cashflow_from_revenue``.
+    """
+    revenue = revenue_path(starting_revenue, monthly_growth_pct, months, growth_decay)
+    revenue = revenue * np.asarray(seasonality, dtype=float)
+    return cashflow_from_revenue(revenue, total_fixed, initial_capital, variable_cost_pct,
+                                 interest, principal_repaid, loan_proceeds)
+
+
+def cashflow_from_revenue(revenue, total_fixed, initial_capital, variable_cost_pct=25.0,
+                          interest=0.0, principal_repaid=0.0, loan_proceeds=0.0):
+    """``cashflow_arrays`` for a revenue array that is already known, shape (*batch, months)
+
+    Loan interest (monthly, from ``debt_service``) is an expense. Principal
+    repaid is not, but it leaves the bank, so cumulative cashflow subtracts it
+    and starts from the initial capital the loan proceeds did not cover.
+    """
+    variable = revenue * (np.asarray(variable_cost_pct, dtype=float)[..., None] / 100)
+    expenses = np.asarray(total_fixed, dtype=float)[..., None] + variable + interest
+    profit = revenue - expenses
+    equity = np.asarray(initial_capital, dtype=float) - np.asarray(loan_proceeds, dtype=float)
+    cumulative = np.cumsum(profit - principal_repaid, axis=-1) - equity[..., None]
+    return revenue, expenses, profit, cumulative
+
+
+def debt_arrays(assumptions, months=None):
+    """Monthly loan interest and principal repaid for ``assumptions.loans`` up to ``months``"""
+    months = assumptions.months if months is None else months
+    interest, repaid = debt_service([assumptions.loans], months)
+    return interest[0], repaid[0]
+
+
+def breakeven_month(cumulative):
+    """First month (1-based) where cumulative cashflow is non-negative, 0 if it never is"""
+    positive = np.asarray(cumulative) >= 0
+    return np.where(positive.any(axis=-1), positive.argmax(axis=-1) + 1, 0)
+
+
+def breakeven_revenue(total_fixed, variable_cost_pct):
+    """Monthly revenue needed to cover fixed costs at a given variable cost %"""
+    return total_fixed / (1 - variable_cost_pct / 100)
+
+
+# ==================== CALENDAR ====================
+def month_number(year_month):
+    """Months since year 0 for a 'YYYY-MM' string"""
+    year, month = year_month.split('-')[:2]
+    return int(year) * 12 + int(month) - 1
+
+
+def calendar_months(calendar, months):
+    """Month number (as from ``month_number``) of each projected month"""
+    return month_number(calendar.start_month) + np.arange(months)
+
+
+def month_labels(calendar, months):
+    """'Jan 2027'-style label for each projected month"""
+    return [f"{MONTH_NAMES[m % 12]} {m // 12}" for m in calendar_months(calendar, months)]
+
+
+def seasonal_multipliers(calendar, months):
+    """Revenue multiplier per projected month from the seasonal index and events
+
+    Every event is matched against every month in one broadcast comparison;
+    annual events repeat each year from their first occurrence.
+    """
+    absolute = calendar_months(calendar, months)
+    multipliers = np.asarray(calendar.seasonal_index, dtype=float)[absolute % 12]
+    if calendar.events:
+        first = np.array([month_number(e.month) for e in calendar.events])[:, None]
+        annual = np.array([e.annual for e in calendar.events])[:, None]
+        uplift = np.array([e.uplift_pct for e in calendar.events], dtype=float)[:, None] / 100
+        hit = np.where(annual, (absolute >= first) & ((absolute - first) % 12 == 0), absolute == first)
+        multipliers = multipliers * np.where(hit, 1 + uplift, 1.0).prod(axis=0)
+    return multipliers
+
+
+def supply_shares(assumptions, months=None):
+    """Capacity-capped supply share for each month up to ``months``, 1 past the end of ``supply_share``"""
+    months = assumptions.months if months is None else months
+    share = np.ones(months)
+    supplied = min(months, len(assumptions.supply_share))
+    share[:supplied] = assumptions.supply_share[:supplied]
+    return share
+
+
+def revenue_multipliers(assumptions, months=None):
+    """Seasonality times the capacity-capped supply share for each month up to ``months``"""
+    months = assumptions.months if months is None else months
+    multipliers = seasonal_multipliers(assumptions.calendar, months)
+    if assumptions.supply_share:
+        multipliers = multipliers * supply_shares(assumptions, months)
+    return multipliers
+
+
+# ==================== PROJECTIONS ====================
+@dataclass(frozen=True)
+class Projection:
+    """Monthly cashflow projection for a single set of assumptions"""
+    revenue: np.ndarray
+    expenses: np.ndarray      # operating expenses plus loan interest
+    profit: np.ndarray
+    cumulative: np.ndarray
+    interest: np.ndarray
+    principal: np.ndarray     # loan principal repaid
+    balance: np.ndarray       # loan principal still owed at the end of each month
+
+    @property
+    def months(self):
+        """1-based month numbers"""
+        return np.arange(1, len(self.revenue) + 1)
+
+    @property
+    def breakeven_month(self):
+        """Month cumulative cashflow turns positive, or None within the horizon"""
+        month = int(breakeven_month(self.cumulative))
+        return month or None
+
+    @property
+    def debt_service(self):
+        """Loan interest plus principal paid each month"""
+        return self.interest + self.principal
+
+    @property
+    def cash_flow(self):
+        """Cash left for the partners each month after operating costs and debt service"""
+        return self.profit - self.principal
+
+    def dscr(self, yearly=False):
+        """Debt service coverage ratio: profit before interest over debt service, NaN without debt
+
+        Lenders usually test it on yearly totals, so ``yearly`` sums each
+        12-month period first.
+        """
+        operating, service = self.profit + self.interest, self.debt_service
+        if yearly:
+            operating, service = self.yearly(operating), self.yearly(service)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(service > 0, operating / service, np.nan)
+
+    @property
+    def min_dscr(self):
+        """Lowest yearly DSCR over the horizon, or None with no debt service"""
+        dscr = self.dscr(yearly=True)
+        return None if np.isnan(dscr).all() else float(np.nanmin(dscr))
+
+    def yearly(self, values):
+        """Sum a monthly series into 12-month periods"""
+        values = np.asarray(values)
+        years = -(-len(values) // 12)
+        padded = np.zeros(years * 12)
+        padded[:len(values)] = values
+        return padded.reshape(years, 12).sum(axis=1)
+
+    def to_frame(self, labels=None):
+        """Cashflow table with one row per month, dated when ``labels`` are given
+
+        Debt service and DSCR columns are added when there is any debt.
+        """
+        frame = pd.DataFrame({
+            'Month': self.months,
+            'Revenue': self.revenue,
+            'Expenses': self.expenses,
+            'Profit': self.profit,
+            'Cumulative Cashflow': self.cumulative
+        })
+        if self.debt_service.any():
+            frame.insert(4, 'Debt Service', self.debt_service)
+            frame.insert(5, 'DSCR', self.dscr())
+        if labels is not None:
+            frame.insert(1, 'Date', labels)
+        return frame
+
+
+def project_cashflow(assumptions, revenue=None):
+    """Project monthly revenue, expenses, profit and cumulative cashflow
+
+    Pass ``revenue`` when the seasoned revenue path is already known to skip
+    recomputing it.
+    """
+    a = assumptions
+    if revenue is None:
+        revenue = (revenue_path(a.starting_monthly_revenue, a.monthly_revenue_growth, a.months, a.growth_decay)
+                   * revenue_multipliers(a))
+    interest, repaid = debt_arrays(a, len(revenue))
+    return Projection(*cashflow_from_revenue(revenue, a.total_monthly_fixed, a.initial_capital,
+                                             a.variable_cost_pct, interest, repaid, a.debt),
+                      interest, repaid, a.debt - np.cumsum(repaid))
+
+
+def fixed_expense_breakdown(assumptions):
+    """Monthly and annual cost per fixed expense category"""
+    a = assumptions
+    monthly = [a.monthly_rent, a.monthly_payroll, a.monthly_insurance,
+               a.monthly_utilities, a.monthly_marketing, a.monthly_other]
+    return pd.DataFrame({
+        'Expense Category': ['Rent/Lease', 'Payroll', 'Insurance', 'Utilities',
+                             'Marketing', 'Other (Accounting, etc.)'],
+        'Monthly Cost': monthly,
+        'Annual Cost': [cost * 12 for cost in monthly]
+    })
+
+
+def revenue_forecast(mix, monthly_growth_pct, months=12, growth_decay=GROWTH_DECAY, calendar=None):
+    """Monthly revenue forecast by channel for a product mix
+
+    With a ``calendar`` the forecast is seasoned and labelled by calendar month.
+    """
+    growth = revenue_path(1.0, monthly_growth_pct, months, growth_decay)
+    if calendar is None:
+        labels = [f"Month {m}" for m in range(1, months + 1)]
+    else:
+        growth = growth * seasonal_multipliers(calendar, months)
+        labels = month_labels(calendar, months)
+    return pd.DataFrame({
+        'Month': labels,
+        'Taproom': mix.taproom_revenue * growth,
+        'Wholesale': mix.wholesale_revenue * growth,
+        'Total Revenue': mix.total_revenue * growth
+    })
+
+
+def horizon_label(months):
+    """'3-Year' for whole-year horizons, otherwise '30-Month'"""
+    return f"{months // 12}-Year" if months % 12 == 0 else f"{months}-Month"
+
+
+# ==================== INVESTOR RETURNS ====================
+def partner_investments(equity, partnership):
+    """Equity contribution per partner"""
+    return equity * np.asarray(partnership.capital_shares) / 100
+
+
+def business_value(projection):
+    """Final-year revenue at the valuation multiple, net of the loan balance still owed"""
+    owed = projection.balance[-1] if len(projection.balance) else 0.0
+    return projection.revenue[-12:].sum() * VALUATION_MULTIPLE - owed
+
+
+def partner_cash_flows(projection, partnership, equity):
+    """Each partner's monthly cash flows, month 0 their contribution, and the waterfall tiers paid
+
+    Returns ``(flows, tiers)`` with shapes (partners, months + 1) and
+    (4, partners, months).
+    """
+    flows = equity_flows(projection.cash_flow, partnership.profit_distribution_pct, equity,
+                         business_value(projection))
+    received, tiers = partner_distributions(flows[1:], equity, partnership)
+    return np.column_stack([-partner_investments(equity, partnership), received]), tiers
+
+
+def partner_returns(projection, partnership, equity):
+    """Per-partner investment, cash distributions, equity value and returns
+
+    Distributions come from cash flow after debt service, paid out pro rata or
+    through the partnership's waterfall. The ownership value is each partner's
+    share of the exit: the business value plus any cash held back.
+    """
+    flows, _ = partner_cash_flows(projection, partnership, equity)
+    investments = -flows[:, 0]
+    operating = distribution_schedule(projection.cash_flow, partnership.profit_distribution_pct)
+    distributed = partner_distributions(operating, equity, partnership)[0].sum(axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        roi = np.where(investments > 0, (distributed / investments - 1) * 100, 0.0)
+    return pd.DataFrame({
+        'Partner': partnership.names,
+        'Initial Investment': investments,
+        'Cash Distributions': distributed,
+        'Ownership Value': flows[:, 1:].sum(axis=-1) - distributed,
+        'Cash ROI %': roi,
+        'MOIC': moic(flows),
+        'IRR %': annual_irr(flows),
+        'NPV': npv(flows, partnership.discount_rate_pct),
+    })
+
+
+def equity_irr(projection, partnership, equity):
+    """Annual IRR % of all the partners' cash flows together, NaN if there is none"""
+    flows = equity_flows(projection.cash_flow, partnership.profit_distribution_pct, equity,
+                         business_value(projection))
+    return float(annual_irr(flows))
+
+
+def distribution_waterfall(projection, partnership, equity):
+    """Total paid to each partner from each waterfall tier over the horizon, exit included"""
+    _, tiers = partner_cash_flows(projection, partnership, equity)
+    frame = pd.DataFrame(tiers.sum(axis=-1), index=list(TIERS), columns=partnership.names)
+    frame['Total'] = frame.sum(axis=1)
+    return frame.rename_axis('Tier').reset_index()
@@ -0,0 +1,220 @@
+"""Rolling re-forecast: growth, seasonality and cost ratios fitted to imported actuals
+
+Log revenue in projected month ``t`` is modelled as
+
+    log(actual[t] / multiplier[t]) = a + g * G[t] + d[calendar month of t]
+
+where ``multiplier`` is the plan's seasonality (events and capacity caps
+included) and ``G`` is the plan's growth-decay curve summed month by month.
+``a`` is the opening revenue level, ``g`` the monthly growth rate and ``d`` the
+correction to each month's seasonal index. Ridge priors pull ``g`` towards
+the planned growth and ``d`` towards zero, so a few months of actuals move the
+plan only as far as they support.
+
+The fit keeps its normal equations as running sums. A new or revised month
+updates them in place, so refitting costs the same with one month of history
+or twenty. Backtests solve every historical cut-off in one batched solve over
+the prefix sums of the same rows.
+"""
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+
+from brewery.actuals import CHANNELS
+from brewery.costs import variable_costs
+from brewery.projection import calendar_months, growth_rates, revenue_multipliers
+
+# Ridge weights pulling growth to plan (one month six months in, whose growth regressor is 6,
+# weighs 6**2) and each seasonal correction to zero (in months of that calendar month)
+GROWTH_PRIOR = 36.0
+SEASONAL_PRIOR = 2.0
+
+# Months of actuals before the first backtest cut-off
+MIN_HISTORY = 3
+
+# Backtest horizons reported, in months ahead of the cut-off
+BACKTEST_HORIZONS = (1, 3, 6, 12)
+
+_FEATURES = 2 + 12
+
+
+def growth_index(assumptions):
+    """Growth-decay weights summed up to each projected month, 0 in month 1"""
+    weights = growth_rates(100.0, assumptions.months, assumptions.growth_decay)
+    weights[:1] = 0.0
+    return np.cumsum(weights)
+
+
+def observed_revenue(actuals, assumptions):
+    """``{projected month index: actual revenue}`` for the imported months inside the horizon"""
+    months = {f"{m // 12}-{m % 12 + 1:02d}": t
+              for t, m in enumerate(calendar_months(assumptions.calendar, assumptions.months))}
+    totals = actuals.groupby('Month')['Revenue'].sum()
+    return {months[month]: float(revenue) for month, revenue in totals.items() if month in months and revenue > 0}
+
+
+class RollingFit:
+    """Growth and seasonality fitted to actual monthly revenue, updated one month at a time
+
+    ``update`` re-fits only the months whose revenue is new or changed; the
+    regressors depend on the plan's calendar and growth curve, so a change to
+    either rebuilds the fit.
+    """
+
+    def __init__(self, assumptions):
+        self._reset(assumptions)
+
+    def _reset(self, assumptions):
+        """Empty fit on the regressors of ``assumptions``"""
+        a = assumptions
+        self.basis = (a.calendar, a.months, a.growth_decay, a.supply_share)
+        self.plan_growth = a.monthly_revenue_growth
+        self.plan_start = a.starting_monthly_revenue
+        # A month the plan closes (a 0 seasonal index or a -100% event) has no log and stays out of the fit
+        with np.errstate(divide='ignore'):
+            self._offset = np.log(revenue_multipliers(a))
+        self._growth = growth_index(a)
+        self._season = calendar_months(a.calendar, a.months) % 12
+        self.rows = {}   # month index: (features, log revenue less offset)
+        self.unmodelled = {}   # month index: actual revenue in months the plan closes
+        self.xtx = np.zeros((_FEATURES, _FEATURES))
+        self.xty = np.zeros(_FEATURES)
+
+    def _row(self, t, revenue):
+        """Features and target for projected month ``t``"""
+        x = np.zeros(_FEATURES)
+        x[0], x[1], x[2 + self._season[t]] = 1.0, self._growth[t], 1.0
+        return x, np.log(revenue) - self._offset[t]
+
+    def update(self, observed, assumptions):
+        """Bring the fit up to date with ``{month index: revenue}``, touching only changed months"""
+        a = assumptions
+        if (a.calendar, a.months, a.growth_decay, a.supply_share) != self.basis:
+            self._reset(a)
+        self.plan_growth, self.plan_start = a.monthly_revenue_growth, a.starting_monthly_revenue
+        for t in set(self.rows) - set(observed):
+            self._apply(*self.rows.pop(t), -1.0)
+        self.unmodelled = {t: revenue for t, revenue in observed.items() if not np.isfinite(self._offset[t])}
+        for t, revenue in observed.items():
+            if t in self.unmodelled:
+                continue
+            x, y = self._row(t, revenue)
+            if t in self.rows:
+                if self.rows[t][1] == y:
+                    continue
+                self._apply(*self.rows[t], -1.0)
+            self.rows[t] = (x, y)
+            self._apply(x, y, 1.0)
+        return self
+
+    def _apply(self, x, y, sign):
+        """Add (or with ``sign`` -1, remove) one month from the normal equations"""
+        self.xtx += sign * np.outer(x, x)
+        self.xty += sign * x * y
+
+    def _prior(self):
+        """Ridge penalty and the coefficients it pulls towards"""
+        penalty = np.diag([1e-9, GROWTH_PRIOR] + [SEASONAL_PRIOR] * 12)
+        target = np.zeros(_FEATURES)
+        target[0] = np.log(self.plan_start) if self.plan_start > 0 else 0.0
+        target[1] = np.log1p(self.plan_growth / 100)
+        return penalty, target
+
+    def _solve(self, xtx, xty):
+        """Coefficients for normal equations of shape (*batch, p, p) and (*batch, p)"""
+        penalty, target = self._prior()
+        return np.linalg.solve(xtx + penalty, (xty + penalty @ target)[..., None])[..., 0]
+
+    @property
+    def observed_months(self):
+        """Number of months in the fit"""
+        return len(self.rows)
+
+    def actual(self, months):
+        """Actual revenue of fitted months"""
+        return np.exp([self.rows[t][1] + self._offset[t] for t in months])
+
+    def coefficients(self):
+        """Fitted level, growth and 12 seasonal corrections"""
+        return self._solve(self.xtx, self.xty)
+
+    def fitted(self, assumptions):
+        """``assumptions`` with opening revenue, growth and seasonal index replaced by the fit"""
+        level, growth, *season = self.coefficients()
+        calendar = assumptions.calendar
+        index = np.asarray(calendar.seasonal_index, dtype=float) * np.exp(season)
+        return replace(assumptions, starting_monthly_revenue=float(np.exp(level)),
+                       monthly_revenue_growth=float(np.expm1(growth) * 100),
+                       calendar=replace(calendar, seasonal_index=tuple(index.round(4).tolist())))
+
+    def predict(self, coefficients=None):
+        """Fitted revenue for every projected month"""
+        coefficients = self.coefficients() if coefficients is None else coefficients
+        months = np.arange(len(self._offset))
+        features = np.zeros((len(months), _FEATURES))
+        features[:, 0], features[:, 1], features[months, 2 + self._season] = 1.0, self._growth, 1.0
+        return np.exp(coefficients @ features.T + self._offset)
+
+    def backtest(self, plan_revenue):
+        """Mean absolute % error by months ahead, fitting on every cut-off's history in one batched solve
+
+        ``plan_revenue`` is the static plan's monthly revenue, scored on the same months.
+        """
+        months = np.array(sorted(self.rows))
+        columns = ['Months Ahead', 'Cut-offs', 'Re-forecast Error %', 'Plan Error %']
+        if len(months) <= MIN_HISTORY:
+            return pd.DataFrame(columns=columns)
+        x = np.array([self.rows[t][0] for t in months])
+        y = np.array([self.rows[t][1] for t in months])
+        # Normal equations for the history before each cut-off
+        xtx = np.cumsum(np.einsum('ni,nj->nij', x, x), axis=0)[MIN_HISTORY - 1:-1]
+        xty = np.cumsum(x * y[:, None], axis=0)[MIN_HISTORY - 1:-1]
+        forecast = self.predict(self._solve(xtx, xty))[:, months]   # (cut-offs, observed months)
+        actual = self.actual(months)
+        last_seen = months[MIN_HISTORY - 1:-1]
+        ahead = months[None, :] - last_seen[:, None]
+        refit_error = np.abs(forecast / actual - 1) * 100
+        plan_error = np.abs(np.asarray(plan_revenue)[months] / actual - 1) * 100
+        rows = []
+        for horizon in BACKTEST_HORIZONS:
+            hit = ahead == horizon
+            if hit.any():
+                rows.append((horizon, int(hit.sum()), refit_error[hit].mean(),
+                             np.broadcast_to(plan_error, hit.shape)[hit].mean()))
+        return pd.DataFrame(rows, columns=columns)
+
+
+def observed_cost_pct(actuals, mix, costs, assumptions):
+    """Cost model share of revenue at the actual volumes sold, or None without actuals in the horizon
+
+    Each imported month's channel volumes replace the Sales Volume mix, so
+    COGS, packaging, excise and fees follow what actually sold. The result is
+    the revenue-weighted average over those months, the least-squares constant.
+    """
+    observed = observed_revenue(actuals, assumptions)
+    if not observed:
+        return None
+    labels = [f"{m // 12}-{m % 12 + 1:02d}" for m in calendar_months(assumptions.calendar, assumptions.months)]
+    units = actuals.pivot_table(index='Month', columns='Channel', values='Quantity', aggfunc='sum', fill_value=0)
+    spent = 0.0
+    for t in observed:
+        sold = units.loc[labels[t]]
+        volumes = {volume: float(sold.get(channel, 0.0)) for channel, (volume, _) in CHANNELS.items()}
+        month_mix = replace(mix, **volumes, food_enabled=volumes['monthly_food'] > 0)
+        spent += variable_costs(month_mix, costs, 1.0, labels[t]).sum()
+    return float(spent / sum(observed.values()) * 100)
+
+
+def reforecast(fit, assumptions, cost_pct=None):
+    """Fitted assumptions and monthly revenue: actuals where imported, the fitted path after the last one"""
+    fitted = fit.fitted(assumptions)
+    if cost_pct is not None:
+        fitted = replace(fitted, variable_cost_pct=cost_pct)
+    revenue = fit.predict()
+    months = sorted(fit.rows)
+    if months:
+        revenue[months] = fit.actual(months)
+    for t, actual in fit.unmodelled.items():
+        revenue[t] = actual
+    return fitted, revenue
@@ -0,0 +1,191 @@
+"""PDF report generation, run off the Streamlit request thread
+
+``ReportService`` renders reports on a small background thread pool and keeps
+finished PDFs keyed by a hash of their inputs, so a partner asking for a report
+on unchanged numbers gets the cached bytes instantly and a slow render never
+blocks the script thread serving anyone else.
+"""
+import hashlib
+import io
+import math
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import Image, PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from brewery import charts
+from brewery.projection import (breakeven_revenue, fixed_expense_breakdown, horizon_label, month_labels,
+                                partner_returns, project_cashflow, revenue_forecast)
+
+# Cashflow table columns in the PDF, the month shown by its calendar date
+CASHFLOW_COLUMNS = ('Date', 'Revenue', 'Expenses', 'Profit', 'Cumulative Cashflow')
+
+# Partner ROI table columns in the PDF
+RETURNS_COLUMNS = ('Partner', 'Initial Investment', 'Cash Distributions', 'Ownership Value', 'Cash ROI %', 'MOIC',
+                   'IRR %')
+
+
+def report_key(*inputs):
+    """Stable hash of the inputs a report is built from"""
+    return hashlib.sha256(repr(inputs).encode()).hexdigest()
+
+
+def _table(rows, header, col_widths=None):
+    """Styled reportlab table"""
+    table = Table([header] + rows, colWidths=col_widths, repeatRows=1)
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#B8860B')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#FAF3E0')]),
+        ('GRID', (0, 0), (-1, -1), 0.25, colors.grey),
+    ]))
+    return table
+
+
+def _chart(fig):
+    """Render a Plotly figure to a PNG flowable; None when static export is unavailable"""
+    try:
+        png = fig.to_image(format='png', width=900, height=450)
+    except Exception:
+        # Static export needs kaleido and a Chrome install on the server
+        return None
+    return Image(io.BytesIO(png), width=7 * inch, height=3.5 * inch)
+
+
+def build_pdf(startup, assumptions, partnership, mix, forecast_growth_pct, forecast_months=12,
+              progress=None):
+    """Render the financial report and return it as PDF bytes
+
+    ``progress`` is called with a fraction in [0, 1] and a status message.
+    """
+    progress = progress or (lambda fraction, message: None)
+    styles = getSampleStyleSheet()
+    money = "${:,.0f}".format
+
+    progress(0.05, "Computing projections...")
+    projection = project_cashflow(assumptions)
+    cashflow_df = projection.to_frame(month_labels(assumptions.calendar, assumptions.months))
+    returns_df = partner_returns(projection, partnership, assumptions.equity)
+    forecast_df = revenue_forecast(mix, forecast_growth_pct, forecast_months, assumptions.growth_decay,
+                                   assumptions.calendar)
+    breakeven = projection.breakeven_month
+    monthly_breakeven = breakeven_revenue(assumptions.total_monthly_fixed, assumptions.variable_cost_pct)
+
+    story = [
+        Paragraph("Charlotte-Concord Micro Brewery Financial Report", styles['Title']),
+        Paragraph(f"Generated {datetime.now():%B %d, %Y %I:%M %p}", styles['Normal']),
+        Spacer(1, 0.2 * inch),
+        Paragraph("Key Metrics", styles['Heading2']),
+        _table([
+            ["Initial Capital Required", money(startup.total)],
+            *([["Loans", money(assumptions.debt)], ["Partner Equity", money(assumptions.equity)]]
+              if assumptions.loans else []),
+            *([["Minimum Annual DSCR", f"{projection.min_dscr:.2f}x"]] if projection.min_dscr is not None else []),
+            ["Monthly Fixed Costs", money(assumptions.total_monthly_fixed)],
+            ["Variable Costs", f"{assumptions.variable_cost_pct:.1f}% of revenue"],
+            ["Breakeven Revenue", f"{money(monthly_breakeven)}/mo"],
+            ["Breakeven Month", f"Month {breakeven}" if breakeven else f"After Month {assumptions.months}"],
+            [f"{assumptions.months}-Month Total Profit", money(projection.profit.sum())],
+            ["Estimated Business Value", money(returns_df['Ownership Value'].sum())],
+        ], ["Metric", "Value"], [3.5 * inch, 2 * inch]),
+    ]
+
+    figures = [
+        charts.cumulative_cashflow_chart(cashflow_df, breakeven),
+        charts.revenue_forecast_chart(forecast_df),
+        charts.partner_returns_chart(returns_df, horizon_label(assumptions.months)),
+        charts.fixed_expense_pie(fixed_expense_breakdown(assumptions)),
+    ]
+    story += [PageBreak(), Paragraph("Charts", styles['Heading2'])]
+    for i, fig in enumerate(figures):
+        progress(0.1 + 0.6 * i / len(figures), f"Rendering chart {i + 1} of {len(figures)}...")
+        image = _chart(fig)
+        if image is None:
+            story.append(Paragraph("<i>Charts unavailable: static image export (kaleido with "
+                                   "Chrome) is not available on this server.</i>", styles['Normal']))
+            break
+        story += [image, Spacer(1, 0.1 * inch)]
+
+    progress(0.75, "Building tables...")
+    story += [
+        PageBreak(),
+        Paragraph(f"{assumptions.months}-Month Cashflow", styles['Heading2']),
+        _table([[month, money(revenue), money(expenses), money(profit), money(cumulative)]
+                for month, revenue, expenses, profit, cumulative
+                in cashflow_df[list(CASHFLOW_COLUMNS)].itertuples(index=False, name=None)],
+               ["Month", "Revenue", "Expenses", "Profit", "Cumulative Cashflow"]),
+        Spacer(1, 0.2 * inch),
+        Paragraph("Partner ROI", styles['Heading2']),
+        _table([[partner, f"{pct:.2f}%", money(investment), money(distributions), money(equity),
+                 f"{roi:.1f}%", f"{multiple:.2f}x", "n/a" if math.isnan(irr) else f"{irr:.1f}%"]
+                for (partner, investment, distributions, equity, roi, multiple, irr), pct
+                in zip(returns_df[list(RETURNS_COLUMNS)].itertuples(index=False, name=None),
+                       partnership.partner_pcts)],
+               ["Partner", "Ownership", "Investment", "Cash Distributions", "Equity Value", "Cash ROI",
+                "MOIC", "IRR"]),
+    ]
+
+    progress(0.9, "Writing PDF...")
+    buffer = io.BytesIO()
+    SimpleDocTemplate(buffer, pagesize=letter, title="Brewery Financial Report").build(story)
+    progress(1.0, "Done")
+    return buffer.getvalue()
+
+
+class ReportService:
+    """Background report renderer with an input-hash keyed LRU of finished PDFs"""
+
+    def __init__(self, workers=2, max_reports=32):
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pdf-report")
+        self._lock = threading.Lock()
+        self._done = OrderedDict()
+        self._jobs = {}
+        self._max_reports = max_reports
+
+    def submit(self, *inputs):
+        """Start rendering a report unless it is cached or already running; returns its key"""
+        key = report_key(*inputs)
+        with self._lock:
+            if key in self._done:
+                self._done.move_to_end(key)
+            elif key not in self._jobs or self._jobs[key]['error']:
+                self._jobs[key] = {'progress': 0.0, 'message': "Queued...", 'error': None}
+                self._pool.submit(self._render, key, inputs)
+        return key
+
+    def status(self, key):
+        """``(progress, message, pdf_bytes or None, error or None)`` for a report"""
+        with self._lock:
+            if key in self._done:
+                return 1.0, "Done", self._done[key], None
+            job = self._jobs.get(key)
+            if job is None:
+                return 0.0, "Not started", None, None
+            return job['progress'], job['message'], None, job['error']
+
+    def _render(self, key, inputs):
+        with self._lock:
+            job = self._jobs[key]
+
+        def progress(fraction, message):
+            job['progress'], job['message'] = fraction, message
+
+        try:
+            pdf = build_pdf(*inputs, progress=progress)
+        except Exception as exc:
+            job['error'] = str(exc)
+            return
+        with self._lock:
+            self._done[key] = pdf
+            while len(self._done) > self._max_reports:
+                self._done.popitem(last=False)
+            del self._jobs[key]
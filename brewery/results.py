@@ -0,0 +1,158 @@
+"""Columnar store for sweep and simulation results, shared by every session
+
+Each run is a directory named by a run ID hashed from everything that produced
+it, so partners asking for the same results get the same run:
+
+    results/<run id>/meta.json       what the run is, plus its scalar results
+    results/<run id>/<column>.npy    one array per column
+
+Columns are written in place as batches finish and read back memory-mapped.
+A page charting one metric touches only that column's file, and only the rows
+it slices, and every session reading a run shares the operating system's one
+cached copy. A run is written under a temporary name and renamed into place
+once complete, so readers never see half a run. When the store outgrows
+``MAX_BYTES`` the least recently opened runs are removed.
+"""
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from dataclasses import asdict, is_dataclass
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+DEFAULT_PATH = os.environ.get("BREWERY_RESULTS", "results")
+
+# Disk budget for completed runs before the least recently opened are pruned
+MAX_BYTES = 2 * 1024 ** 3
+
+# Unfinished runs older than this were abandoned by an interrupted rerun
+STALE_SECONDS = 3600
+
+
+def run_id(kind, *inputs):
+    """Stable ID for the ``kind`` of results computed from ``inputs``, dataclasses or plain values"""
+    payload = json.dumps([kind, [asdict(item) if is_dataclass(item) else item for item in inputs]],
+                         sort_keys=True, default=str)
+    return f"{kind}-{hashlib.sha256(payload.encode()).hexdigest()[:20]}"
+
+
+class Run:
+    """One completed result set: its metadata and a read-only memory map per column"""
+
+    def __init__(self, run_id, meta, columns):
+        self.run_id = run_id
+        self.meta = meta
+        self.columns = columns
+
+    def __getitem__(self, name):
+        """One column's memory map"""
+        return self.columns[name]
+
+
+class RunWriter:
+    """A run being filled in; its columns are writable memory maps until ``commit``"""
+
+    def __init__(self, store, run_id, path, meta, columns):
+        self.store = store
+        self.run_id = run_id
+        self.path = path
+        self.meta = meta
+        self.columns = columns
+
+    def commit(self, **meta):
+        """Publish the run with any final ``meta`` and return it opened for reading"""
+        for column in self.columns.values():
+            column.flush()
+        self.meta.update(meta, columns=list(self.columns), created=datetime.now().isoformat(timespec='seconds'))
+        (self.path / 'meta.json').write_text(json.dumps(self.meta))
+        self.columns = {}
+        try:
+            self.path.rename(self.store.path / self.run_id)
+        except OSError:
+            # Another session finished the same run first; its results are the same
+            shutil.rmtree(self.path, ignore_errors=True)
+        self.store.prune()
+        return self.store.open(self.run_id)
+
+    def discard(self):
+        """Drop the unfinished run"""
+        self.columns = {}
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+class ResultStore:
+    """Completed runs on local disk, keyed by run ID"""
+
+    def __init__(self, path=DEFAULT_PATH, max_bytes=MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def open(self, run_id):
+        """Completed run ``run_id`` with its columns memory-mapped read-only, or None"""
+        folder = self.path / run_id
+        try:
+            meta = json.loads((folder / 'meta.json').read_text())
+            columns = {name: np.load(folder / f"{name}.npy", mmap_mode='r') for name in meta['columns']}
+            # Opening counts as use, so runs being looked at are pruned last
+            os.utime(folder)
+        except FileNotFoundError:
+            return None
+        return Run(run_id, meta, columns)
+
+    def create(self, run_id, columns, meta=None):
+        """Writable run; ``columns`` maps each name to ``(shape, dtype, fill value)``"""
+        folder = self.path / f".{run_id}-{uuid.uuid4().hex[:8]}"
+        folder.mkdir()
+        arrays = {}
+        for name, (shape, dtype, fill) in columns.items():
+            arrays[name] = np.lib.format.open_memmap(folder / f"{name}.npy", mode='w+', dtype=dtype, shape=shape)
+            arrays[name][...] = fill
+        return RunWriter(self, run_id, folder, dict(meta or {}), arrays)
+
+    def put(self, run_id, arrays, meta=None):
+        """Store finished ``{name: array}`` as one run and return it opened for reading"""
+        arrays = {name: np.asarray(values) for name, values in arrays.items()}
+        writer = self.create(run_id, {name: (values.shape, values.dtype, 0) for name, values in arrays.items()},
+                             meta)
+        for name, values in arrays.items():
+            writer.columns[name][...] = values
+        return writer.commit()
+
+    def runs(self):
+        """``(run id, bytes on disk, last opened)`` for every completed run, most recently opened first"""
+        runs = []
+        for folder in self.path.iterdir():
+            if folder.name.startswith('.') or not folder.is_dir():
+                continue
+            try:
+                size = sum(path.stat().st_size for path in folder.iterdir())
+                runs.append((folder.name, size, datetime.fromtimestamp(folder.stat().st_mtime)))
+            except FileNotFoundError:
+                continue    # pruned by another session meanwhile
+        return sorted(runs, key=lambda run: run[2], reverse=True)
+
+    def delete(self, run_id):
+        """Remove a completed run; sessions still reading it keep their mapped copy"""
+        shutil.rmtree(self.path / run_id, ignore_errors=True)
+
+    def prune(self):
+        """Remove the least recently opened runs past ``max_bytes`` and abandoned unfinished ones"""
+        total = 0
+        # The most recently opened run is kept even when it alone is over budget
+        for i, (name, size, _) in enumerate(self.runs()):
+            total += size
+            if total > self.max_bytes and i > 0:
+                self.delete(name)
+        cutoff = time.time() - STALE_SECONDS
+        for folder in self.path.glob('.*'):
+            try:
+                if folder.is_dir() and folder.stat().st_mtime < cutoff:
+                    shutil.rmtree(folder, ignore_errors=True)
+            except FileNotFoundError:
+                continue
@@ -0,0 +1,67 @@
+"""Per-session scenario state shared by main.py and the page modules
+
+Kept free of NumPy, pandas and Plotly so the login screen and sidebar can be
+drawn before any page module (and its heavy imports) is loaded.
+"""
+from dataclasses import replace
+
+import streamlit as st
+
+from brewery.assumptions import Scenario
+from brewery.instrument import History
+from brewery.model import ModelGraph
+from brewery.store import ScenarioStore
+
+
+@st.cache_resource
+def scenario_store():
+    """Saved-scenario database shared by every session on this server"""
+    return ScenarioStore()
+
+
+@st.cache_resource
+def timing_history():
+    """Recent rerun timings from every session, for the admin timing panel"""
+    return History()
+
+
+def init_scenario():
+    """Start the session on the default scenario"""
+    if 'data_initialized' not in st.session_state:
+        st.session_state.data_initialized = True
+        # Default values based on research
+        st.session_state.scenario = Scenario()
+        st.session_state.scenario_revision = 0
+    return st.session_state.scenario
+
+
+def reset_scenario(scenario):
+    """Make ``scenario`` current and reset every input widget to its values"""
+    st.session_state.scenario = scenario
+    st.session_state.scenario_revision += 1
+
+
+def load_scenario(name, scenario):
+    """Make a saved scenario current under its saved name"""
+    reset_scenario(scenario)
+    st.session_state.scenario_name = name
+
+
+def scenario_key(name):
+    """Widget key that starts fresh from the scenario values whenever one is loaded"""
+    return f"{name}_{st.session_state.scenario_revision}"
+
+
+def update_scenario(**changes):
+    """Replace parts of the current scenario with edited values"""
+    st.session_state.scenario = replace(st.session_state.scenario, **changes)
+    return st.session_state.scenario
+
+
+def model():
+    """Model graph for the current scenario, recomputing only what the latest edits reach"""
+    if 'model_graph' not in st.session_state:
+        # Imported here so the login screen never loads the NumPy-backed caches
+        from brewery.cache import cached_cashflow
+        st.session_state.model_graph = ModelGraph(st.session_state.scenario, project=cached_cashflow)
+    return st.session_state.model_graph.update(st.session_state.scenario)
@@ -0,0 +1,67 @@
+"""Breakeven and goal-seek solvers over the projection model
+
+``solve_input`` answers inverse questions such as "what starting revenue breaks
+even by month 18?" with a vectorized bisection. Every iteration is one batched
+model evaluation, so solving for thousands of scenarios at once (sweeps, Monte
+Carlo draws) costs the same number of passes as solving for one.
+"""
+import numpy as np
+
+from brewery.sweep import evaluate
+
+# Default search brackets for the inputs most often solved for
+SEARCH_BOUNDS = {
+    'starting_monthly_revenue': (0.0, 500000.0),
+    'monthly_revenue_growth': (0.0, 30.0),
+    'pint_price': (0.5, 30.0),
+    'monthly_rent': (0.0, 50000.0),
+    'monthly_payroll': (0.0, 200000.0),
+    'initial_capital': (0.0, 5000000.0),
+}
+
+# Metrics that improve as they get smaller; all others improve as they grow
+LOWER_IS_BETTER = {'breakeven_month'}
+
+
+def _metric(assumptions, mix, profit_distribution_pct, overrides, metric):
+    """Evaluate a metric, counting 'never breaks even' as one month past the horizon"""
+    values = evaluate(assumptions, mix, profit_distribution_pct, overrides)[metric]
+    if metric == 'breakeven_month':
+        values = np.nan_to_num(values, nan=assumptions.months + 1)
+    return values
+
+
+def solve_input(assumptions, mix, profit_distribution_pct, name, target,
+                metric='breakeven_month', bounds=None, overrides=None, iterations=48):
+    """Value of input ``name`` at which ``metric`` just reaches ``target``
+
+    The metric must be monotonic in the input over ``bounds``. Returns the value on
+    the side that meets the target (e.g. the lowest starting revenue that breaks
+    even by the target month, or the highest rent that still does). NaN marks
+    scenarios where the target is met across the whole bracket or nowhere in it.
+    ``target`` and ``overrides`` may be arrays to solve many scenarios at once.
+    """
+    low, high = bounds or SEARCH_BOUNDS.get(name, (0.0, 10 * getattr(assumptions, name, 1.0)))
+    overrides = dict(overrides or {})
+    target = np.asarray(target, dtype=float)
+
+    def meets(value):
+        values = _metric(assumptions, mix, profit_distribution_pct, {**overrides, name: value}, metric)
+        return values <= target if metric in LOWER_IS_BETTER else values >= target
+
+    shape = np.broadcast_shapes(target.shape, *(np.shape(v) for v in overrides.values()))
+    lo = np.full(shape, float(low))
+    hi = np.full(shape, float(high))
+    meets_lo, meets_hi = meets(lo), meets(hi)
+    bracketed = meets_lo != meets_hi
+
+    # Keep ``lo`` on the failing side and ``hi`` on the meeting side
+    lo, hi = np.where(meets_lo, hi, lo), np.where(meets_lo, lo, hi)
+    for _ in range(iterations):
+        mid = (lo + hi) / 2
+        ok = meets(mid)
+        hi = np.where(ok, mid, hi)
+        lo = np.where(ok, lo, mid)
+
+    solution = np.where(bracketed, hi, np.nan)
+    return float(solution) if solution.ndim == 0 else solution
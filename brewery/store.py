@@ -0,0 +1,94 @@
+"""SQLite persistence for named scenarios
+
+Each row holds one user's named scenario as a JSON payload. A unique index on
+``(username, name)`` makes save an upsert and load a single indexed lookup,
+and a second index on ``(username, updated_at)`` serves the most-recent-first
+listing without a table scan. WAL journaling lets partners save concurrently.
+"""
+import json
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import datetime
+
+from brewery.assumptions import Scenario
+
+DEFAULT_PATH = os.environ.get("BREWERY_DB", "scenarios.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scenarios (
+    id INTEGER PRIMARY KEY,
+    username TEXT NOT NULL,
+    name TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    UNIQUE (username, name)
+);
+CREATE INDEX IF NOT EXISTS idx_scenarios_user_updated ON scenarios (username, updated_at DESC);
+"""
+
+
+class ScenarioStore:
+    """Named scenarios per user in a local SQLite database"""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self):
+        """Connection for the calling thread (Streamlit runs each session on its own thread)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def save(self, username, name, scenario):
+        """Insert or overwrite a named scenario"""
+        payload = json.dumps(scenario.to_dict())
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO scenarios (username, name, payload, updated_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (username, name) DO UPDATE SET payload = excluded.payload, "
+                "updated_at = excluded.updated_at",
+                (username, name, payload, datetime.now().isoformat(timespec='seconds'))
+            )
+
+    def load(self, username, name):
+        """Scenario saved under ``name``, or None"""
+        with closing(self._connect().execute(
+            "SELECT payload FROM scenarios WHERE username = ? AND name = ?", (username, name)
+        )) as cursor:
+            row = cursor.fetchone()
+        return Scenario.from_dict(json.loads(row[0])) if row else None
+
+    def load_many(self, username, names):
+        """``{name: Scenario}`` for every saved name in ``names``, fetched in one query"""
+        names = list(names)
+        if not names:
+            return {}
+        placeholders = ", ".join("?" * len(names))
+        with closing(self._connect().execute(
+            f"SELECT name, payload FROM scenarios WHERE username = ? AND name IN ({placeholders})",
+            (username, *names)
+        )) as cursor:
+            found = {name: Scenario.from_dict(json.loads(payload)) for name, payload in cursor}
+        return {name: found[name] for name in names if name in found}
+
+    def list(self, username):
+        """``(name, updated_at)`` for a user's scenarios, most recently saved first"""
+        with closing(self._connect().execute(
+            "SELECT name, updated_at FROM scenarios WHERE username = ? ORDER BY updated_at DESC",
+            (username,)
+        )) as cursor:
+            return cursor.fetchall()
+
+    def delete(self, username, name):
+        """Remove a saved scenario"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM scenarios WHERE username = ? AND name = ?", (username, name))
@@ -0,0 +1,259 @@
+"""Scenario sweep engine: evaluate a Cartesian grid of model inputs
+
+The grid is never materialised as Python objects. Each batch is a contiguous
+range of flat grid indices that a worker unravels into input arrays and pushes
+through the projection kernel in one vectorized pass, so only the four summary
+metrics per combination travel back from the process pool. Results can be
+written straight into the shared result store and read back memory-mapped.
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, fields, replace
+
+import numpy as np
+import pandas as pd
+
+from brewery.assumptions import Assumptions, ProductMix
+from brewery.projection import (VALUATION_MULTIPLE, breakeven_month, cashflow_arrays, debt_arrays,
+                                revenue_multipliers)
+from brewery.results import run_id
+from brewery.returns import annual_irr, distribution_schedule, equity_flows
+
+# Inputs that can be swept, with their display labels
+SWEEPABLE = {
+    'pint_price': "Pint Price ($)",
+    'flight_price': "Flight Price ($)",
+    'growler_price': "Growler Fill Price ($)",
+    'keg_price': "Keg Price ($)",
+    'case_price': "Case Price ($)",
+    'pint_cogs': "Cost per Pint ($)",
+    'keg_cogs': "Cost per Keg ($)",
+    'monthly_pints': "Pints Sold / Month",
+    'monthly_kegs': "Kegs Sold / Month",
+    'monthly_cases': "Cases Sold / Month",
+    'initial_capital': "Initial Capital ($)",
+    'monthly_rent': "Monthly Rent ($)",
+    'monthly_payroll': "Monthly Payroll ($)",
+    'monthly_marketing': "Monthly Marketing ($)",
+    'starting_monthly_revenue': "Starting Monthly Revenue ($)",
+    'monthly_revenue_growth': "Monthly Revenue Growth (%)",
+    'variable_cost_pct': "Variable Costs (% of Revenue)",
+}
+
+# Summary metrics produced for every grid point
+METRICS = {
+    'breakeven_month': "Breakeven Month",
+    'total_profit': "Total Profit ($)",
+    'partner_roi': "Partner Cash ROI (%)",
+    'equity_irr': "Equity IRR (%)",
+}
+
+BATCH_SIZE = 50000
+
+# Largest grid a sweep may evaluate: 32 bytes of metrics per point, so 320 MB in the result store
+MAX_SWEEP_POINTS = 10_000_000
+
+_MIX_FIELDS = {f.name for f in fields(ProductMix)}
+
+
+@dataclass(frozen=True)
+class SweepAxis:
+    """One swept input and the values it takes"""
+    name: str
+    values: tuple
+
+    @classmethod
+    def linspace(cls, name, low, high, steps):
+        """Evenly spaced values between ``low`` and ``high``"""
+        if name not in SWEEPABLE:
+            raise ValueError(f"Unknown sweep input: {name}")
+        return cls(name, tuple(np.linspace(low, high, int(steps)).tolist()))
+
+
+@dataclass(frozen=True)
+class SweepSpec:
+    """Base scenario plus the axes of the grid to evaluate around it"""
+    assumptions: Assumptions
+    mix: ProductMix
+    profit_distribution_pct: float
+    axes: tuple
+
+    @property
+    def shape(self):
+        """Grid shape, one dimension per axis"""
+        return tuple(len(axis.values) for axis in self.axes)
+
+    @property
+    def size(self):
+        """Number of grid points"""
+        return int(np.prod(self.shape))
+
+
+def evaluate(assumptions, mix, profit_distribution_pct, overrides):
+    """Summary metrics for arrays of overridden inputs, broadcast together
+
+    Product-mix inputs act relative to the base mix: starting revenue scales with
+    the mix revenue and variable cost % shifts with the mix COGS ratio, so the
+    sweep stays anchored to the cashflow assumptions the pages use. The base
+    loans are kept at every point, so a swept initial capital changes the
+    partners' equity.
+    """
+    a = asdict(assumptions)
+    a.update({k: v for k, v in overrides.items() if k not in _MIX_FIELDS})
+    start = np.asarray(a['starting_monthly_revenue'], dtype=float)
+    variable_pct = np.asarray(a['variable_cost_pct'], dtype=float)
+
+    mix_overrides = {k: v for k, v in overrides.items() if k in _MIX_FIELDS}
+    if mix_overrides and mix.total_revenue > 0:
+        swept = replace(mix, **mix_overrides)
+        revenue = swept.total_revenue
+        start = start * revenue / mix.total_revenue
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cogs_ratio = np.where(revenue > 0, swept.beer_cogs / revenue, 0.0)
+        variable_pct = variable_pct + (cogs_ratio - mix.beer_cogs / mix.total_revenue) * 100
+
+    total_fixed = (a['monthly_rent'] + a['monthly_payroll'] + a['monthly_insurance'] +
+                   a['monthly_utilities'] + a['monthly_marketing'] + a['monthly_other'])
+    interest, repaid = debt_arrays(assumptions)
+    revenue, _, profit, cumulative = cashflow_arrays(
+        start, a['monthly_revenue_growth'], total_fixed, a['initial_capital'], variable_pct,
+        assumptions.months, assumptions.growth_decay,
+        revenue_multipliers(assumptions), interest, repaid, assumptions.debt
+    )
+
+    total_profit = profit.sum(axis=-1)
+    # Paid out above the high-water mark of cash after debt service, as the Investor Analysis page does
+    distributed = distribution_schedule(profit - repaid, profit_distribution_pct).sum(axis=-1)
+    equity = np.maximum(np.asarray(a['initial_capital'], dtype=float) - assumptions.debt, 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        roi = np.where(equity > 0, (distributed / equity - 1) * 100, 0.0)
+    # Every IRR in the batch is solved together
+    value = revenue[..., -12:].sum(axis=-1) * VALUATION_MULTIPLE - (assumptions.debt - repaid.sum())
+    irr = annual_irr(equity_flows(profit - repaid, profit_distribution_pct, equity, value))
+    breakeven = breakeven_month(cumulative).astype(float)
+    breakeven[breakeven == 0] = np.nan
+    return {'breakeven_month': breakeven, 'total_profit': total_profit, 'partner_roi': roi, 'equity_irr': irr}
+
+
+def evaluate_range(spec, start, stop):
+    """Evaluate flat grid indices ``[start, stop)`` of a sweep"""
+    coords = np.unravel_index(np.arange(start, stop), spec.shape)
+    overrides = {axis.name: np.asarray(axis.values)[idx] for axis, idx in zip(spec.axes, coords)}
+    return start, stop, evaluate(spec.assumptions, spec.mix, spec.profit_distribution_pct, overrides)
+
+
+def iter_sweep(spec, batch_size=BATCH_SIZE, jobs=None):
+    """Yield ``(start, stop, metrics)`` for each batch as soon as it completes"""
+    batches = [(i, min(i + batch_size, spec.size)) for i in range(0, spec.size, batch_size)]
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(batches) == 1:
+        for start, stop in batches:
+            yield evaluate_range(spec, start, stop)
+        return
+
+    # Spawned workers only import brewery.sweep, never the Streamlit script or server
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(jobs, len(batches)), mp_context=context) as pool:
+        futures = [pool.submit(evaluate_range, spec, start, stop) for start, stop in batches]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+class SweepResult:
+    """Metric arrays for a sweep grid, filled in as batches arrive
+
+    ``metrics`` may be memory-mapped columns from the result store; without
+    them the arrays are held in memory.
+    """
+
+    def __init__(self, spec, metrics=None, completed=0):
+        self.spec = spec
+        self.metrics = metrics if metrics is not None else {name: np.full(spec.size, np.nan) for name in METRICS}
+        self.completed = completed
+
+    def add(self, start, stop, metrics):
+        """Store one evaluated batch"""
+        for name, values in metrics.items():
+            self.metrics[name][start:stop] = values
+        self.completed += stop - start
+
+    def grid(self, metric):
+        """Metric reshaped to the grid, one dimension per axis"""
+        return self.metrics[metric].reshape(self.spec.shape)
+
+    def pivot(self, metric, x_axis, y_axis):
+        """Mean of a metric over every axis except ``x_axis`` and ``y_axis``"""
+        names = [axis.name for axis in self.spec.axes]
+        x, y = names.index(x_axis), names.index(y_axis)
+        others = tuple(i for i in range(len(names)) if i not in (x, y))
+        grid = self.grid(metric)
+        with np.errstate(all='ignore'):
+            counts = np.sum(~np.isnan(grid), axis=others)
+            means = np.nansum(grid, axis=others) / counts
+        # Rows follow the y axis, columns the x axis
+        return means.T if x < y else means
+
+    def to_frame(self):
+        """One row per grid point with swept inputs and metrics"""
+        coords = np.unravel_index(np.arange(self.spec.size), self.spec.shape)
+        data = {axis.name: np.asarray(axis.values)[idx] for axis, idx in zip(self.spec.axes, coords)}
+        data.update(self.metrics)
+        return pd.DataFrame(data)
+
+
+def _check_size(spec):
+    """Raise ValueError if the grid is past ``MAX_SWEEP_POINTS``"""
+    if spec.size > MAX_SWEEP_POINTS:
+        raise ValueError(f"Sweep grid has {spec.size:,} combinations; the limit is {MAX_SWEEP_POINTS:,}")
+
+
+def run_sweep(spec, batch_size=BATCH_SIZE, jobs=None):
+    """Evaluate a whole sweep grid"""
+    _check_size(spec)
+    result = SweepResult(spec)
+    for start, stop, metrics in iter_sweep(spec, batch_size, jobs):
+        result.add(start, stop, metrics)
+    return result
+
+
+def open_sweep(store, spec):
+    """Completed sweep for ``spec`` from the result store, its metrics memory-mapped, or None"""
+    run = store.open(run_id('sweep', spec))
+    return None if run is None else SweepResult(spec, run.columns, spec.size)
+
+
+def create_sweep(store, spec):
+    """Writable store run for ``spec`` and a result whose metrics fill it in place; commit the run when done"""
+    _check_size(spec)
+    run = store.create(run_id('sweep', spec), {name: ((spec.size,), np.float64, np.nan) for name in METRICS},
+                       {'kind': 'sweep', 'shape': spec.shape, 'axes': [axis.name for axis in spec.axes]})
+    return run, SweepResult(spec, run.columns)
+
+
+def tornado(assumptions, mix, profit_distribution_pct, ranges, metric='total_profit'):
+    """One-at-a-time sensitivity of a metric to each input's low and high value
+
+    ``ranges`` maps input names to ``(low, high)``. Never breaking even within
+    the horizon counts as one month past it.
+    """
+    names = list(ranges)
+    k = len(names)
+    overrides = {}
+    for i, name in enumerate(names):
+        values = np.full(2 * k, getattr(mix if name in _MIX_FIELDS else assumptions, name), dtype=float)
+        values[2 * i:2 * i + 2] = ranges[name]
+        overrides[name] = values
+    values = evaluate(assumptions, mix, profit_distribution_pct, overrides)[metric]
+    base = evaluate(assumptions, mix, profit_distribution_pct, {})[metric]
+    if metric == 'breakeven_month':
+        values = np.nan_to_num(values, nan=assumptions.months + 1)
+        base = np.nan_to_num(base, nan=assumptions.months + 1)
+    frame = pd.DataFrame({
+        'Input': [SWEEPABLE[name] for name in names],
+        'Low': values[0::2],
+        'High': values[1::2],
+    })
+    frame['Base'] = float(base)
+    frame['Swing'] = (frame['High'] - frame['Low']).abs()
+    return frame.sort_values('Swing')